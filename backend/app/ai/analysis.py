@@ -0,0 +1,70 @@
+from functools import cached_property
+from typing import Optional
+from .preprocess import (
+    preprocess_text,
+    tokenize,
+    clean_text_for_comparison,
+    extract_comparison_keywords,
+)
+from .keywords import scan_keywords
+
+class AnalyzedText:
+    """
+    Complaint text analyzed once and shared by triage and duplicate detection
+    
+    Every field is computed lazily on first access and cached, so each
+    consumer reuses the same normalized string, tokens and keyword hits
+    instead of re-cleaning the raw text.
+    """
+    
+    _TRIAGE_FIELDS = ("normalized", "tokens", "keyword_hits")
+    
+    def __init__(self, text: str, translated_text: Optional[str] = None, language: Optional[str] = None):
+        self.text = text or ""
+        self.translated_text = self.text if translated_text is None else translated_text
+        self.language = language
+        # (category, confidence) decided before the English classifier, e.g. by the multilingual model
+        self.prediction = None
+        # Cascade tier that decided the category ("ml" or "translation") when analysis already knows it
+        self.tier = None
+        # Set by AITriageEngine.analyze once language detection and translation are done
+        self.ready = False
+        # (text, detected language, multilingual prediction) while the caller translates (analyze(translate=False))
+        self.pending_translation = None
+    
+    def set_translation(self, translated_text: str, language: str) -> None:
+        """Record the English text used for triage, dropping stale triage fields"""
+        if translated_text != self.translated_text:
+            for field in self._TRIAGE_FIELDS:
+                self.__dict__.pop(field, None)
+        self.translated_text = translated_text
+        self.language = language
+    
+    # ==================== TRIAGE FIELDS ====================
+    
+    @cached_property
+    def normalized(self) -> str:
+        """Normalized (translated) text fed to the classifier"""
+        return preprocess_text(self.translated_text)
+    
+    @cached_property
+    def tokens(self) -> list:
+        """Word tokens of the normalized text"""
+        return tokenize(self.normalized)
+    
+    @cached_property
+    def keyword_hits(self) -> frozenset:
+        """Category and urgency keywords found in the normalized text"""
+        return scan_keywords(self.normalized)
+    
+    # ==================== DEDUP FIELDS ====================
+    
+    @cached_property
+    def dedup_text(self) -> str:
+        """Original text cleaned for duplicate comparison"""
+        return clean_text_for_comparison(self.text)
+    
+    @cached_property
+    def dedup_keywords(self) -> set:
+        """Significant words used for keyword overlap"""
+        return extract_comparison_keywords(self.dedup_text)
@@ -0,0 +1,403 @@
+"""
+Compact model artifact
+
+The joblib artifacts are unpickled separately by every worker, and loading them
+imports scikit-learn. The compact format stores the same TF-IDF + linear
+model as plain .npy arrays that are opened with mmap_mode="r", so workers on
+one host share the pages through the OS page cache:
+
+    manifest.json      feature settings, weight layout and file list
+    vocab_blob.npy     string table: the n-grams in sorted order, UTF-8, "\\n"-separated (uint8)
+    idf.npy            idf weights (float32)
+    coef*.npy          class weights (float32): coef.npy dense (classes x features),
+                       or coef_data/coef_indices/coef_indptr.npy as feature-major CSR
+    intercept.npy      class intercepts (float32)
+    labels.npy         category names in row order
+
+Feature columns follow the sorted n-grams, so no term -> column map is stored.
+At load every process hashes the string table once into a sorted int64 array
+and matches n-grams by hash (a false match needs a 64-bit hash collision).
+
+Export compresses the weights. Softmax is unchanged by adding the same
+amount to every class score, so each feature's weights are first shifted to
+make their lower median zero; weights below a threshold are then pruned, the
+threshold being the largest that keeps predict_proba on the sample texts
+within max_error. The threshold is then checked on held-out texts it was not
+picked on; if they move by more than max_error or change a prediction,
+nothing is pruned. CSR is used when it is smaller than the dense matrix.
+
+Format 1 artifacts (fixed-width unicode vocab_terms + vocab_index, dense
+coef) still load.
+"""
+import json
+import logging
+import os
+from typing import List, Optional
+
+import numpy as np
+from scipy import sparse
+
+from .preprocess import TOKEN_PATTERN, char_wb_ngrams, tokenize, word_ngrams
+
+logger = logging.getLogger(__name__)
+
+COMPACT_DIR = "compact"
+MANIFEST_FILE = "manifest.json"
+FORMAT_NAME = "tfidf_lr_compact"
+FORMAT_VERSION = 2
+SUPPORTED_VERSIONS = (1, 2)
+
+# Largest predict_proba change pruning may cause on the sample texts
+PRUNE_MAX_ERROR = 1e-3
+PRUNE_QUANTILES = (0.95, 0.9, 0.85, 0.8, 0.75, 0.7, 0.6, 0.5, 0.4, 0.3, 0.2)
+
+
+def compact_supported(vectorizer) -> bool:
+    """
+    Vocabulary-based word or char_wb analyzers only; hashing vectorizers have
+    no terms to store
+    """
+    if not hasattr(vectorizer, "vocabulary_") or vectorizer.preprocessor is not None:
+        return False
+    if vectorizer.analyzer == "char_wb":
+        # Accent stripping would drop Indic vowel signs; texts come pre-lowercased
+        return vectorizer.strip_accents is None
+    return (
+        vectorizer.analyzer == "word"
+        and vectorizer.tokenizer is None
+        and vectorizer.stop_words is None
+        and vectorizer.token_pattern == TOKEN_PATTERN.pattern
+    )
+
+
+def _proba_kind(model) -> str:
+    """How predict_proba turns decision scores into probabilities"""
+    if model.coef_.shape[0] == 1:
+        return "binary"
+    multi_class = getattr(model, "multi_class", "auto")
+    if multi_class == "ovr" or (multi_class == "auto" and model.solver == "liblinear"):
+        return "ovr"
+    return "softmax"
+
+
+def linear_weights(model) -> tuple:
+    """
+    (coef, intercept, proba kind) of a linear classifier
+
+    A temperature-calibrated classifier (CalibratedClassifierCV with
+    method="temperature", ensemble=False, e.g. around LinearSVC) is
+    softmax(beta * decision), so beta is folded into the weights.
+    """
+    if not hasattr(model, "calibrated_classifiers_"):
+        return model.coef_, model.intercept_, _proba_kind(model)
+
+    calibrated = model.calibrated_classifiers_
+    if len(calibrated) != 1 or calibrated[0].method != "temperature":
+        raise ValueError("Compact export needs CalibratedClassifierCV(method='temperature', ensemble=False)")
+    estimator = calibrated[0].estimator
+    if estimator.coef_.shape[0] == 1:
+        raise ValueError("Compact export of calibrated binary classifiers is not supported")
+    beta = float(calibrated[0].calibrators[0].beta_)
+    return estimator.coef_ * beta, estimator.intercept_ * beta, "softmax"
+
+
+def scores_to_proba(scores: np.ndarray, kind: str) -> np.ndarray:
+    """Class probabilities from decision scores, the way predict_proba computes them"""
+    if kind == "binary":
+        positive = 1.0 / (1.0 + np.exp(-scores[:, 0]))
+        return np.column_stack([1.0 - positive, positive])
+    if kind == "ovr":
+        proba = 1.0 / (1.0 + np.exp(-scores))
+        return proba / proba.sum(axis=1, keepdims=True)
+    scores = scores - scores.max(axis=1, keepdims=True)
+    np.exp(scores, scores)
+    return scores / scores.sum(axis=1, keepdims=True)
+
+
+def _within(coef: np.ndarray, intercept: np.ndarray, kind: str, X, expected: np.ndarray, max_error: float) -> bool:
+    """Whether weights keep predict_proba on X within max_error of expected, with the same predictions"""
+    proba = scores_to_proba(np.asarray(X @ coef.T) + intercept, kind)
+    return (proba.argmax(axis=1) == expected.argmax(axis=1)).all() and np.abs(proba - expected).max() <= max_error
+
+
+def _prune_weights(coef: np.ndarray, intercept: np.ndarray, kind: str, sample: Optional[tuple],
+                   held_out: Optional[tuple], max_error: float) -> tuple:
+    """
+    Centered (softmax only) and pruned float32 weights
+
+    Args:
+        sample: (X, expected predict_proba) the threshold is picked on
+        held_out: (X, expected predict_proba) the picked threshold must also pass
+
+    Returns:
+        tuple: (coef, pruning threshold; 0.0 when nothing was pruned)
+    """
+    if kind == "softmax":
+        # Lower median per feature becomes exactly zero; softmax output is unchanged
+        coef = coef - np.sort(coef, axis=0)[(coef.shape[0] - 1) // 2]
+    coef = coef.astype(np.float32)
+    if sample is None or max_error <= 0:
+        return coef, 0.0
+
+    magnitudes = np.abs(coef[coef != 0])
+    for quantile in PRUNE_QUANTILES:
+        threshold = float(np.quantile(magnitudes, quantile))
+        pruned = np.where(np.abs(coef) >= threshold, coef, 0).astype(np.float32)
+        if not _within(pruned, intercept, kind, *sample, max_error):
+            continue
+        if held_out is not None and not _within(pruned, intercept, kind, *held_out, max_error):
+            logger.warning(f"Pruning threshold {threshold:.2e} exceeds max_error on held-out texts; not pruning")
+            return coef, 0.0
+        return pruned, threshold
+    return coef, 0.0
+
+
+def export_compact_model(
+    vectorizer,
+    model,
+    label_encoder,
+    path: str,
+    model_version: str,
+    sample_texts: Optional[List[str]] = None,
+    max_error: float = PRUNE_MAX_ERROR,
+    check_texts: Optional[List[str]] = None
+) -> dict:
+    """
+    Write a fitted vectorizer/model/label encoder as a compact artifact
+
+    Args:
+        path: Output directory
+        model_version: Version string stored in the manifest
+        sample_texts: Preprocessed texts used to pick the pruning threshold and
+            check the export against sklearn (no pruning without them)
+        max_error: Largest predict_proba difference pruning may introduce
+        check_texts: Preprocessed held-out texts the picked threshold must also
+            keep within max_error (not used to pick it)
+
+    Returns:
+        dict: The written manifest
+    """
+    if not compact_supported(vectorizer):
+        raise ValueError("Compact export needs a plain word or char_wb TfidfVectorizer")
+    if vectorizer.norm not in ("l2", "l1", None):
+        raise ValueError(f"Unsupported vectorizer norm: {vectorizer.norm}")
+
+    terms = sorted(vectorizer.vocabulary_)
+    columns = np.array([vectorizer.vocabulary_[term] for term in terms], dtype=np.int64)
+    labels = np.array([str(label) for label in label_encoder.classes_[model.classes_]])
+    coef, intercept, proba_kind = linear_weights(model)
+    coef = np.asarray(coef)[:, columns]
+
+    def expected_proba(texts):
+        X = vectorizer.transform(texts)
+        return X[:, columns], model.predict_proba(X)
+
+    sample = expected_proba(sample_texts) if sample_texts else None
+    held_out = expected_proba(check_texts) if sample_texts and check_texts else None
+    coef, threshold = _prune_weights(coef, np.asarray(intercept), proba_kind, sample, held_out, max_error)
+
+    arrays = {
+        "vocab_blob": np.frombuffer("\n".join(terms).encode("utf-8"), dtype=np.uint8),
+        "idf": np.asarray(vectorizer.idf_[columns], dtype=np.float32),
+        "intercept": np.asarray(intercept, dtype=np.float32),
+        "labels": labels,
+    }
+    # Feature-major, so scoring gathers the weight rows of a document's n-grams
+    weights = sparse.csr_matrix(coef.T)
+    weight_arrays = {
+        "coef_data": weights.data.astype(np.float32),
+        "coef_indices": weights.indices.astype(np.int32),
+        "coef_indptr": weights.indptr.astype(np.int32),
+    }
+    if sum(array.nbytes for array in weight_arrays.values()) < coef.nbytes:
+        weights_layout = "csr"
+        arrays.update(weight_arrays)
+    else:
+        weights_layout = "dense"
+        arrays["coef"] = np.ascontiguousarray(coef, dtype=np.float32)
+
+    manifest = {
+        "format": FORMAT_NAME,
+        "format_version": FORMAT_VERSION,
+        "model_version": model_version,
+        "n_features": int(len(terms)),
+        "n_classes": int(len(labels)),
+        "analyzer": vectorizer.analyzer,
+        "ngram_range": list(vectorizer.ngram_range),
+        "sublinear_tf": bool(vectorizer.sublinear_tf),
+        "use_idf": bool(vectorizer.use_idf),
+        "norm": vectorizer.norm,
+        "proba": proba_kind,
+        "weights": weights_layout,
+        "nonzero_weights": int(weights.nnz),
+        "prune_threshold": threshold,
+        "files": {name: f"{name}.npy" for name in arrays},
+    }
+
+    os.makedirs(path, exist_ok=True)
+    for name in os.listdir(path):
+        if name.endswith(".npy"):
+            os.remove(os.path.join(path, name))  # Files of a previous export or format
+    for name, array in arrays.items():
+        np.save(os.path.join(path, manifest["files"][name]), array)
+    with open(os.path.join(path, MANIFEST_FILE), "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    if sample_texts:
+        compact = CompactModel.load(path)
+        texts, expected = list(sample_texts), sample[1]
+        if held_out is not None:
+            texts, expected = texts + list(check_texts), np.vstack([expected, held_out[1]])
+        actual = compact.predict_proba(compact.transform_texts(texts))
+        error = float(np.abs(expected - actual).max())
+        if error > max(max_error, 1e-4):
+            raise ValueError(f"Compact export does not match the sklearn model (max error {error:.2e})")
+        logger.info(
+            f"Compact export verified on {len(texts)} texts (max error {error:.2e}, "
+            f"{weights.nnz}/{coef.size} weights kept, {weights_layout})"
+        )
+
+    return manifest
+
+
+class CompactModel:
+    """TF-IDF + linear classifier served from memory-mapped arrays"""
+
+    def __init__(self, manifest: dict, arrays: dict):
+        self.manifest = manifest
+        self.model_version = manifest["model_version"]
+        self.analyzer = manifest.get("analyzer", "word")
+        self.ngram_range = tuple(manifest["ngram_range"])
+        self.n_features = manifest["n_features"]
+        self.idf = arrays["idf"] if manifest["use_idf"] else None
+        self.intercept = arrays["intercept"]
+        self.labels = np.asarray(arrays["labels"])
+
+        if "vocab_blob" in arrays:
+            terms = arrays["vocab_blob"].tobytes().decode("utf-8").split("\n")
+            hashes = np.fromiter(map(hash, terms), dtype=np.int64, count=len(terms))
+            order = np.argsort(hashes)
+            self.vocab_hashes = hashes[order]
+            self.vocab_columns = order.astype(np.int32)
+            self.vocab_terms = None
+        else:
+            self.vocab_terms = arrays["vocab_terms"]
+            self.vocab_index = arrays["vocab_index"]
+
+        self.n_classes = manifest["n_classes"]
+        if manifest.get("weights") == "csr":
+            self.coef = None
+            self.coef_data = arrays["coef_data"]
+            self.coef_indices = arrays["coef_indices"]
+            self.coef_indptr = arrays["coef_indptr"]
+            # Class-major view of the same (memory-mapped) arrays for single texts
+            weights = sparse.csr_matrix(
+                (self.coef_data, self.coef_indices, self.coef_indptr), shape=(self.n_features, self.n_classes)
+            )
+            self.coef_by_class = weights.T
+        else:
+            self.coef = arrays["coef"].T
+
+    @staticmethod
+    def exists(path: str) -> bool:
+        return os.path.exists(os.path.join(path, MANIFEST_FILE))
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "CompactModel":
+        """Open an exported artifact; arrays are memory-mapped unless mmap=False"""
+        with open(os.path.join(path, MANIFEST_FILE)) as f:
+            manifest = json.load(f)
+        if manifest.get("format") != FORMAT_NAME or manifest.get("format_version") not in SUPPORTED_VERSIONS:
+            raise ValueError(f"Unsupported model artifact: {manifest.get('format')} v{manifest.get('format_version')}")
+
+        mmap_mode = "r" if mmap else None
+        arrays = {
+            name: np.load(os.path.join(path, filename), mmap_mode=mmap_mode)
+            for name, filename in manifest["files"].items()
+        }
+        return cls(manifest, arrays)
+
+    def _lookup(self, grams: list) -> tuple:
+        """(found mask, feature column of each found n-gram)"""
+        if self.vocab_terms is None:
+            hashes = np.fromiter(map(hash, grams), dtype=np.int64, count=len(grams))
+            positions = np.searchsorted(self.vocab_hashes, hashes)
+            positions[positions == len(self.vocab_hashes)] = 0
+            found = self.vocab_hashes[positions] == hashes
+            return found, self.vocab_columns[positions[found]]
+
+        grams = np.array(grams)
+        positions = np.searchsorted(self.vocab_terms, grams)
+        positions[positions == len(self.vocab_terms)] = 0
+        found = self.vocab_terms[positions] == grams
+        return found, self.vocab_index[positions[found]]
+
+    def transform(self, docs: List[List[str]]) -> sparse.csr_matrix:
+        """TF-IDF matrix for documents given as lists of n-grams"""
+        rows = []
+        grams = []
+        for row, doc in enumerate(docs):
+            rows.extend([row] * len(doc))
+            grams.extend(doc)
+
+        shape = (len(docs), self.n_features)
+        if not grams:
+            return sparse.csr_matrix(shape)
+
+        rows = np.array(rows, dtype=np.int32)
+        found, columns = self._lookup(grams)
+
+        counts = np.ones(len(columns))
+        X = sparse.csr_matrix((counts, (rows[found], columns)), shape=shape)
+        X.sum_duplicates()
+
+        if self.manifest["sublinear_tf"]:
+            np.log(X.data, X.data)
+            X.data += 1
+        if self.idf is not None:
+            X.data *= self.idf[X.indices]
+
+        norm = self.manifest["norm"]
+        if norm is not None and X.nnz:
+            # Rows without vocabulary hits have nothing to scale; reduceat needs
+            # offsets below len(X.data), which a trailing empty row is not
+            lengths = np.diff(X.indptr)
+            filled = lengths > 0
+            if norm == "l2":
+                row_norms = np.sqrt(np.add.reduceat(X.data ** 2, X.indptr[:-1][filled]))
+            else:
+                row_norms = np.add.reduceat(np.abs(X.data), X.indptr[:-1][filled])
+            X.data /= np.repeat(row_norms, lengths[filled])
+        return X
+
+    def analyze(self, text: str) -> List[str]:
+        """N-grams of one preprocessed text, as the fitted vectorizer builds them"""
+        if self.analyzer == "char_wb":
+            return char_wb_ngrams(text, self.ngram_range)
+        return word_ngrams(tokenize(text), self.ngram_range)
+
+    def transform_texts(self, texts: List[str]) -> sparse.csr_matrix:
+        """TF-IDF matrix for preprocessed texts"""
+        return self.transform([self.analyze(text) for text in texts])
+
+    def _sparse_scores(self, X: sparse.csr_matrix) -> np.ndarray:
+        """X @ W for feature-major CSR weights, without building scipy matrices"""
+        starts = self.coef_indptr[X.indices]
+        counts = self.coef_indptr[X.indices + 1] - starts
+        # Index of every (document n-gram, nonzero weight) pair in the weight arrays
+        offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(counts.sum())
+        rows = np.repeat(np.repeat(np.arange(X.shape[0]), np.diff(X.indptr)), counts)
+        values = np.repeat(X.data, counts) * self.coef_data[offsets]
+        cells = rows * self.n_classes + self.coef_indices[offsets]
+        return np.bincount(cells, weights=values, minlength=X.shape[0] * self.n_classes).reshape(-1, self.n_classes)
+
+    def decision_function(self, X) -> np.ndarray:
+        if self.coef is None and X.shape[0] == 1:
+            return (self.coef_by_class @ X.toarray()[0])[np.newaxis] + self.intercept
+        if self.coef is None:
+            X = X if sparse.isspmatrix_csr(X) else sparse.csr_matrix(X)
+            return self._sparse_scores(X) + self.intercept
+        return np.asarray(X @ self.coef) + self.intercept
+
+    def predict_proba(self, X) -> np.ndarray:
+        return scores_to_proba(self.decision_function(X), self.manifest["proba"])
@@ -0,0 +1,269 @@
+"""
+Bulk triage for complaint dumps (CSV or JSONL)
+
+Streams the input in chunks, triages each chunk with one batched engine call
+in a process pool and appends results to a JSONL file in input order. After
+every chunk a checkpoint records how many rows and output bytes are done, so
+rerunning the same command after an interruption resumes from there. At most
+a few chunks are held in memory, whatever the input size.
+
+Usage (from backend/):
+    python -m app.ai.bulk_triage data/legacy_dump.csv triaged.jsonl --workers 4
+    python -m app.ai.bulk_triage dump.jsonl triaged.jsonl --language en --chunk-size 2000
+"""
+import argparse
+import csv
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Iterator, List, Optional
+
+from . import worker
+from .registry import model_registry
+
+logger = logging.getLogger(__name__)
+
+ID_COLUMNS = ("complaint_id", "id", "_id")
+
+
+# ==================== INPUT ====================
+
+def read_rows(path: str, input_format: str) -> Iterator[Dict]:
+    """Yield input rows one at a time"""
+    with open(path, newline="", encoding="utf-8") as f:
+        if input_format == "csv":
+            yield from csv.DictReader(f)
+        else:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+
+def row_text(row: Dict, text_column: Optional[str]) -> str:
+    """Complaint text, built like the API does when title/description are given"""
+    if text_column:
+        return str(row.get(text_column) or "")
+    if "title" in row or "description" in row:
+        return f"{row.get('title') or ''}. {row.get('description') or ''}"
+    return str(row.get("text") or "")
+
+
+def row_id(row: Dict, row_number: int):
+    for column in ID_COLUMNS:
+        if row.get(column):
+            return row[column]
+    return row_number
+
+
+def detect_format(path: str) -> str:
+    return "jsonl" if path.endswith((".jsonl", ".ndjson", ".json")) else "csv"
+
+
+# ==================== CHECKPOINT ====================
+
+class Checkpoint:
+    """Rows done and output size, replaced atomically after each chunk"""
+
+    def __init__(self, path: str, input_path: str):
+        self.path = path
+        self.input_path = os.path.abspath(input_path)
+        self.rows_done = 0
+        self.output_bytes = 0
+
+    def load(self) -> bool:
+        if not os.path.exists(self.path):
+            return False
+        with open(self.path) as f:
+            state = json.load(f)
+        if state["input"] != self.input_path:
+            raise ValueError(f"Checkpoint {self.path} belongs to {state['input']}, not {self.input_path}")
+        self.rows_done = state["rows_done"]
+        self.output_bytes = state["output_bytes"]
+        return True
+
+    def save(self) -> None:
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({
+                "input": self.input_path,
+                "rows_done": self.rows_done,
+                "output_bytes": self.output_bytes,
+                "updated_at": time.time()
+            }, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def clear(self) -> None:
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+# ==================== RUN ====================
+
+def triage_chunk(texts: List[str], languages: List[str]) -> List[Dict]:
+    """Pool task: one batched engine call per chunk"""
+    return worker.process_batch(texts, languages)
+
+
+def bulk_triage(
+    input_path: str,
+    output_path: str,
+    input_format: Optional[str] = None,
+    text_column: Optional[str] = None,
+    language: str = "auto",
+    language_column: Optional[str] = None,
+    chunk_size: int = 1000,
+    workers: int = 2,
+    model_version: Optional[str] = None,
+    progress_seconds: float = 5.0,
+    restart: bool = False
+) -> Dict:
+    """
+    Triage every row of input_path into output_path, resuming from a checkpoint
+
+    Args:
+        workers: Process pool size; 0 triages in this process
+        model_version: Registry version to use (active version by default)
+        restart: Ignore an existing checkpoint and start over
+
+    Returns:
+        dict: rows processed in this run, total rows done and rows/sec
+    """
+    input_format = input_format or detect_format(input_path)
+    checkpoint = Checkpoint(f"{output_path}.checkpoint", input_path)
+    if restart:
+        checkpoint.clear()
+    resumed = checkpoint.load()
+    if resumed and not os.path.exists(output_path):
+        raise ValueError(f"Checkpoint found but {output_path} is missing; rerun with --restart")
+
+    # Drop anything written after the last checkpoint (a chunk in flight when we stopped)
+    mode = "r+b" if resumed else "wb"
+    out = open(output_path, mode)
+    out.truncate(checkpoint.output_bytes)
+    out.seek(checkpoint.output_bytes)
+    if resumed:
+        logger.info(f"Resuming after {checkpoint.rows_done} rows")
+
+    version, model_path = model_registry.resolve(model_version)
+    if workers > 0:
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=worker.init_worker,
+            initargs=(model_path, version)
+        )
+    else:
+        pool = None
+        worker.init_worker(model_path, version)
+
+    rows = islice(read_rows(input_path, input_format), checkpoint.rows_done, None)
+    max_in_flight = max(workers, 1) * 2
+    in_flight = deque()
+    row_number = checkpoint.rows_done
+    processed = 0
+    started = last_report = time.perf_counter()
+
+    def write_oldest():
+        """Wait for the oldest chunk so output stays in input order, then checkpoint"""
+        nonlocal processed, last_report
+        future, ids = in_flight.popleft()
+        results = future.result() if pool is not None else future
+        lines = [
+            json.dumps({"row": number, "id": complaint_id, **result}, ensure_ascii=False, default=str)
+            for (number, complaint_id), result in zip(ids, results)
+        ]
+        out.write(("\n".join(lines) + "\n").encode("utf-8"))
+        out.flush()
+        os.fsync(out.fileno())
+
+        checkpoint.rows_done += len(ids)
+        checkpoint.output_bytes = out.tell()
+        checkpoint.save()
+        processed += len(ids)
+
+        now = time.perf_counter()
+        if now - last_report >= progress_seconds:
+            last_report = now
+            logger.info(f"{checkpoint.rows_done} rows done, {processed / (now - started):.0f} rows/sec")
+
+    try:
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+
+            ids, texts, languages = [], [], []
+            for row in chunk:
+                ids.append((row_number, row_id(row, row_number)))
+                texts.append(row_text(row, text_column))
+                languages.append((row.get(language_column) if language_column else None) or language)
+                row_number += 1
+
+            if pool is not None:
+                in_flight.append((pool.submit(triage_chunk, texts, languages), ids))
+            else:
+                in_flight.append((triage_chunk(texts, languages), ids))
+
+            if len(in_flight) >= max_in_flight:
+                write_oldest()
+
+        while in_flight:
+            write_oldest()
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+        out.close()
+
+    elapsed = time.perf_counter() - started
+    checkpoint.clear()
+    return {
+        "model_version": version,
+        "rows_processed": processed,
+        "rows_total": checkpoint.rows_done,
+        "seconds": round(elapsed, 2),
+        "rows_per_sec": round(processed / elapsed, 1) if elapsed > 0 else 0.0
+    }
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
+    parser = argparse.ArgumentParser(description="Triage a CSV/JSONL complaint dump into a JSONL file")
+    parser.add_argument("input", help="CSV or JSONL file")
+    parser.add_argument("output", help="JSONL file for results (appended to on resume)")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="Input format (default: from extension)")
+    parser.add_argument("--text-column", help="Column holding the text (default: title+description, else text)")
+    parser.add_argument("--language", default="auto", help="Language for every row (default: auto-detect)")
+    parser.add_argument("--language-column", help="Per-row language column, falling back to --language")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes (0 = in-process)")
+    parser.add_argument("--model-version", help="Registry version (default: active)")
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint and start over")
+    args = parser.parse_args()
+
+    try:
+        summary = bulk_triage(
+            args.input, args.output,
+            input_format=args.format,
+            text_column=args.text_column,
+            language=args.language,
+            language_column=args.language_column,
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+            model_version=args.model_version,
+            restart=args.restart
+        )
+    except KeyboardInterrupt:
+        print("\nInterrupted - rerun the same command to resume from the checkpoint")
+        sys.exit(130)
+
+    print(json.dumps(summary, indent=2))
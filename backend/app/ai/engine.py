@@ -1,44 +1,229 @@
+import copy
 import joblib
 import logging
-from typing import Dict, Any
-from .preprocess import preprocess_text
-from .keywords import detect_urgency_keywords, match_keywords, CATEGORY_KEYWORDS
+import threading
+import numpy as np
+from typing import Dict, Any, List, Optional
+from .analysis import AnalyzedText
+from .artifact import COMPACT_DIR, CompactModel
+from .preprocess import TOKEN_PATTERN, word_ngrams
+from .lean import LeanModel
+from .keywords import detect_urgency_keywords, match_keywords, rule_category, CATEGORY_KEYWORDS
 from .lang import detect_language, translate_to_english
+from .multilingual import classify_native, load_multilingual_model
+from .registry import ModelRegistry, model_registry
+from ..core.config import settings
 
 logger = logging.getLogger(__name__)
 
+WARMUP_TEXT = "Garbage not collected for 5 days near school gate smells terrible"
+
+# Triage cascade tiers, cheapest first: keyword rules, a model on the original text
+# (English or multilingual), translation then the English model
+CASCADE_TIERS = ("rules", "ml", "translation")
+
+def _identity(doc):
+    """Analyzer for documents that are already lists of n-grams"""
+    return doc
+
 class AITriageEngine:
     """Main AI Triage Engine for complaint classification"""
     
-    def __init__(self, model_path="app/ai/models"):
+    # Default for artifacts that do not record a version
+    model_version = "tfidf_lr_v1"
+    
+    def __init__(
+        self,
+        model_path="app/ai/models",
+        model_format: str = settings.TRIAGE_MODEL_FORMAT,
+        model_version: Optional[str] = None
+    ):
         try:
-            self.vectorizer = joblib.load(f"{model_path}/tfidf_vectorizer.joblib")
-            self.model = joblib.load(f"{model_path}/category_model.joblib")
-            self.label_encoder = joblib.load(f"{model_path}/label_encoder.joblib")
-            logger.info("AI Triage Engine initialized")
+            self.model_path = model_path
+            compact_path = f"{model_path}/{COMPACT_DIR}"
+            if model_format == "compact" and CompactModel.exists(compact_path):
+                self._load_compact(compact_path)
+            elif model_format == "lean":
+                self._load_lean(model_path)
+            else:
+                if model_format == "compact":
+                    logger.warning(f"No compact model at {compact_path}, loading joblib artifacts")
+                self._load_joblib(model_path)
+            
+            self.multilingual_model = load_multilingual_model(model_path) if settings.TRIAGE_MULTILINGUAL else None
+            self.cascade = settings.TRIAGE_CASCADE
+            self.tier_counts = dict.fromkeys(CASCADE_TIERS, 0)
+            self._counts_lock = threading.Lock()  # Triage threads share the engine
+            
+            if model_version:
+                self.model_version = model_version
+            elif self.compact_model is not None:
+                self.model_version = self.compact_model.model_version
+            logger.info(f"AI Triage Engine initialized ({self.model_version}, {self.model_format} artifacts)")
         except Exception as e:
             logger.error(f"Failed to load AI models: {e}")
             raise
     
-    def process(self, text: str, language: str = "auto") -> Dict[str, Any]:
+    def _load_joblib(self, model_path: str):
+        """Unpickle the sklearn vectorizer, model and label encoder"""
+        self.model_format = "joblib"
+        self.compact_model = None
+        self.lean_model = None
+        self.vectorizer = joblib.load(f"{model_path}/tfidf_vectorizer.joblib")
+        self.model = joblib.load(f"{model_path}/category_model.joblib")
+        self.label_encoder = joblib.load(f"{model_path}/label_encoder.joblib")
+        self._token_vectorizer = self._build_token_vectorizer(self.vectorizer)
+        self.ngram_range = self.vectorizer.ngram_range
+        self.labels = self.label_encoder.classes_[self.model.classes_]
+    
+    def _load_lean(self, model_path: str):
+        """Joblib artifacts, evaluated with LeanModel when the vectorizer allows it"""
+        self._load_joblib(model_path)
+        if LeanModel.supported(self.vectorizer):
+            self.model_format = "lean"
+            self.lean_model = LeanModel.from_sklearn(self.vectorizer, self.model, self.label_encoder)
+        else:
+            logger.warning("Vectorizer not supported by lean inference, using sklearn")
+    
+    def _load_compact(self, compact_path: str):
+        """Memory-map the compact artifact; sklearn is never imported"""
+        self.model_format = "compact"
+        self.compact_model = CompactModel.load(compact_path)
+        self.lean_model = None
+        self.vectorizer = self.model = self.label_encoder = None
+        self._token_vectorizer = None
+        self.ngram_range = self.compact_model.ngram_range
+        self.labels = self.compact_model.labels
+    
+    @staticmethod
+    def _build_token_vectorizer(vectorizer):
+        """
+        Shallow copy of the fitted vectorizer that accepts pre-built n-grams
+        
+        Only possible for a plain word analyzer; AnalyzedText tokens use the
+        same token pattern, and normalized text is already lowercase ASCII.
+        """
+        if (
+            vectorizer.analyzer != "word"
+            or vectorizer.preprocessor is not None
+            or vectorizer.tokenizer is not None
+            or vectorizer.stop_words is not None
+            or vectorizer.token_pattern != TOKEN_PATTERN.pattern
+        ):
+            return None
+        
+        token_vectorizer = copy.copy(vectorizer)
+        token_vectorizer.analyzer = _identity
+        return token_vectorizer
+    
+    def warmup(self) -> None:
+        """
+        Run one sample inference so the first real request is not cold
+        
+        Not counted in cascade_stats; the model runs even when a rule would
+        decide the sample.
+        """
+        analyzed = self.analyze(WARMUP_TEXT, "en")
+        self._predict_proba(self._vectorize([analyzed]))
+        category, confidence = self._classify_category(analyzed, count=False)
+        self._build_result(analyzed, category, confidence)
+    
+    def process(self, text: str, language: str = "auto", analyzed: Optional[AnalyzedText] = None) -> Dict[str, Any]:
         """Main processing pipeline"""
+        analyzed = self.analyze(text, language, analyzed)
+        
+        category, confidence = self._classify_category(analyzed)
+        
+        return self._build_result(analyzed, category, confidence)
+    
+    def process_batch(self, texts: List[str], languages: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Batch processing pipeline - one vectorizer/model call for the whole batch"""
+        if languages is None:
+            languages = ["auto"] * len(texts)
+        if len(languages) != len(texts):
+            raise ValueError("texts and languages must have the same length")
+        
+        analyzed_texts = [self.analyze(text, language) for text, language in zip(texts, languages)]
+        
+        predictions = self._classify_batch(analyzed_texts)
+        
+        return [
+            self._build_result(analyzed, category, confidence)
+            for analyzed, (category, confidence) in zip(analyzed_texts, predictions)
+        ]
+    
+    def analyze(
+        self,
+        text: str,
+        language: str = "auto",
+        analyzed: Optional[AnalyzedText] = None,
+        translate: bool = True
+    ) -> AnalyzedText:
+        """
+        Detect language, translate if needed and attach the result to an AnalyzedText
+        
+        Non-English text the multilingual model classifies confidently is not
+        translated; if translation is still needed and fails, its prediction
+        is used whatever the confidence, since the English model would only
+        see the ASCII left after preprocessing.
+        
+        With translate=False, text that still needs translation is returned
+        with pending_translation set; the caller translates it (e.g. with
+        translate_to_english_async on the event loop) and passes the result
+        to finish_translation. A ready AnalyzedText is returned unchanged.
+        """
+        if analyzed is None:
+            analyzed = AnalyzedText(text)
+        elif analyzed.ready:
+            return analyzed
+        
         detected_lang = detect_language(text)
+        source_lang = detected_lang if language == "auto" else language
+        native = None
+        if self.multilingual_model is not None and source_lang not in ("en", "unknown"):
+            native = classify_native(self.multilingual_model, [text])[0]
+            if native[1] >= settings.MULTILINGUAL_MIN_CONFIDENCE:
+                analyzed.set_translation(text, detected_lang)
+                analyzed.prediction = native
+                analyzed.tier = "ml"
+                analyzed.ready = True
+                return analyzed
+        
         if language == "auto" and detected_lang != "en":
+            analyzed.tier = "translation"
+            if not translate:
+                analyzed.pending_translation = (text, detected_lang, native)
+                return analyzed
             try:
-                translated_text, detected_lang = translate_to_english(text)
+                translated_text, detected_lang = translate_to_english(text, detected_lang)
             except:
                 translated_text = text
                 detected_lang = "en"
         else:
             translated_text = text
         
-        normalized_text = preprocess_text(translated_text)
+        analyzed.pending_translation = (text, detected_lang, native)
+        return self.finish_translation(analyzed, translated_text, detected_lang)
+    
+    def finish_translation(self, analyzed: AnalyzedText, translated_text: str, detected_lang: str) -> AnalyzedText:
+        """Complete an analysis left pending by analyze(translate=False)"""
+        text, _, native = analyzed.pending_translation
+        analyzed.pending_translation = None
+        if native is not None and translated_text == text:
+            analyzed.prediction = native
         
-        category, confidence = self._classify_category(normalized_text)
+        analyzed.set_translation(translated_text, detected_lang)
+        analyzed.ready = True
+        return analyzed
+    
+    def _build_result(self, analyzed: AnalyzedText, category: str, confidence: float) -> Dict[str, Any]:
+        """Apply keyword fallback and urgency detection to a classified text"""
+        normalized_text = analyzed.normalized
+        keyword_hits = analyzed.keyword_hits
+        category_scores, matched_keywords_dict = match_keywords(normalized_text, CATEGORY_KEYWORDS, hits=keyword_hits)
         
         # Only use keyword fallback if ML confidence is very low
         if confidence < 0.35:
-            category_scores, matched_keywords_dict = match_keywords(normalized_text, CATEGORY_KEYWORDS)
             if category_scores:
                 keyword_category = max(category_scores, key=category_scores.get)
                 if category_scores[keyword_category] >= 2:
@@ -46,9 +231,8 @@ class AITriageEngine:
                     confidence = min(0.50 + (category_scores[keyword_category] * 0.05), 0.75)
 
         
-        urgency_level, urgency_score, urgency_keywords = self._detect_urgency(normalized_text, category)
+        urgency_level, urgency_score, urgency_keywords = self._detect_urgency(normalized_text, category, keyword_hits)
         
-        category_scores, matched_keywords_dict = match_keywords(normalized_text, CATEGORY_KEYWORDS)
         all_keywords = urgency_keywords + matched_keywords_dict.get(category, [])
         
         return {
@@ -57,29 +241,133 @@ class AITriageEngine:
             "urgency_level": urgency_level,
             "urgency_score": round(float(urgency_score), 4),
             "keywords_detected": list(set(all_keywords[:15])),
-            "language_detected": detected_lang,
+            "language_detected": analyzed.language,
             "normalized_text": normalized_text,
-            "model_version": "tfidf_lr_v1"
+            "model_version": self.model_version
         }
     
-    def _classify_category(self, text: str) -> tuple:
-        """Classify complaint category"""
+    def _vectorize(self, analyzed_texts: List[AnalyzedText]):
+        """TF-IDF features, built from the shared tokens when the vectorizer allows it"""
+        if self.lean_model is not None and self.lean_model.analyzer != "word":
+            return [self.lean_model.analyze(analyzed.normalized) for analyzed in analyzed_texts]
+        if self.lean_model is not None:
+            # Plain n-gram lists; LeanModel does the TF-IDF weighting itself
+            return [word_ngrams(analyzed.tokens, self.ngram_range) for analyzed in analyzed_texts]
+        if self.compact_model is not None and self.compact_model.analyzer != "word":
+            return self.compact_model.transform_texts([analyzed.normalized for analyzed in analyzed_texts])
+        if self.compact_model is not None:
+            return self.compact_model.transform([
+                word_ngrams(analyzed.tokens, self.ngram_range) for analyzed in analyzed_texts
+            ])
+        
+        if self._token_vectorizer is None:
+            return self.vectorizer.transform([analyzed.normalized for analyzed in analyzed_texts])
+        
+        return self._token_vectorizer.transform([
+            word_ngrams(analyzed.tokens, self.ngram_range) for analyzed in analyzed_texts
+        ])
+    
+    def tfidf_vectors(self, analyzed_texts: List[AnalyzedText]):
+        """TF-IDF rows (scipy CSR) of the English vectorizer, whatever the model format"""
+        if self.lean_model is not None:
+            return self.lean_model.transform(self._vectorize(analyzed_texts))
+        return self._vectorize(analyzed_texts)
+    
+    def _predict_proba(self, X) -> np.ndarray:
+        """Class probabilities, columns ordered like self.labels"""
+        if self.lean_model is not None:
+            return self.lean_model.predict_proba(X)
+        if self.compact_model is not None:
+            return self.compact_model.predict_proba(X)
+        return self.model.predict_proba(X)
+    
+    def _rule_prediction(self, analyzed: AnalyzedText) -> Optional[tuple]:
+        """Rule tier: (category, confidence) for unambiguous untranslated text, else None"""
+        if not self.cascade or analyzed.tier is not None:
+            return None
+        rule = rule_category(analyzed.tokens, settings.CASCADE_RULE_MIN_HITS, settings.CASCADE_RULE_MARGIN)
+        if rule is None:
+            return None
+        return rule[0], settings.CASCADE_RULE_CONFIDENCE
+    
+    def cascade_stats(self) -> Dict[str, Any]:
+        """Complaints decided by each cascade tier, with hit rates"""
+        with self._counts_lock:
+            tier_counts = dict(self.tier_counts)
+        total = sum(tier_counts.values())
+        return {
+            "enabled": self.cascade,
+            "total": total,
+            "tiers": {
+                tier: {"hits": hits, "rate": round(hits / total, 4) if total else 0.0}
+                for tier, hits in tier_counts.items()
+            }
+        }
+    
+    def _count(self, *tiers: str) -> None:
+        """Add one complaint decided by each given tier to the cascade counters"""
+        with self._counts_lock:
+            for tier in tiers:
+                self.tier_counts[tier] += 1
+    
+    def _classify_category(self, analyzed: AnalyzedText, count: bool = True) -> tuple:
+        """Classify complaint category: earlier prediction, then rules, then the model"""
+        if analyzed.prediction is not None:
+            if count:
+                self._count(analyzed.tier or "ml")
+            return analyzed.prediction
+        rule = self._rule_prediction(analyzed)
+        if rule is not None:
+            if count:
+                self._count("rules")
+            return rule
+        if count:
+            self._count(analyzed.tier or "ml")
         try:
-            X = self.vectorizer.transform([text])
-            pred_idx = self.model.predict(X)[0]
-            pred_proba = self.model.predict_proba(X)[0]
+            X = self._vectorize([analyzed])
+            pred_proba = self._predict_proba(X)[0]
+            pred_idx = int(pred_proba.argmax())
             
             confidence = pred_proba[pred_idx]
-            category = self.label_encoder.classes_[pred_idx]
+            category = self.labels[pred_idx]
             
             return category, confidence
         except Exception as e:
             logger.error(f"Classification error: {e}")
             return "Administrative", 0.0
     
-    def _detect_urgency(self, text: str, category: str) -> tuple:
+    def _classify_batch(self, analyzed_texts: List[AnalyzedText]) -> List[tuple]:
+        """Classify a batch of complaints with a single transform/predict_proba call"""
+        predictions = [
+            analyzed.prediction if analyzed.prediction is not None else self._rule_prediction(analyzed)
+            for analyzed in analyzed_texts
+        ]
+        self._count(*(
+            "rules" if analyzed.prediction is None and prediction is not None else analyzed.tier or "ml"
+            for analyzed, prediction in zip(analyzed_texts, predictions)
+        ))
+        pending = [i for i, prediction in enumerate(predictions) if prediction is None]
+        if not pending:
+            return predictions
+        try:
+            X = self._vectorize([analyzed_texts[i] for i in pending])
+            proba = self._predict_proba(X)
+            pred_idx = proba.argmax(axis=1)
+            
+            confidences = proba[np.arange(len(pending)), pred_idx]
+            categories = self.labels[pred_idx]
+            
+            for i, prediction in zip(pending, zip(categories.tolist(), confidences.tolist())):
+                predictions[i] = prediction
+        except Exception as e:
+            logger.error(f"Batch classification error: {e}")
+            for i in pending:
+                predictions[i] = ("Administrative", 0.0)
+        return predictions
+    
+    def _detect_urgency(self, text: str, category: str, keyword_hits: Optional[frozenset] = None) -> tuple:
         """Detect urgency level"""
-        urgency_level, urgency_score, keywords = detect_urgency_keywords(text)
+        urgency_level, urgency_score, keywords = detect_urgency_keywords(text, hits=keyword_hits)
         
         # Apply category boosts only to base score
         boosted_score = urgency_score
@@ -112,8 +400,26 @@ def get_ai_engine():
         raise RuntimeError("AI Engine not initialized")
     return ai_engine
 
+def load_ai_engine(version: Optional[str] = None, registry: ModelRegistry = model_registry) -> AITriageEngine:
+    """Load a registry version (the active one by default) and warm it up"""
+    version, path = registry.resolve(version)
+    engine = AITriageEngine(path, model_version=version)
+    engine.warmup()
+    return engine
+
+def swap_ai_engine(engine: AITriageEngine) -> Optional[AITriageEngine]:
+    """
+    Replace the global engine in one reference assignment
+    
+    Requests that already called get_ai_engine() finish on the engine they hold.
+    Returns the previous engine.
+    """
+    global ai_engine
+    previous, ai_engine = ai_engine, engine
+    return previous
+
 def initialize_ai_engine():
-    """Initialize the AI engine at startup"""
+    """Initialize the AI engine at startup from the active registry version"""
     global ai_engine
-    ai_engine = AITriageEngine()
+    ai_engine = load_ai_engine()
     return ai_engine
@@ -1,4 +1,6 @@
 """Keyword dictionaries for category matching and urgency detection"""
+from collections import deque
+from typing import Optional
 
 CATEGORY_KEYWORDS = {
     "Infrastructure": [
@@ -58,12 +60,99 @@ URGENCY_KEYWORDS = {
     ]
 }
 
-def detect_urgency_keywords(text: str) -> tuple:
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton for multi-keyword matching
+    Finds every keyword occurrence in a single pass over the text
+    """
+    
+    def __init__(self, keywords):
+        self.keywords = sorted(set(keywords))
+        
+        # Build the trie
+        goto = [{}]
+        outputs = [()]
+        for kw_id, kw in enumerate(self.keywords):
+            state = 0
+            for ch in kw:
+                next_state = goto[state].get(ch)
+                if next_state is None:
+                    goto.append({})
+                    outputs.append(())
+                    next_state = len(goto) - 1
+                    goto[state][ch] = next_state
+                state = next_state
+            outputs[state] = outputs[state] + (kw_id,)
+        
+        # Breadth-first pass: failure links, merged outputs and full transition table
+        fail = [0] * len(goto)
+        delta = [dict(transitions) for transitions in goto]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in delta[fail[state]].items():
+                delta[state].setdefault(ch, next_state)
+            for ch, next_state in goto[state].items():
+                fail[next_state] = delta[fail[state]].get(ch, 0)
+                outputs[next_state] = outputs[next_state] + outputs[fail[next_state]]
+                queue.append(next_state)
+        
+        self._delta = delta
+        self._outputs = outputs
+    
+    def find(self, text: str, word_boundary: bool = False) -> frozenset:
+        """
+        Return the set of keywords occurring in text
+        
+        With word_boundary=True a keyword only counts when it is not part of a
+        longer word (so "help" does not match "helpline")
+        """
+        delta = self._delta
+        outputs = self._outputs
+        state = 0
+        
+        if not word_boundary:
+            terminal_states = set()
+            for ch in text:
+                state = delta[state].get(ch, 0)
+                if outputs[state]:
+                    terminal_states.add(state)
+            return frozenset(
+                self.keywords[kw_id] for state in terminal_states for kw_id in outputs[state]
+            )
+        
+        found = set()
+        text_len = len(text)
+        for end, ch in enumerate(text, 1):
+            state = delta[state].get(ch, 0)
+            if not outputs[state]:
+                continue
+            if end < text_len and text[end].isalnum():
+                continue
+            for kw_id in outputs[state]:
+                kw = self.keywords[kw_id]
+                start = end - len(kw)
+                if start == 0 or not text[start - 1].isalnum():
+                    found.add(kw)
+        return frozenset(found)
+
+
+KEYWORD_AUTOMATON = KeywordAutomaton(
+    [kw for keywords in CATEGORY_KEYWORDS.values() for kw in keywords] +
+    [kw for keywords in URGENCY_KEYWORDS.values() for kw in keywords]
+)
+
+def scan_keywords(text: str, word_boundary: bool = False) -> frozenset:
+    """Find all category and urgency keywords in text with one automaton pass"""
+    return KEYWORD_AUTOMATON.find(text.lower(), word_boundary)
+
+def detect_urgency_keywords(text: str, hits: Optional[frozenset] = None, word_boundary: bool = False) -> tuple:
     """Detect urgency level based on keywords"""
-    text_lower = text.lower()
+    if hits is None:
+        hits = scan_keywords(text, word_boundary)
     
-    high_keywords = [kw for kw in URGENCY_KEYWORDS["HIGH"] if kw in text_lower]
-    medium_keywords = [kw for kw in URGENCY_KEYWORDS["MEDIUM"] if kw in text_lower]
+    high_keywords = [kw for kw in URGENCY_KEYWORDS["HIGH"] if kw in hits]
+    medium_keywords = [kw for kw in URGENCY_KEYWORDS["MEDIUM"] if kw in hits]
     
     # Base scoring - reduced weights
     high_score = len(high_keywords) * 0.35
@@ -81,16 +170,54 @@ def detect_urgency_keywords(text: str) -> tuple:
     all_keywords = high_keywords + medium_keywords
     return urgency_level, urgency_score, list(set(all_keywords[:10]))
 
-def match_keywords(text: str, keyword_dict: dict) -> dict:
+def match_keywords(text: str, keyword_dict: dict, hits: Optional[frozenset] = None, word_boundary: bool = False) -> dict:
     """Match keywords from text and return category scores"""
-    text_lower = text.lower()
+    if hits is None:
+        if keyword_dict is CATEGORY_KEYWORDS:
+            hits = scan_keywords(text, word_boundary)
+        else:
+            automaton = KeywordAutomaton([kw for keywords in keyword_dict.values() for kw in keywords])
+            hits = automaton.find(text.lower(), word_boundary)
+    
     scores = {}
     matched_keywords = {}
     
     for category, keywords in keyword_dict.items():
-        matches = [kw for kw in keywords if kw in text_lower]
+        matches = [kw for kw in keywords if kw in hits]
         scores[category] = len(matches)
         if matches:
             matched_keywords[category] = matches
     
     return scores, matched_keywords
+
+def _keyword_index(keyword_dict: dict) -> dict:
+    """Single-word keyword -> categories listing it"""
+    index = {}
+    for category, keywords in keyword_dict.items():
+        for keyword in keywords:
+            if " " not in keyword:
+                index.setdefault(keyword, []).append(category)
+    return index
+
+# Whole-word category keywords, for the triage cascade's rule tier
+CATEGORY_KEYWORD_INDEX = _keyword_index(CATEGORY_KEYWORDS)
+
+def rule_category(tokens: list, min_hits: int = 2, margin: int = 2) -> Optional[tuple]:
+    """
+    (category, hits) when whole-word keyword hits single out one category
+    
+    The best category needs at least min_hits distinct keywords and margin
+    more than the runner-up; otherwise None.
+    """
+    counts = {}
+    for token in set(tokens):
+        for category in CATEGORY_KEYWORD_INDEX.get(token, ()):
+            counts[category] = counts.get(category, 0) + 1
+    if not counts:
+        return None
+    
+    best = max(counts, key=counts.get)
+    runner_up = max((hits for category, hits in counts.items() if category != best), default=0)
+    if counts[best] >= min_hits and counts[best] - runner_up >= margin:
+        return best, counts[best]
+    return None
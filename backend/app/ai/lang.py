@@ -1,26 +1,433 @@
-from langdetect import detect, LangDetectException
-from googletrans import Translator
+from langdetect import detect, DetectorFactory, LangDetectException
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+import asyncio
+import hashlib
 import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from ..core.config import settings
+from .keywords import CATEGORY_KEYWORDS, URGENCY_KEYWORDS
 
 logger = logging.getLogger(__name__)
-translator = Translator()
+
+# langdetect is probabilistic; seed it so the fallback path is repeatable
+DetectorFactory.seed = 0
+
+
+# ==================== SCRIPT PRE-DETECTION ====================
+
+# Indic blocks are 128 code points wide and aligned, so ord(ch) >> 7 names the block.
+# Only scripts used by a single supported language are mapped; Devanagari (hi/mr/ne)
+# and Arabic (ur/ar/fa) still go to langdetect.
+SCRIPT_BLOCK_LANGUAGES = {
+    0x0980 >> 7: "bn",   # Bengali
+    0x0A00 >> 7: "pa",   # Gurmukhi
+    0x0A80 >> 7: "gu",   # Gujarati
+    0x0B00 >> 7: "or",   # Oriya
+    0x0B80 >> 7: "ta",   # Tamil
+    0x0C00 >> 7: "te",   # Telugu
+    0x0C80 >> 7: "kn",   # Kannada
+    0x0D00 >> 7: "ml",   # Malayalam
+}
+
+DEVANAGARI_BLOCK = 0x0900 >> 7
+
+# Devanagari is shared by Hindi and Marathi; their function words rarely overlap
+DEVANAGARI_MARKERS = {
+    "hi": frozenset("है हैं था थी थे नहीं का की के में से को पर और भी रहा रही रहे हुआ हुई गया गई कोई".split()),
+    "mr": frozenset("आहे आहेत होते नाही नाहीत आणि आमच्या आमचा च्या मध्ये झाली झाला झाले येत होत गेला गेली".split()),
+}
+
+# Share of letters a single script needs before we trust it
+SCRIPT_DOMINANCE_THRESHOLD = 0.6
+
+# English marker words: function words plus the complaint vocabulary of the keyword lists
+ENGLISH_STOP_WORDS = frozenset("""
+a an the is are was were be been being am i me my we our us you your he she it its
+they them their this that these those of in on at to for from by with about near
+since after before into over under and or but not no nor so very too also has have
+had do does did done will would can could should please there here what when where
+which who why how all any some more most many much again still yet just only than then
+""".split())
+
+ENGLISH_MARKER_WORDS = ENGLISH_STOP_WORDS | frozenset(
+    word
+    for keyword_dict in (CATEGORY_KEYWORDS, URGENCY_KEYWORDS)
+    for keywords in keyword_dict.values()
+    for keyword in keywords
+    for word in keyword.split()
+)
+
+# Romanized Hindi scores at most ~0.33 on the corpus; English complaints rarely drop below 0.4
+ENGLISH_MARKER_THRESHOLD = 0.4
+ENGLISH_MIN_WORDS = 3
+
+_ASCII_WORD = re.compile(r"[a-z]+")
+
+
+def detect_script_language(text: str) -> Optional[str]:
+    """
+    Cheap language guess from the Unicode script histogram
+    
+    Returns:
+        Language code when the script (or English vocabulary) is decisive,
+        None when langdetect has to decide.
+    """
+    if text.isascii():
+        words = _ASCII_WORD.findall(text.lower())
+        if len(words) < ENGLISH_MIN_WORDS:
+            return None
+        hits = sum(1 for word in words if word in ENGLISH_MARKER_WORDS)
+        return "en" if hits / len(words) >= ENGLISH_MARKER_THRESHOLD else None
+    
+    blocks = {}
+    letters = 0
+    for ch in text:
+        if ch.isalpha():
+            block = ord(ch) >> 7
+            blocks[block] = blocks.get(block, 0) + 1
+            letters += 1
+    if not letters:
+        return None
+    
+    block, count = max(blocks.items(), key=lambda item: item[1])
+    if count / letters < SCRIPT_DOMINANCE_THRESHOLD:
+        return None
+    if block == DEVANAGARI_BLOCK:
+        return _vote_devanagari(text)
+    return SCRIPT_BLOCK_LANGUAGES.get(block)
+
+
+def _vote_devanagari(text: str) -> Optional[str]:
+    """Pick Hindi or Marathi by function-word counts; None on a tie"""
+    words = text.split()
+    votes = {
+        language: sum(1 for word in words if word.strip(",.!?;:|।") in markers)
+        for language, markers in DEVANAGARI_MARKERS.items()
+    }
+    if votes["hi"] > votes["mr"]:
+        return "hi"
+    if votes["mr"] > votes["hi"]:
+        return "mr"
+    return None
+
 
 def detect_language(text: str) -> str:
-    """Detect language of text"""
+    """Detect language of text, skipping langdetect when the script settles it"""
+    language = detect_script_language(text)
+    if language is not None:
+        return language
     try:
         return detect(text)
     except LangDetectException:
         return "unknown"
 
-def translate_to_english(text: str) -> tuple:
-    """Translate text to English. Returns (translated_text, detected_language)"""
-    try:
-        detected = detect(text)
-        if detected == 'en':
-            return text, 'en'
+
+# ==================== BACKENDS ====================
+
+class TranslationBackend(ABC):
+    """Base class for translation providers (blocking calls, run in a worker thread)"""
+    
+    name = "base"
+    
+    @abstractmethod
+    def translate(self, text: str, src: str, dest: str) -> str:
+        """Translated text; raises on failure"""
+
+
+class GoogleTranslateBackend(TranslationBackend):
+    """googletrans (unofficial Google Translate) backend"""
+    
+    name = "google"
+    
+    def __init__(self):
+        from googletrans import Translator
+        self.translator = Translator()
+    
+    def translate(self, text: str, src: str, dest: str) -> str:
+        return self.translator.translate(text, src=src, dest=dest).text
+
+
+class StubTranslationBackend(TranslationBackend):
+    """Local backend for tests: fixed translations, optional delay and failures"""
+    
+    name = "stub"
+    
+    def __init__(self, translations: Optional[Dict[str, str]] = None, delay: float = 0.0, fail: bool = False):
+        self.translations = translations or {}
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+    
+    def translate(self, text: str, src: str, dest: str) -> str:
+        self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("Stub translation failure")
+        return self.translations.get(text, text)
+
+
+TRANSLATION_BACKENDS = {
+    "google": GoogleTranslateBackend,
+    "stub": StubTranslationBackend
+}
+
+
+# ==================== RESILIENCE ====================
+
+class CircuitBreaker:
+    """
+    Stops calling a failing backend for reset_timeout seconds after
+    failure_threshold consecutive failures, then lets one trial call through
+    """
+    
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+    
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+    
+    def allow(self) -> bool:
+        """Whether a backend call may be attempted"""
+        with self._lock:
+            if self.state != "half-open":
+                return self.state == "closed"
+            # Let a single trial call through; re-open until it reports back
+            self.opened_at = time.monotonic()
+            return True
+    
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+    
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                if self.opened_at is None:
+                    logger.warning(f"Translation circuit opened after {self.failures} failures")
+                self.opened_at = time.monotonic()
+
+
+class TranslationCache:
+    """Persistent SQLite translation cache keyed by text hash and language pair"""
+    
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
         
-        translation = translator.translate(text, src=detected, dest='en')
-        return translation.text, detected
-    except Exception as e:
-        logger.warning(f"Translation failed: {e}")
-        return text, "unknown"
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=5.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            "key TEXT PRIMARY KEY, src TEXT, dest TEXT, translated TEXT, created_at REAL)"
+        )
+        self._conn.commit()
+    
+    @staticmethod
+    def make_key(text: str, src: str, dest: str) -> str:
+        return hashlib.sha256(f"{src}\x00{dest}\x00{text}".encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT translated FROM translations WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+    
+    def put(self, key: str, src: str, dest: str, translated: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?)",
+                (key, src, dest, translated, time.time())
+            )
+            self._conn.commit()
+
+
+# ==================== SERVICE ====================
+
+class TranslationService:
+    """
+    Translation with a per-call deadline, circuit breaker, request coalescing
+    and a persistent cache
+    
+    Backend calls run in a small thread pool. Identical in-flight requests
+    share one call; a call that misses its deadline keeps running and still
+    fills the cache when it completes. Callers get None when no translation
+    is available in time and should fall back to the original text.
+    """
+    
+    def __init__(
+        self,
+        backend: TranslationBackend,
+        cache: Optional[TranslationCache] = None,
+        timeout: float = 2.0,
+        breaker: Optional[CircuitBreaker] = None,
+        max_workers: int = 4
+    ):
+        self.backend = backend
+        self.cache = cache
+        self.timeout = timeout
+        self.breaker = breaker or CircuitBreaker()
+        
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="translate")
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        
+        self.cache_hits = 0
+        self.backend_calls = 0
+        self.coalesced = 0
+        self.timeouts = 0
+        self.short_circuited = 0
+    
+    def translate_sync(self, text: str, src: str, dest: str = "en") -> Optional[str]:
+        """Blocking translation for synchronous callers (engine, workers, CLIs)"""
+        cached, future = self._lookup(text, src, dest)
+        if future is None:
+            return cached
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            self._record_timeout(future)
+        except Exception as e:
+            logger.warning(f"Translation failed: {e}")
+        return None
+    
+    async def translate(self, text: str, src: str, dest: str = "en") -> Optional[str]:
+        """Translate without blocking the event loop"""
+        cached, future = self._lookup(text, src, dest)
+        if future is None:
+            return cached
+        try:
+            return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            self._record_timeout(future)
+        except Exception as e:
+            logger.warning(f"Translation failed: {e}")
+        return None
+    
+    def stats(self) -> Dict:
+        return {
+            "backend": self.backend.name,
+            "circuit": self.breaker.state,
+            "cache_hits": self.cache_hits,
+            "backend_calls": self.backend_calls,
+            "coalesced": self.coalesced,
+            "timeouts": self.timeouts,
+            "short_circuited": self.short_circuited
+        }
+    
+    def _lookup(self, text: str, src: str, dest: str) -> tuple:
+        """Return (result, None) when answered locally, else (None, in-flight future)"""
+        if not text or src == dest:
+            return text, None
+        
+        key = TranslationCache.make_key(text, src, dest)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.cache_hits += 1
+                return cached, None
+        
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return None, future
+            
+            if not self.breaker.allow():
+                self.short_circuited += 1
+                return None, None
+            
+            self.backend_calls += 1
+            future = self._pool.submit(self._call_backend, key, text, src, dest)
+            self._inflight[key] = future
+        
+        future.add_done_callback(lambda f: self._finish(key, f))
+        return None, future
+    
+    def _call_backend(self, key: str, text: str, src: str, dest: str) -> str:
+        translated = self.backend.translate(text, src, dest)
+        if self.cache is not None and translated:
+            self.cache.put(key, src, dest, translated)
+        return translated
+    
+    def _finish(self, key: str, future: Future) -> None:
+        with self._lock:
+            self._inflight.pop(key, None)
+        if future.exception() is None:
+            self.breaker.record_success()
+        else:
+            self.breaker.record_failure()
+    
+    def _record_timeout(self, future: Future) -> None:
+        """Count a missed deadline once per backend call, however many callers waited"""
+        with self._lock:
+            if getattr(future, "deadline_missed", False):
+                return
+            future.deadline_missed = True
+            self.timeouts += 1
+        self.breaker.record_failure()
+        logger.warning(f"Translation exceeded {self.timeout}s deadline")
+
+
+translation_service = None
+
+def get_translation_service() -> TranslationService:
+    """Get the process-wide translation service, creating it on first use"""
+    global translation_service
+    if translation_service is None:
+        backend = TRANSLATION_BACKENDS[settings.TRANSLATION_BACKEND]()
+        cache = TranslationCache(settings.TRANSLATION_CACHE_PATH) if settings.TRANSLATION_CACHE_PATH else None
+        translation_service = TranslationService(
+            backend,
+            cache=cache,
+            timeout=settings.TRANSLATION_TIMEOUT_SECONDS,
+            breaker=CircuitBreaker(
+                settings.TRANSLATION_BREAKER_THRESHOLD,
+                settings.TRANSLATION_BREAKER_RESET_SECONDS
+            )
+        )
+    return translation_service
+
+def translate_to_english(text: str, detected: Optional[str] = None) -> tuple:
+    """
+    Translate text to English. Returns (translated_text, detected_language)
+    
+    Pass the already detected language to avoid running detection twice.
+    Falls back to the original text if translation is unavailable.
+    """
+    if detected is None:
+        detected = detect_language(text)
+    if detected in ("en", "unknown"):
+        return text, detected
+    
+    translated = get_translation_service().translate_sync(text, detected, "en")
+    return (translated or text), detected
+
+async def translate_to_english_async(text: str, detected: Optional[str] = None) -> tuple:
+    """Async variant of translate_to_english for callers on the event loop"""
+    if detected is None:
+        detected = detect_language(text)
+    if detected in ("en", "unknown"):
+        return text, detected
+    
+    translated = await get_translation_service().translate(text, detected, "en")
+    return (translated or text), detected
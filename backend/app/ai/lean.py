@@ -0,0 +1,101 @@
+"""
+Lean NumPy inference for the joblib model
+
+vectorizer.transform and model.predict_proba validate their input and build
+scipy sparse matrices, which costs far more than the arithmetic for one
+complaint. LeanModel keeps the fitted float64 arrays (vocabulary, idf,
+weights) and does the same steps directly: n-gram lookup, term counts,
+sublinear TF, IDF, normalization, linear scores and softmax. Results match
+sklearn to rounding error (well below 1e-9); unlike the compact artifact the
+weights are neither float32 nor pruned.
+"""
+from collections import Counter
+from typing import List
+
+import numpy as np
+from scipy import sparse
+
+from .artifact import compact_supported, linear_weights, scores_to_proba
+from .preprocess import char_wb_ngrams, tokenize, word_ngrams
+
+
+class LeanModel:
+    """TF-IDF + linear classifier evaluated per document with NumPy"""
+
+    def __init__(self, vocabulary: dict, idf, coef: np.ndarray, intercept: np.ndarray, labels: np.ndarray,
+                 proba: str, analyzer: str, ngram_range: tuple, sublinear_tf: bool, norm):
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.coef = np.ascontiguousarray(coef.T, dtype=np.float64)  # features x classes, rows gathered per text
+        self.intercept = np.asarray(intercept, dtype=np.float64)
+        self.labels = labels
+        self.proba = proba
+        self.analyzer = analyzer
+        self.ngram_range = tuple(ngram_range)
+        self.sublinear_tf = sublinear_tf
+        self.norm = norm
+
+    @staticmethod
+    def supported(vectorizer) -> bool:
+        return compact_supported(vectorizer) and vectorizer.norm in ("l2", "l1", None)
+
+    @classmethod
+    def from_sklearn(cls, vectorizer, model, label_encoder) -> "LeanModel":
+        """Wrap a fitted TfidfVectorizer, linear classifier and label encoder"""
+        if not cls.supported(vectorizer):
+            raise ValueError("Lean inference needs a plain word or char_wb TfidfVectorizer")
+        coef, intercept, proba = linear_weights(model)
+        return cls(
+            vocabulary=dict(vectorizer.vocabulary_),
+            idf=np.asarray(vectorizer.idf_, dtype=np.float64) if vectorizer.use_idf else None,
+            coef=coef,
+            intercept=intercept,
+            labels=label_encoder.classes_[model.classes_],
+            proba=proba,
+            analyzer=vectorizer.analyzer,
+            ngram_range=vectorizer.ngram_range,
+            sublinear_tf=vectorizer.sublinear_tf,
+            norm=vectorizer.norm
+        )
+
+    def analyze(self, text: str) -> List[str]:
+        """N-grams of one preprocessed text, as the fitted vectorizer builds them"""
+        if self.analyzer == "char_wb":
+            return char_wb_ngrams(text, self.ngram_range)
+        return word_ngrams(tokenize(text), self.ngram_range)
+
+    def tfidf_one(self, grams: List[str]) -> tuple:
+        """(columns, weights) of one document given as n-grams"""
+        vocabulary = self.vocabulary
+        counts = Counter(vocabulary[gram] for gram in grams if gram in vocabulary)
+        columns = np.fromiter(counts.keys(), dtype=np.intp, count=len(counts))
+        tf = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+        if self.sublinear_tf:
+            tf = np.log(tf) + 1
+        if self.idf is not None:
+            tf *= self.idf[columns]
+        if self.norm == "l2":
+            tf /= np.sqrt(np.dot(tf, tf))
+        elif self.norm == "l1":
+            tf /= np.abs(tf).sum()
+        return columns, tf
+
+    def decision_function_one(self, grams: List[str]) -> np.ndarray:
+        """Class scores of one document given as n-grams"""
+        columns, tf = self.tfidf_one(grams)
+        if not len(columns):
+            return self.intercept.copy()
+        return tf @ self.coef[columns] + self.intercept
+
+    def transform(self, docs: List[List[str]]) -> sparse.csr_matrix:
+        """TF-IDF matrix of documents given as n-grams, like vectorizer.transform"""
+        rows = [self.tfidf_one(grams) for grams in docs]
+        indptr = np.cumsum([0] + [len(columns) for columns, _ in rows])
+        indices = np.concatenate([columns for columns, _ in rows]) if rows else np.empty(0, dtype=np.intp)
+        data = np.concatenate([tf for _, tf in rows]) if rows else np.empty(0)
+        return sparse.csr_matrix((data, indices, indptr), shape=(len(docs), len(self.vocabulary)))
+
+    def predict_proba(self, docs: List[List[str]]) -> np.ndarray:
+        """Class probabilities for documents given as lists of n-grams"""
+        scores = np.array([self.decision_function_one(grams) for grams in docs]).reshape(len(docs), -1)
+        return scores_to_proba(scores, self.proba)
@@ -0,0 +1,247 @@
+"""
+Latency-aware model selection
+
+Sweeps n-gram range, max_features, hashing vs vocabulary features and
+logistic regression vs linear SVM. Feature matrices are built once per
+vectorizer setting and shared by both classifiers; feature building and
+fitting run in parallel with joblib. Latency is then measured one trial at a
+time on this process (parallel timing would measure contention), through
+the same engine code and artifact format the API serves:
+
+    single  _classify_category per text: n-gram build, transform, predict_proba
+    batch   _classify_batch over batch_size texts, per text
+
+The pick is the most accurate trial whose single-item p99 fits the budget
+(ties go to the faster one).
+
+Usage (from backend/):
+    python -m app.ai.model_sweep --n-jobs 4 --latency-budget-ms 1.0
+    python -m app.ai.train_model --sweep --publish tfidf_lr_v3 --activate
+"""
+import argparse
+import gc
+import itertools
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.preprocessing import LabelEncoder
+
+from .analysis import AnalyzedText
+from .engine import AITriageEngine
+from .preprocess import preprocess_text
+from .train_model import build_classifier, build_vectorizer, pruning_texts, save_model
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+SWEEP_GRID = {
+    "vectorizer": ["tfidf", "hashing"],
+    "ngram_range": [(1, 1), (1, 2), (1, 3)],
+    "max_features": [1000, 3000, None],
+    "classifier": ["lr", "svm"],
+}
+
+FEATURE_KEYS = ("vectorizer", "ngram_range", "max_features")
+
+
+def sweep_configs(grid: Dict = SWEEP_GRID) -> List[Dict]:
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*grid.values())]
+
+
+def _feature_key(config: Dict) -> tuple:
+    return tuple(config[key] for key in FEATURE_KEYS)
+
+
+def _build_features(config: Dict, train_texts: List[str], test_texts: List[str]) -> tuple:
+    vectorizer = build_vectorizer(config)
+    X_train = vectorizer.fit_transform(train_texts)
+    return vectorizer, X_train, vectorizer.transform(test_texts)
+
+
+def _fit_trial(config: Dict, features: tuple, y_train: np.ndarray, y_test: np.ndarray) -> tuple:
+    _, X_train, X_test = features
+    start = time.perf_counter()
+    model = clone(build_classifier(config)).fit(X_train, y_train)
+    fit_seconds = time.perf_counter() - start
+    return model, float((model.predict(X_test) == y_test).mean()), fit_seconds
+
+
+def measure_latency(engine: AITriageEngine, texts: List[str], samples: int = 500, batch_size: int = 64) -> Dict:
+    """
+    Classification latency of a loaded engine on already-translated texts
+
+    Returns:
+        dict: single-item p50/p95/p99 and batch per-item latency, in ms
+    """
+    analyzed = [AnalyzedText(text, language="en") for text in texts]
+    for item in analyzed:
+        item.tokens  # Tokenization is shared with the rest of triage, not model cost
+    cascade, engine.cascade = engine.cascade, False  # Time the model on every text, not the rule tier
+    engine._classify_batch(analyzed)  # Warm up
+
+    timings = np.empty(samples)
+    gc.disable()
+    try:
+        for i in range(samples):
+            item = analyzed[i % len(analyzed)]
+            start = time.perf_counter()
+            engine._classify_category(item)
+            timings[i] = time.perf_counter() - start
+
+        batch = [analyzed[i % len(analyzed)] for i in range(batch_size)]
+        rounds = max(1, samples // batch_size)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            engine._classify_batch(batch)
+        batch_ms = (time.perf_counter() - start) / (rounds * batch_size) * 1000
+    finally:
+        gc.enable()
+        engine.cascade = cascade
+
+    p50, p95, p99 = np.percentile(timings * 1000, [50, 95, 99])
+    return {"p50_ms": p50, "p95_ms": p95, "p99_ms": p99, "batch_ms_per_item": batch_ms}
+
+
+def select_trial(trials: List[Dict], latency_budget_ms: float) -> Optional[Dict]:
+    """Most accurate trial within the p99 budget; ties go to the lower p99"""
+    within = [trial for trial in trials if trial["p99_ms"] <= latency_budget_ms]
+    if not within:
+        return None
+    return max(within, key=lambda trial: (trial["test_accuracy"], -trial["p99_ms"]))
+
+
+def run_sweep(
+    grid: Dict = SWEEP_GRID,
+    latency_budget_ms: float = settings.TRIAGE_LATENCY_BUDGET_MS,
+    n_jobs: int = -1,
+    latency_samples: int = 500
+) -> Dict:
+    """
+    Train, score and time every config in the grid
+
+    Returns:
+        dict: All trials (accuracy, latency, artifact format) and the selected config
+    """
+    train_df = pd.read_csv("data/complaints_train.csv")
+    test_df = pd.read_csv("data/complaints_test.csv")
+    train_texts = [preprocess_text(text) for text in train_df["text"]]
+    test_texts = [preprocess_text(text) for text in test_df["text"]]
+
+    label_encoder = LabelEncoder()
+    y_train = label_encoder.fit_transform(train_df["category"])
+    y_test = label_encoder.transform(test_df["category"])
+
+    sample_texts, check_texts = pruning_texts(train_texts, test_texts)
+
+    configs = sweep_configs(grid)
+    feature_configs = {_feature_key(config): config for config in configs}
+
+    start = time.perf_counter()
+    built = Parallel(n_jobs=n_jobs)(
+        delayed(_build_features)(config, train_texts, test_texts) for config in feature_configs.values()
+    )
+    features = dict(zip(feature_configs, built))
+    fitted = Parallel(n_jobs=n_jobs)(
+        delayed(_fit_trial)(config, features[_feature_key(config)], y_train, y_test) for config in configs
+    )
+    logger.info(
+        f"Fitted {len(configs)} trials on {len(features)} feature sets in {time.perf_counter() - start:.1f}s"
+    )
+
+    trials = []
+    for config, (model, accuracy, fit_seconds) in zip(configs, fitted):
+        vectorizer = features[_feature_key(config)][0]
+        with tempfile.TemporaryDirectory() as staging:
+            save_model(
+                vectorizer, model, label_encoder, staging, model_version="sweep",
+                sample_texts=sample_texts, check_texts=check_texts
+            )
+            engine = AITriageEngine(staging)
+            latency = measure_latency(engine, test_df["text"].tolist(), samples=latency_samples)
+
+        trial = {
+            **config,
+            "ngram_range": list(config["ngram_range"]),
+            "test_accuracy": accuracy,
+            "fit_seconds": fit_seconds,
+            "model_format": engine.model_format,
+            **latency,
+        }
+        trials.append(trial)
+        logger.info(
+            f"{_describe(config)}: accuracy {accuracy:.3f}, p99 {latency['p99_ms']:.3f} ms ({engine.model_format})"
+        )
+
+    selected = select_trial(trials, latency_budget_ms)
+    return {
+        "latency_budget_ms": latency_budget_ms,
+        "train_samples": len(train_texts),
+        "test_samples": len(test_texts),
+        "trials": trials,
+        "selected": {key: selected[key] for key in grid} if selected else None,
+        "selected_metrics": selected,
+    }
+
+
+def _describe(config: Dict) -> str:
+    return (
+        f"{config['vectorizer']} {tuple(config['ngram_range'])} "
+        f"max_features={config['max_features']} {config['classifier']}"
+    )
+
+
+def print_report(result: Dict) -> None:
+    header = (
+        f"{'vectorizer':<9}{'ngrams':>8}{'max_feat':>10}{'clf':>5}{'format':>9}"
+        f"{'acc':>7}{'p50 ms':>9}{'p99 ms':>9}{'batch ms':>10}"
+    )
+    print(header)
+    print("-" * len(header))
+    selected = result["selected"]
+    for trial in sorted(result["trials"], key=lambda t: (-t["test_accuracy"], t["p99_ms"])):
+        marker = "  <- selected" if selected and all(trial[key] == selected[key] for key in selected) else ""
+        over = "*" if trial["p99_ms"] > result["latency_budget_ms"] else " "
+        print(
+            f"{trial['vectorizer']:<9}{str(tuple(trial['ngram_range'])):>8}{str(trial['max_features']):>10}"
+            f"{trial['classifier']:>5}{trial['model_format']:>9}{trial['test_accuracy']:>7.3f}"
+            f"{trial['p50_ms']:>9.3f}{trial['p99_ms']:>8.3f}{over}{trial['batch_ms_per_item']:>10.4f}{marker}"
+        )
+    print(f"\n* over the {result['latency_budget_ms']} ms p99 budget")
+    if selected is None:
+        print("No trial fits the latency budget")
+
+
+def write_report(result: Dict, path: str) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description="Accuracy/latency sweep over triage model configs")
+    parser.add_argument("--latency-budget-ms", type=float, default=settings.TRIAGE_LATENCY_BUDGET_MS,
+                        help="Single-item p99 classification budget")
+    parser.add_argument("--n-jobs", type=int, default=-1, help="Parallel jobs for feature building and fitting")
+    parser.add_argument("--latency-samples", type=int, default=500)
+    parser.add_argument("--report", default="./cache/model_sweep.json", help="JSON file for all trials")
+    args = parser.parse_args()
+
+    result = run_sweep(
+        latency_budget_ms=args.latency_budget_ms,
+        n_jobs=args.n_jobs,
+        latency_samples=args.latency_samples
+    )
+    print_report(result)
+    write_report(result, args.report)
+    print(f"\nReport written to {args.report}")
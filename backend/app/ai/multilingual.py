@@ -0,0 +1,114 @@
+"""
+Multilingual char n-gram classifier
+
+preprocess_text keeps ASCII only, so regional-language complaints need a
+translation call before the English model can classify them, and reach it
+empty when translation fails. This model classifies the original text:
+character n-grams inside words (TF-IDF "char_wb") over Unicode-normalized
+text, with a logistic regression on top. It is stored as a compact artifact
+in <model version>/multilingual/ and served without scikit-learn.
+
+Usage (from backend/):
+    python data/generate_multilingual.py
+    python -m app.ai.multilingual
+"""
+import argparse
+import logging
+import os
+from typing import Optional
+
+import pandas as pd
+
+from .artifact import CompactModel, export_compact_model
+from .preprocess import preprocess_multilingual
+
+logger = logging.getLogger(__name__)
+
+MULTILINGUAL_DIR = "multilingual"
+TRAIN_PATH = "data/complaints_multilingual_train.csv"
+TEST_PATH = "data/complaints_multilingual_test.csv"
+
+
+def load_multilingual_model(model_path: str) -> Optional[CompactModel]:
+    """The multilingual artifact of a model version, or None if it has none"""
+    path = f"{model_path}/{MULTILINGUAL_DIR}"
+    if not CompactModel.exists(path):
+        return None
+    return CompactModel.load(path)
+
+
+def classify_native(model: CompactModel, texts: list) -> list:
+    """(category, confidence) per original-language text"""
+    proba = model.predict_proba(model.transform_texts([preprocess_multilingual(text) for text in texts]))
+    best = proba.argmax(axis=1)
+    return [(str(model.labels[i]), float(row[i])) for row, i in zip(proba, best)]
+
+
+def train_multilingual_model(output_dir: str = "app/ai/models", model_version: Optional[str] = None) -> float:
+    """
+    Train the char n-gram model on the multilingual dataset and export it
+
+    Returns:
+        float: Accuracy on the held-out-template test set
+    """
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.metrics import accuracy_score, classification_report
+    from sklearn.preprocessing import LabelEncoder
+    from .engine import AITriageEngine
+
+    if not os.path.exists(TRAIN_PATH):
+        print("ERROR: Multilingual data not found. Run data/generate_multilingual.py first")
+        return None
+
+    train_df = pd.read_csv(TRAIN_PATH)
+    test_df = pd.read_csv(TEST_PATH)
+    train_texts = train_df["text"].apply(preprocess_multilingual).tolist()
+    test_texts = test_df["text"].apply(preprocess_multilingual).tolist()
+    print(f"Loaded {len(train_df)} training, {len(test_df)} test samples "
+          f"({train_df['language'].nunique()} languages)")
+
+    label_encoder = LabelEncoder()
+    y_train = label_encoder.fit_transform(train_df["category"])
+    y_test = label_encoder.transform(test_df["category"])
+
+    vectorizer = TfidfVectorizer(
+        analyzer="char_wb",
+        ngram_range=(2, 4),
+        max_features=20000,
+        sublinear_tf=True,
+        strip_accents=None
+    )
+    X_train = vectorizer.fit_transform(train_texts)
+    X_test = vectorizer.transform(test_texts)
+    print(f"Feature matrix shape: {X_train.shape}")
+
+    model = LogisticRegression(max_iter=3000, C=5.0, class_weight="balanced", random_state=42)
+    model.fit(X_train, y_train)
+
+    y_pred = model.predict(X_test)
+    accuracy = accuracy_score(y_test, y_pred)
+    print(f"Test Accuracy: {accuracy:.3f}")
+    print(classification_report(y_test, y_pred, target_names=label_encoder.classes_))
+    for language, group in test_df.assign(correct=y_pred == y_test).groupby("language"):
+        print(f"  {language:<8} {group['correct'].mean():.3f}")
+
+    path = f"{output_dir}/{MULTILINGUAL_DIR}"
+    manifest = export_compact_model(
+        vectorizer, model, label_encoder, path,
+        model_version=model_version or AITriageEngine.model_version,
+        sample_texts=train_texts,
+        check_texts=test_texts
+    )
+    print(f"Multilingual model exported to {path}/ ({manifest['n_features']} features)")
+    return accuracy
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description="Train the multilingual char n-gram triage model")
+    parser.add_argument("--output-dir", default="app/ai/models", help="Model version directory")
+    args = parser.parse_args()
+
+    train_multilingual_model(args.output_dir)
@@ -0,0 +1,266 @@
+"""
+Online learning from officer corrections
+
+When an officer re-categorizes a complaint, a correction event is stored in
+db.triage_corrections. This learner consumes those events in mini-batches and
+updates an SGD logistic-regression model with partial_fit over a stateless
+HashingVectorizer, so no retrain over the whole corpus is needed. Each update
+mixes in a bounded reservoir of earlier examples so a burst of corrections
+for one category does not wash out the others.
+
+Memory is fixed: n_features x n_classes weights, a replay reservoir of at most
+replay_size texts and one mini-batch.
+
+Every publish_every events the model is checked on the holdout set and, if it
+is accurate enough, published to the model registry as a new active version.
+APIs pick it up through the admin reload or MODEL_REGISTRY_POLL_SECONDS.
+
+Usage (from backend/):
+    python -m app.ai.online_learner bootstrap
+    python -m app.ai.online_learner run --publish-every 500
+"""
+import argparse
+import asyncio
+import logging
+import os
+import random
+import tempfile
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import SGDClassifier
+from sklearn.preprocessing import LabelEncoder
+
+from .keywords import CATEGORY_KEYWORDS
+from .preprocess import TOKEN_PATTERN, preprocess_text
+from .registry import ModelRegistry, model_registry
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CATEGORIES = sorted(CATEGORY_KEYWORDS)
+
+
+class OnlineLearner:
+    """HashingVectorizer + SGDClassifier(log_loss) trained with partial_fit"""
+
+    def __init__(
+        self,
+        categories: Sequence[str] = CATEGORIES,
+        n_features: int = 2 ** 18,
+        ngram_range: tuple = (1, 2),
+        alpha: float = 1e-5,
+        replay_size: int = 5000,
+        replay_ratio: float = 1.0,
+        random_state: int = 42
+    ):
+        self.vectorizer = HashingVectorizer(
+            n_features=n_features,
+            ngram_range=ngram_range,
+            alternate_sign=False,
+            norm="l2",
+            token_pattern=TOKEN_PATTERN.pattern
+        )
+        self.label_encoder = LabelEncoder().fit(list(categories))
+        self.model = SGDClassifier(loss="log_loss", alpha=alpha, random_state=random_state)
+        self.classes = np.arange(len(self.label_encoder.classes_))
+
+        self.replay_size = replay_size
+        self.replay_ratio = replay_ratio
+        self.replay: List[tuple] = []
+        self._rng = random.Random(random_state)
+
+        self.examples_seen = 0
+        self.events_since_publish = 0
+        self.published_versions: List[str] = []
+
+    def knows(self, category: str) -> bool:
+        return category in self.label_encoder.classes_
+
+    def learn(self, texts: Sequence[str], categories: Sequence[str]) -> int:
+        """
+        One partial_fit step on a mini-batch, mixed with replayed examples
+
+        Returns:
+            int: Number of examples learned (unknown categories are skipped)
+        """
+        batch = [
+            (preprocess_text(text), category)
+            for text, category in zip(texts, categories)
+            if self.knows(category)
+        ]
+        if not batch:
+            return 0
+
+        replay_count = min(len(self.replay), int(len(batch) * self.replay_ratio))
+        training = batch + self._rng.sample(self.replay, replay_count)
+
+        X = self.vectorizer.transform([text for text, _ in training])
+        y = self.label_encoder.transform([category for _, category in training])
+        self.model.partial_fit(X, y, classes=self.classes)
+
+        for example in batch:
+            self._remember(example)
+        self.events_since_publish += len(batch)
+        return len(batch)
+
+    def _remember(self, example: tuple) -> None:
+        """Reservoir sampling keeps a uniform sample of everything seen"""
+        self.examples_seen += 1
+        if len(self.replay) < self.replay_size:
+            self.replay.append(example)
+        else:
+            slot = self._rng.randrange(self.examples_seen)
+            if slot < self.replay_size:
+                self.replay[slot] = example
+
+    def bootstrap(self, texts: Sequence[str], categories: Sequence[str], epochs: int = 10, batch_size: int = 64) -> None:
+        """Initial passes over a labelled corpus (e.g. the training CSV)"""
+        order = list(range(len(texts)))
+        for _ in range(epochs):
+            self._rng.shuffle(order)
+            for start in range(0, len(order), batch_size):
+                chunk = order[start:start + batch_size]
+                self.learn([texts[i] for i in chunk], [categories[i] for i in chunk])
+        self.events_since_publish = 0
+
+    def accuracy(self, texts: Sequence[str], categories: Sequence[str]) -> float:
+        X = self.vectorizer.transform([preprocess_text(text) for text in texts])
+        y = self.label_encoder.transform(list(categories))
+        return float((self.model.predict(X) == y).mean())
+
+    def export(self, path: str) -> None:
+        """Write the artifacts AITriageEngine loads (joblib layout)"""
+        os.makedirs(path, exist_ok=True)
+        joblib.dump(self.vectorizer, f"{path}/tfidf_vectorizer.joblib")
+        joblib.dump(self.model, f"{path}/category_model.joblib")
+        joblib.dump(self.label_encoder, f"{path}/label_encoder.joblib")
+
+    def publish(self, registry: ModelRegistry, metrics: Optional[Dict] = None, activate: bool = True) -> str:
+        """Publish the current weights as a new registry version"""
+        version = f"online_sgd_{datetime.utcnow():%Y%m%d%H%M%S}"
+        with tempfile.TemporaryDirectory() as staging:
+            self.export(staging)
+            registry.publish(version, staging, metrics=metrics, activate=activate)
+        self.published_versions.append(version)
+        self.events_since_publish = 0
+        return version
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        joblib.dump(self, tmp_path)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def load(path: str) -> "OnlineLearner":
+        return joblib.load(path)
+
+
+def load_corpus(path: str) -> tuple:
+    df = pd.read_csv(path)
+    return df["text"].tolist(), df["category"].tolist()
+
+
+def bootstrap_learner(state_path: str) -> OnlineLearner:
+    """Fresh learner trained on the training CSV"""
+    learner = OnlineLearner()
+    learner.bootstrap(*load_corpus("data/complaints_train.csv"))
+    learner.save(state_path)
+    logger.info(f"Bootstrapped online learner ({learner.examples_seen} examples), saved to {state_path}")
+    return learner
+
+
+# ==================== CORRECTION STREAM ====================
+
+async def consume_corrections(
+    learner: OnlineLearner,
+    state_path: str,
+    registry: ModelRegistry = model_registry,
+    batch_size: int = 64,
+    publish_every: int = 500,
+    min_accuracy: float = 0.85,
+    poll_seconds: float = 30.0,
+    once: bool = False
+) -> None:
+    """
+    Learn from unconsumed db.triage_corrections events and publish periodically
+
+    Args:
+        publish_every: Events between publish attempts
+        min_accuracy: Holdout accuracy a version needs to be published
+        once: Drain the queue once and return instead of polling forever
+    """
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    client = AsyncIOMotorClient(settings.MONGO_URI)
+    corrections = client[settings.DB_NAME].triage_corrections
+    holdout = load_corpus("data/complaints_test.csv")
+
+    try:
+        while True:
+            events = await corrections.find({"consumed_at": None}).sort("_id", 1).to_list(batch_size)
+            if events:
+                learned = learner.learn(
+                    [event["text"] for event in events],
+                    [event["corrected_category"] for event in events]
+                )
+                await corrections.update_many(
+                    {"_id": {"$in": [event["_id"] for event in events]}},
+                    {"$set": {"consumed_at": datetime.utcnow()}}
+                )
+                learner.save(state_path)
+                logger.info(f"Learned {learned}/{len(events)} corrections ({learner.events_since_publish} since publish)")
+
+            if learner.events_since_publish >= publish_every:
+                accuracy = learner.accuracy(*holdout)
+                if accuracy >= min_accuracy:
+                    version = learner.publish(registry, metrics={
+                        "test_accuracy": round(accuracy, 4),
+                        "examples_seen": learner.examples_seen
+                    })
+                    learner.save(state_path)
+                    logger.info(f"Published {version} (holdout accuracy {accuracy:.3f})")
+                else:
+                    logger.warning(f"Holdout accuracy {accuracy:.3f} below {min_accuracy}, not publishing")
+                    learner.events_since_publish = 0
+
+            if not events:
+                if once:
+                    return
+                await asyncio.sleep(poll_seconds)
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description="Incremental triage model from officer corrections")
+    parser.add_argument("command", choices=["bootstrap", "run"])
+    parser.add_argument("--state", default=settings.ONLINE_LEARNER_STATE_PATH, help="Learner state file")
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--publish-every", type=int, default=500)
+    parser.add_argument("--min-accuracy", type=float, default=0.85)
+    parser.add_argument("--poll-seconds", type=float, default=30.0)
+    parser.add_argument("--once", action="store_true", help="Drain pending corrections and exit")
+    args = parser.parse_args()
+
+    if args.command == "bootstrap" or not os.path.exists(args.state):
+        learner = bootstrap_learner(args.state)
+    else:
+        learner = OnlineLearner.load(args.state)
+
+    if args.command == "run":
+        asyncio.run(consume_corrections(
+            learner, args.state,
+            batch_size=args.batch_size,
+            publish_every=args.publish_every,
+            min_accuracy=args.min_accuracy,
+            poll_seconds=args.poll_seconds,
+            once=args.once
+        ))
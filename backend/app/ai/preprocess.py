@@ -1,17 +1,117 @@
 import re
+import unicodedata
+
+# URLs, emails and Indian phone numbers, removed in one pass.
+# URLs run to the end of their whitespace-delimited token. An email removes the
+# whole token when its "@" falls before any URL start in that token, which
+# matches removing URLs first and then emails.
+_URL_START = r'(?:http|www)\S'
+_REMOVAL_PATTERN = re.compile(
+    r'(?<!\S)(?:(?!' + _URL_START + r')\S)+@(?!' + _URL_START + r')\S+'  # Emails
+    r'|http\S+|www\S+'  # URLs
+    r'|(?:\+91|0)?[6-9]\d{9}'  # Phone numbers
+)
+_PHONE_HINT = re.compile(r'[6-9]\d{9}')
+
+# ASCII characters dropped after normalization (everything but alphanumerics, whitespace and .,!?)
+_DELETE_BYTES = bytes(c for c in range(128) if not (chr(c).isalnum() or chr(c).isspace() or chr(c) in ".,!?"))
+
+# Same token pattern as the TF-IDF vectorizer's default word analyzer
+TOKEN_PATTERN = re.compile(r"(?u)\b\w\w+\b")
+
+# Common stop words ignored when comparing complaints for duplicates
+DEDUP_STOP_WORDS = {
+    'the', 'is', 'at', 'which', 'on', 'a', 'an', 'and', 'or', 'but',
+    'in', 'with', 'to', 'for', 'of', 'as', 'by', 'this', 'that',
+    'from', 'are', 'was', 'were', 'been', 'be', 'have', 'has', 'had'
+}
 
 def preprocess_text(text: str) -> str:
-    """Clean and normalize complaint text"""
+    """
+    Clean and normalize complaint text
+    
+    Fused equivalent of the original chain of seven re.sub calls
+    (URLs, emails, phones, whitespace, non-ASCII, punctuation, whitespace):
+    one combined regex for the removals, then str.split/join for whitespace
+    and a bytes delete table for everything outside [a-z0-9 .,!?].
+    """
+    if not text:
+        return ""
+    
+    text = text.lower()
+    
+    # Skip the removal regex entirely for the common case of plain text
+    if "@" in text or "http" in text or "www" in text or _PHONE_HINT.search(text):
+        text = _REMOVAL_PATTERN.sub("", text)
+    
+    text = " ".join(text.split())  # Collapse whitespace
+    text = text.encode("ascii", "ignore").translate(None, _DELETE_BYTES).decode("ascii")  # Remove emojis / symbols
+    
+    return text.strip()
+
+def preprocess_multilingual(text: str) -> str:
+    """
+    Unicode-aware normalization for the multilingual char n-gram model
+    
+    Same URL/email/phone removal and lowercasing as preprocess_text, but
+    letters and combining marks of every script are kept (NFC-normalized);
+    punctuation, symbols and control characters become spaces.
+    """
+    if not text:
+        return ""
+    
+    text = unicodedata.normalize("NFC", text.lower())
+    if "@" in text or "http" in text or "www" in text or _PHONE_HINT.search(text):
+        text = _REMOVAL_PATTERN.sub("", text)
+    
+    text = "".join(" " if unicodedata.category(c)[0] in "PSCZ" else c for c in text)
+    return " ".join(text.split())
+
+def tokenize(text: str) -> list:
+    """Split normalized text into word tokens (matches the TF-IDF analyzer)"""
+    return TOKEN_PATTERN.findall(text)
+
+def word_ngrams(tokens: list, ngram_range: tuple = (1, 1)) -> list:
+    """Build word n-grams from tokens the same way the TF-IDF analyzer does"""
+    min_n, max_n = ngram_range
+    ngrams = list(tokens) if min_n == 1 else []
+    
+    for n in range(max(min_n, 2), min(max_n, len(tokens)) + 1):
+        for i in range(len(tokens) - n + 1):
+            ngrams.append(" ".join(tokens[i:i + n]))
+    
+    return ngrams
+
+def char_wb_ngrams(text: str, ngram_range: tuple = (2, 4)) -> list:
+    """Character n-grams inside space-padded words, like the TF-IDF "char_wb" analyzer"""
+    min_n, max_n = ngram_range
+    ngrams = []
+    
+    for word in text.split():
+        word = f" {word} "
+        length = len(word)
+        for n in range(min_n, max_n + 1):
+            offset = 0
+            ngrams.append(word[offset:offset + n])
+            while offset + n < length:
+                offset += 1
+                ngrams.append(word[offset:offset + n])
+            if offset == 0:  # A word shorter than n is counted once
+                break
+    
+    return ngrams
+
+def clean_text_for_comparison(text: str) -> str:
+    """Lowercase and strip punctuation for duplicate comparison"""
     if not text:
         return ""
     
     text = text.lower()
-    text = re.sub(r'http\S+|www\S+', '', text)  # Remove URLs
-    text = re.sub(r'\S+@\S+', '', text)  # Remove emails
-    text = re.sub(r'(\+91|0)?[6-9]\d{9}', '', text)  # Remove phone numbers
-    text = re.sub(r'\s+', ' ', text)  # Remove extra whitespace
-    text = re.sub(r'[^\x00-\x7F]+', '', text)  # Remove emojis
-    text = re.sub(r'[^a-zA-Z0-9\s\.\,\!\?]', '', text)  # Keep alphanumeric
-    text = text.strip()
-    
-    return text
+    text = re.sub(r'[^\w\s]', ' ', text)
+    text = re.sub(r'\s+', ' ', text)
+    
+    return text.strip()
+
+def extract_comparison_keywords(clean_text: str) -> set:
+    """Extract significant words from text already cleaned for comparison"""
+    return {word for word in clean_text.split() if len(word) > 3 and word not in DEDUP_STOP_WORDS}
@@ -0,0 +1,128 @@
+"""
+Versioned model registry
+
+Model versions live under one root directory (app/ai/models by default),
+described by registry.json:
+
+    {
+      "active": "tfidf_lr_v2",
+      "versions": {
+        "tfidf_lr_v1": {"path": ".", "created_at": "...", "metrics": {...}},
+        "tfidf_lr_v2": {"path": "versions/tfidf_lr_v2", ...}
+      }
+    }
+
+Each version path holds the joblib files and/or the compact artifact.
+Without a registry.json the root itself is served as DEFAULT_VERSION.
+"""
+import json
+import logging
+import os
+import shutil
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+REGISTRY_FILE = "registry.json"
+VERSIONS_DIR = "versions"
+DEFAULT_VERSION = "tfidf_lr_v1"
+
+
+class ModelNotFound(KeyError):
+    """Raised when a requested version is not in the registry"""
+
+
+class ModelRegistry:
+    """Reads and updates registry.json; versions are immutable once published"""
+
+    def __init__(self, root: str = "app/ai/models"):
+        self.root = root
+        self._lock = threading.Lock()
+
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(self.root, REGISTRY_FILE)
+
+    def manifest(self) -> Dict:
+        """Current registry contents (re-read on every call so other workers see updates)"""
+        if not os.path.exists(self.manifest_path):
+            return {"active": DEFAULT_VERSION, "versions": {DEFAULT_VERSION: {"path": "."}}}
+        with open(self.manifest_path) as f:
+            return json.load(f)
+
+    def active_version(self) -> str:
+        return self.manifest()["active"]
+
+    def resolve(self, version: Optional[str] = None) -> Tuple[str, str]:
+        """
+        Find the artifact directory of a version
+
+        Args:
+            version: Version name, or None for the active version
+
+        Returns:
+            tuple: (version, path)
+        """
+        manifest = self.manifest()
+        version = version or manifest["active"]
+        entry = manifest["versions"].get(version)
+        if entry is None:
+            raise ModelNotFound(f"Model version {version} is not registered")
+        return version, os.path.normpath(os.path.join(self.root, entry["path"]))
+
+    def publish(
+        self,
+        version: str,
+        source_dir: str,
+        metrics: Optional[Dict] = None,
+        activate: bool = False
+    ) -> str:
+        """
+        Copy a directory of artifacts into the registry as a new version
+
+        Returns:
+            str: Path of the published version
+        """
+        with self._lock:
+            manifest = self.manifest()
+            if version in manifest["versions"]:
+                raise ValueError(f"Model version {version} already exists")
+
+            relative_path = os.path.join(VERSIONS_DIR, version)
+            target = os.path.join(self.root, relative_path)
+            shutil.copytree(source_dir, target)
+
+            manifest["versions"][version] = {
+                "path": relative_path,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "metrics": metrics or {}
+            }
+            if activate:
+                manifest["active"] = version
+            self._write(manifest)
+
+        logger.info(f"Published model {version} to {target}")
+        return target
+
+    def activate(self, version: str) -> None:
+        """Mark a published version as the one workers should serve"""
+        with self._lock:
+            manifest = self.manifest()
+            if version not in manifest["versions"]:
+                raise ModelNotFound(f"Model version {version} is not registered")
+            manifest["active"] = version
+            self._write(manifest)
+
+    def _write(self, manifest: Dict) -> None:
+        """Atomic replace, so readers never see a half-written file"""
+        tmp_path = f"{self.manifest_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+
+# Singleton instance
+model_registry = ModelRegistry(settings.MODEL_REGISTRY_PATH)
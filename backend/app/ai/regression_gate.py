@@ -0,0 +1,281 @@
+"""
+Accuracy and latency regression gate
+
+Runs an engine over the evaluation sets and compares the results with a
+stored baseline (data/regression_baseline.json):
+
+    test          data/complaints_test.csv
+    holdout       data/complaints_holdout.csv, variations of the test templates
+    multilingual  data/complaints_multilingual_test.csv (when the model has
+                  a multilingual artifact)
+
+Category accuracy is measured against the labels. There are no urgency
+labels, so the baseline pins the urgency level of every text and urgency
+agreement is measured against those. Latency is AITriageEngine.process per
+complaint on the holdout: every text is timed in each of --repeats passes
+and its fastest time counts, to keep scheduling noise out of the comparison.
+Latency baselines only compare on the machine that recorded them, and a
+latency check only fails when it is over both the relative tolerance and an
+absolute floor: sub-millisecond timings jitter by more than 25% between runs.
+
+Translation uses a stub backend (returns the input), so the gate does not
+depend on the network.
+
+Exit status is 1 on any regression beyond the tolerances, or when there is
+no baseline for the evaluation sets.
+
+Usage (from backend/):
+    python -m app.ai.regression_gate --model-path app/ai/models
+    python -m app.ai.regression_gate --update-baseline
+    python -m app.ai.train_model --publish tfidf_lr_v3 --gate --activate
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import platform
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from . import lang
+from .engine import AITriageEngine
+from .lang import StubTranslationBackend, TranslationService
+from .multilingual import TEST_PATH as MULTILINGUAL_TEST_PATH
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+BASELINE_PATH = "data/regression_baseline.json"
+DATASETS = {
+    "test": "data/complaints_test.csv",
+    "holdout": "data/complaints_holdout.csv",
+    "multilingual": MULTILINGUAL_TEST_PATH,
+}
+LATENCY_DATASET = "holdout"
+
+# Largest allowed drops (absolute) and latency increase (relative, and at least latency_floor_ms)
+DEFAULT_TOLERANCES = {
+    "category_accuracy": 0.01,
+    "urgency_agreement": 0.02,
+    "latency": 0.25,
+    "latency_floor_ms": 0.5,
+}
+
+
+def _texts_hash(texts: List[str]) -> str:
+    return hashlib.sha256("\n".join(texts).encode("utf-8")).hexdigest()
+
+
+def _timed_pass(engine: AITriageEngine, texts: List[str]) -> tuple:
+    """(results, per-text seconds) of one process() pass"""
+    results, seconds = [], np.empty(len(texts))
+    for i, text in enumerate(texts):
+        start = time.perf_counter()
+        results.append(engine.process(text))
+        seconds[i] = time.perf_counter() - start
+    return results, seconds
+
+
+def evaluate(engine: AITriageEngine, datasets: Dict[str, str] = DATASETS, repeats: int = 3) -> Dict:
+    """
+    Accuracy, urgency levels and latency of an engine on the evaluation sets
+
+    Returns:
+        dict: {"datasets": {name: metrics}, "latency": {...}} in baseline format
+    """
+    lang.translation_service = TranslationService(StubTranslationBackend(), timeout=5.0)
+    engine.warmup()
+
+    evaluated = {}
+    latency = None
+    for name, path in datasets.items():
+        if not os.path.exists(path):
+            logger.warning(f"Skipping {name}: {path} not found")
+            continue
+        if name == "multilingual" and engine.multilingual_model is None:
+            continue
+        df = pd.read_csv(path)
+        texts = df["text"].tolist()
+
+        results, seconds = _timed_pass(engine, texts)
+        evaluated[name] = {
+            "path": path,
+            "size": len(texts),
+            "texts_sha256": _texts_hash(texts),
+            "category_accuracy": float(np.mean([r["category"] == c for r, c in zip(results, df["category"])])),
+            # First letter of each urgency level (HIGH/MEDIUM/LOW), one per text
+            "urgency": "".join(r["urgency_level"][0] for r in results),
+        }
+
+        if name == LATENCY_DATASET:
+            passes = np.vstack([seconds] + [_timed_pass(engine, texts)[1] for _ in range(repeats - 1)])
+            fastest = passes.min(axis=0) * 1000
+            p50, p95 = np.percentile(fastest, [50, 95])
+            latency = {
+                "dataset": name,
+                "repeats": repeats,
+                "p50_ms": float(p50),
+                "p95_ms": float(p95),
+                "mean_ms": float(fastest.mean()),
+            }
+
+    return {
+        "model": {"version": engine.model_version, "format": engine.model_format},
+        "environment": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "datasets": evaluated,
+        "latency": latency,
+    }
+
+
+def compare(current: Dict, baseline: Dict, tolerances: Dict = DEFAULT_TOLERANCES) -> List[Dict]:
+    """
+    One check per metric; "passed" is False for regressions beyond tolerance
+
+    A dataset whose texts changed since the baseline cannot be compared and
+    fails its checks; so does a baseline dataset the run did not evaluate.
+    """
+    checks = []
+    for name, reference in baseline["datasets"].items():
+        metrics = current["datasets"].get(name)
+        if metrics is None:
+            checks.append({"check": f"{name} dataset", "baseline": None, "current": None, "passed": False,
+                           "note": "in the baseline but not evaluated"})
+            continue
+        if reference["texts_sha256"] != metrics["texts_sha256"]:
+            checks.append({"check": f"{name} baseline", "baseline": None, "current": None, "passed": False,
+                           "note": "no baseline for these texts, run with --update-baseline"})
+            continue
+
+        accuracy_drop = reference["category_accuracy"] - metrics["category_accuracy"]
+        checks.append({
+            "check": f"{name} category accuracy",
+            "baseline": reference["category_accuracy"],
+            "current": metrics["category_accuracy"],
+            "passed": accuracy_drop <= tolerances["category_accuracy"],
+        })
+        agreement = float(np.mean([a == b for a, b in zip(metrics["urgency"], reference["urgency"])]))
+        checks.append({
+            "check": f"{name} urgency agreement",
+            "baseline": 1.0,
+            "current": agreement,
+            "passed": 1.0 - agreement <= tolerances["urgency_agreement"],
+        })
+    for name in current["datasets"].keys() - baseline["datasets"].keys():
+        checks.append({"check": f"{name} baseline", "baseline": None, "current": None, "passed": False,
+                       "note": "no baseline for these texts, run with --update-baseline"})
+
+    if current["latency"] and baseline.get("latency"):
+        for metric in ("p50_ms", "p95_ms"):
+            reference, value = baseline["latency"][metric], current["latency"][metric]
+            allowed = max(reference * (1 + tolerances["latency"]), reference + tolerances.get("latency_floor_ms", 0.0))
+            checks.append({
+                "check": f"latency {metric}",
+                "baseline": reference,
+                "current": value,
+                "passed": value <= allowed,
+            })
+    return checks
+
+
+def print_checks(checks: List[Dict]) -> None:
+    header = f"{'check':<34}{'baseline':>10}{'current':>10}  result"
+    print(header)
+    print("-" * len(header))
+    for check in checks:
+        baseline = "-" if check["baseline"] is None else f"{check['baseline']:.4f}"
+        current = "-" if check["current"] is None else f"{check['current']:.4f}"
+        result = "ok" if check["passed"] else "REGRESSION"
+        if "note" in check:
+            result += f" ({check['note']})"
+        print(f"{check['check']:<34}{baseline:>10}{current:>10}  {result}")
+
+
+def load_baseline(path: str = BASELINE_PATH) -> Optional[Dict]:
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def write_baseline(result: Dict, path: str = BASELINE_PATH) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(result, f, indent=1)
+
+
+def run_gate(
+    model_path: str = "app/ai/models",
+    model_format: str = settings.TRIAGE_MODEL_FORMAT,
+    baseline_path: str = BASELINE_PATH,
+    tolerances: Dict = DEFAULT_TOLERANCES,
+    repeats: int = 3
+) -> bool:
+    """
+    Evaluate the model at model_path against the baseline and print the checks
+
+    Returns:
+        bool: True when nothing regressed
+    """
+    baseline = load_baseline(baseline_path)
+    if baseline is None:
+        print(f"No baseline at {baseline_path}; record one with --update-baseline")
+        return False
+
+    current = evaluate(AITriageEngine(model_path, model_format=model_format), repeats=repeats)
+    print(f"Model {current['model']['version']} ({current['model']['format']}) "
+          f"vs baseline {baseline['model']['version']} ({baseline['model']['format']})\n")
+    checks = compare(current, baseline, tolerances)
+    print_checks(checks)
+
+    failed = [check for check in checks if not check["passed"]]
+    print(f"\n{len(failed)} regression(s)" if failed else "\nNo regressions")
+    return not failed
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+
+    parser = argparse.ArgumentParser(description="Accuracy/latency regression gate for triage models")
+    parser.add_argument("--model-path", default="app/ai/models", help="Model version directory to evaluate")
+    parser.add_argument("--model-format", default=settings.TRIAGE_MODEL_FORMAT, choices=["compact", "joblib", "lean"])
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="Record the current results as the baseline")
+    parser.add_argument("--repeats", type=int, default=3, help="Latency passes over the holdout (fastest per text counts)")
+    parser.add_argument("--max-accuracy-drop", type=float, default=DEFAULT_TOLERANCES["category_accuracy"])
+    parser.add_argument("--max-urgency-drop", type=float, default=DEFAULT_TOLERANCES["urgency_agreement"],
+                        help="Largest share of texts whose urgency level may change")
+    parser.add_argument("--max-latency-increase", type=float, default=DEFAULT_TOLERANCES["latency"],
+                        help="Largest relative p50/p95 increase, e.g. 0.25 for +25%%")
+    parser.add_argument("--latency-floor-ms", type=float, default=DEFAULT_TOLERANCES["latency_floor_ms"],
+                        help="Latency increase in ms always allowed, whatever the relative increase")
+    args = parser.parse_args()
+
+    if args.update_baseline:
+        result = evaluate(AITriageEngine(args.model_path, model_format=args.model_format), repeats=args.repeats)
+        write_baseline(result, args.baseline)
+        print(f"Baseline for {result['model']['version']} written to {args.baseline}")
+        raise SystemExit(0)
+
+    passed = run_gate(
+        model_path=args.model_path,
+        model_format=args.model_format,
+        baseline_path=args.baseline,
+        tolerances={
+            "category_accuracy": args.max_accuracy_drop,
+            "urgency_agreement": args.max_urgency_drop,
+            "latency": args.max_latency_increase,
+            "latency_floor_ms": args.latency_floor_ms,
+        },
+        repeats=args.repeats
+    )
+    raise SystemExit(0 if passed else 1)
@@ -1,14 +1,144 @@
 import pandas as pd
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.calibration import CalibratedClassifierCV
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
 from sklearn.linear_model import LogisticRegression
 from sklearn.preprocessing import LabelEncoder
+from sklearn.svm import LinearSVC
 from sklearn.metrics import classification_report, accuracy_score, confusion_matrix
+import argparse
 import joblib
 import os
+import shutil
+import tempfile
+from .artifact import COMPACT_DIR, compact_supported, export_compact_model
+from .engine import AITriageEngine
+from .multilingual import TRAIN_PATH as MULTILINGUAL_TRAIN_PATH, train_multilingual_model
 from .preprocess import preprocess_text
+from .registry import model_registry
 
-def train_model():
-    """Train the AI triage model"""
+MODEL_DIR = "app/ai/models"
+HOLDOUT_PATH = "data/complaints_holdout.csv"
+
+# Model trained when no sweep result is given
+DEFAULT_CONFIG = {
+    "vectorizer": "tfidf",
+    "ngram_range": (1, 3),
+    "max_features": 3000,
+    "classifier": "lr"
+}
+
+def build_vectorizer(config):
+    """
+    Unfitted vectorizer for a training config
+    
+    "hashing" uses max_features as the hash space size (2**18 when None).
+    """
+    ngram_range = tuple(config["ngram_range"])
+    if config["vectorizer"] == "hashing":
+        return HashingVectorizer(
+            ngram_range=ngram_range,
+            n_features=config["max_features"] or 2 ** 18,
+            alternate_sign=False,
+            norm='l2',
+            strip_accents='unicode'
+        )
+    return TfidfVectorizer(
+        ngram_range=ngram_range,
+        max_features=config["max_features"],
+        min_df=1,
+        max_df=0.9,
+        sublinear_tf=True,
+        strip_accents='unicode'
+    )
+
+def build_classifier(config):
+    """
+    Unfitted classifier for a training config
+    
+    LinearSVC has no predict_proba; temperature calibration adds one that is
+    still a softmax over the SVM scores, so the compact artifact can serve it.
+    method='temperature' needs scikit-learn >= 1.8 (see requirements.txt).
+    """
+    if config["classifier"] == "svm":
+        return CalibratedClassifierCV(
+            LinearSVC(C=1.0, class_weight='balanced', random_state=42),
+            method='temperature',
+            cv=3,
+            ensemble=False
+        )
+    return LogisticRegression(
+        max_iter=3000,
+        C=2.0,
+        class_weight='balanced',
+        random_state=42,
+        solver='lbfgs'
+    )
+
+def pruning_texts(train_texts, test_texts):
+    """
+    (sample, check) texts for the compact export
+    
+    The pruning threshold is picked on the training texts plus every other
+    holdout text, and checked on the rest of the holdout plus the test texts.
+    """
+    holdout = []
+    if os.path.exists(HOLDOUT_PATH):
+        holdout = pd.read_csv(HOLDOUT_PATH)['text'].apply(preprocess_text).tolist()
+    return list(train_texts) + holdout[::2], holdout[1::2] + list(test_texts)
+
+def save_model(vectorizer, model, label_encoder, output_dir=MODEL_DIR, model_version=None, sample_texts=None,
+               check_texts=None):
+    """Write the joblib files, plus the compact artifact when the vectorizer supports it"""
+    os.makedirs(output_dir, exist_ok=True)
+    joblib.dump(vectorizer, f"{output_dir}/tfidf_vectorizer.joblib")
+    joblib.dump(model, f"{output_dir}/category_model.joblib")
+    joblib.dump(label_encoder, f"{output_dir}/label_encoder.joblib")
+    
+    if compact_supported(vectorizer):
+        return export_compact(
+            vectorizer, model, label_encoder, sample_texts,
+            output_dir=output_dir, model_version=model_version, check_texts=check_texts
+        )
+    # A stale compact artifact would be served instead of the new joblib files
+    shutil.rmtree(f"{output_dir}/{COMPACT_DIR}", ignore_errors=True)
+    return None
+
+def export_compact(vectorizer, model, label_encoder, sample_texts=None, output_dir=MODEL_DIR, model_version=None,
+                   check_texts=None):
+    """Write the memory-mapped artifact next to the joblib files"""
+    path = f"{output_dir}/{COMPACT_DIR}"
+    manifest = export_compact_model(
+        vectorizer, model, label_encoder, path,
+        model_version=model_version or AITriageEngine.model_version,
+        sample_texts=sample_texts,
+        check_texts=check_texts
+    )
+    print(f"Compact model exported to {path}/ ({manifest['n_features']} features, {manifest['n_classes']} classes)")
+    return manifest
+
+def export_existing_model():
+    """Export the compact artifact from the saved joblib files without retraining"""
+    vectorizer = joblib.load(f"{MODEL_DIR}/tfidf_vectorizer.joblib")
+    model = joblib.load(f"{MODEL_DIR}/category_model.joblib")
+    label_encoder = joblib.load(f"{MODEL_DIR}/label_encoder.joblib")
+    
+    texts = {}
+    for name in ("train", "test"):
+        path = f"data/complaints_{name}.csv"
+        texts[name] = pd.read_csv(path)['text'].apply(preprocess_text).tolist() if os.path.exists(path) else []
+    sample_texts, check_texts = pruning_texts(texts["train"], texts["test"])
+    return export_compact(vectorizer, model, label_encoder, sample_texts or None, check_texts=check_texts)
+
+def train_model(output_dir=MODEL_DIR, model_version=None, config=None):
+    """
+    Train the AI triage model
+    
+    Args:
+        output_dir: Directory for the joblib files and compact artifact
+        model_version: Version recorded in the compact artifact
+        config: Vectorizer/classifier settings (DEFAULT_CONFIG, or a sweep pick)
+    """
+    config = config or DEFAULT_CONFIG
     print("Loading training data...")
     
     if not os.path.exists("data/complaints_train.csv"):
@@ -42,15 +172,8 @@ def train_model():
         print(f"  {idx}: {label}")
     
     # Vectorize with improved parameters
-    print("\nCreating TF-IDF features...")
-    vectorizer = TfidfVectorizer(
-        ngram_range=(1, 3),
-        max_features=3000,
-        min_df=1,
-        max_df=0.9,
-        sublinear_tf=True,
-        strip_accents='unicode'
-    )
+    print(f"\nCreating {config['vectorizer']} features (ngram_range={tuple(config['ngram_range'])}, max_features={config['max_features']})...")
+    vectorizer = build_vectorizer(config)
     
     X_train = vectorizer.fit_transform(train_df['processed'])
     X_test = vectorizer.transform(test_df['processed'])
@@ -58,14 +181,8 @@ def train_model():
     print(f"Feature matrix shape: {X_train.shape}")
     
     # Train model with sklearn-compatible parameters
-    print("\nTraining Logistic Regression model...")
-    model = LogisticRegression(
-        max_iter=3000,
-        C=2.0,
-        class_weight='balanced',
-        random_state=42,
-        solver='lbfgs'
-    )
+    print(f"\nTraining {'calibrated linear SVM' if config['classifier'] == 'svm' else 'Logistic Regression'} model...")
+    model = build_classifier(config)
     
     model.fit(X_train, y_train)
     
@@ -97,15 +214,75 @@ def train_model():
     print(f"  Max confidence: {max_proba.max():.3f}")
     
     # Save models
-    os.makedirs("app/ai/models", exist_ok=True)
-    joblib.dump(vectorizer, "app/ai/models/tfidf_vectorizer.joblib")
-    joblib.dump(model, "app/ai/models/category_model.joblib")
-    joblib.dump(label_encoder, "app/ai/models/label_encoder.joblib")
+    sample_texts, check_texts = pruning_texts(train_df['processed'], test_df['processed'])
+    manifest = save_model(
+        vectorizer, model, label_encoder, output_dir,
+        model_version=model_version, sample_texts=sample_texts, check_texts=check_texts
+    )
+    print(f"\nModels saved successfully to {output_dir}/")
+    if manifest is None:
+        print("No compact artifact for this vectorizer; workers will load the joblib files")
     
-    print("\nModels saved successfully to app/ai/models/")
+    # The multilingual model ships with every version so published versions are self-contained
+    if os.path.exists(MULTILINGUAL_TRAIN_PATH):
+        print("\nTraining multilingual char n-gram model...")
+        train_multilingual_model(output_dir, model_version)
     print("Training complete!")
     
     return test_accuracy
 
 if __name__ == "__main__":
-    train_model()
+    parser = argparse.ArgumentParser(description="Train the triage model")
+    parser.add_argument("--export-only", action="store_true", help="Export the compact artifact from the saved joblib files")
+    parser.add_argument("--publish", metavar="VERSION", help="Train into the model registry as a new version")
+    parser.add_argument("--activate", action="store_true", help="Make the published version active")
+    parser.add_argument("--sweep", action="store_true", help="Train the most accurate config within the latency budget")
+    parser.add_argument("--latency-budget-ms", type=float, help="Single-item p99 budget for --sweep")
+    parser.add_argument("--n-jobs", type=int, default=-1, help="Parallel jobs for --sweep")
+    parser.add_argument("--gate", action="store_true", help="Publish only if the regression gate passes")
+    args = parser.parse_args()
+    
+    config = None
+    metrics = {}
+    if args.sweep and not args.export_only:
+        from .model_sweep import print_report, run_sweep
+        from ..core.config import settings
+        
+        result = run_sweep(
+            latency_budget_ms=args.latency_budget_ms or settings.TRIAGE_LATENCY_BUDGET_MS,
+            n_jobs=args.n_jobs
+        )
+        print_report(result)
+        if result["selected"] is None:
+            raise SystemExit(1)
+        config = result["selected"]
+        selected = result["selected_metrics"]
+        metrics = {
+            "config": {**config, "ngram_range": list(config["ngram_range"])},
+            "p99_ms": round(selected["p99_ms"], 4),
+            "batch_ms_per_item": round(selected["batch_ms_per_item"], 4)
+        }
+        print(f"\nSelected: {config}")
+    
+    if args.export_only:
+        export_existing_model()
+    elif args.publish:
+        with tempfile.TemporaryDirectory() as staging:
+            accuracy = train_model(staging, args.publish, config=config)
+            if accuracy is not None and args.gate:
+                from .regression_gate import run_gate
+                
+                print("\nRunning regression gate...")
+                if not run_gate(staging):
+                    print(f"Not publishing {args.publish}: regression gate failed")
+                    raise SystemExit(1)
+            if accuracy is not None:
+                path = model_registry.publish(
+                    args.publish, staging,
+                    metrics={"test_accuracy": round(float(accuracy), 4), **metrics},
+                    activate=args.activate
+                )
+                print(f"Published {args.publish} to {path}" + (" (active)" if args.activate else ""))
+                print("Reload running APIs with POST /admin/triage/models/reload")
+    else:
+        train_model(config=config)
@@ -0,0 +1,36 @@
+"""
+Entry points for triage worker processes
+
+Each worker loads the joblib models once, in the pool initializer, and then
+serves triage requests dispatched from the API process.
+"""
+import logging
+import os
+from typing import Dict, Any, List, Optional
+from .engine import AITriageEngine
+
+logger = logging.getLogger(__name__)
+
+_engine = None
+
+def init_worker(model_path: Optional[str] = None, model_version: Optional[str] = None) -> None:
+    """Pool initializer: load the models once per worker process"""
+    global _engine
+    if model_path:
+        _engine = AITriageEngine(model_path, model_version=model_version)
+    else:
+        _engine = AITriageEngine()
+    logger.info(f"Triage worker {os.getpid()} ready ({_engine.model_version})")
+
+def warmup() -> int:
+    """Run one sample inference so the first real request is not cold"""
+    _engine.warmup()
+    return os.getpid()
+
+def process(text: str, language: str = "auto") -> Dict[str, Any]:
+    """Triage a single complaint in the worker"""
+    return _engine.process(text, language)
+
+def process_batch(texts: List[str], languages: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """Triage a batch of complaints in the worker"""
+    return _engine.process_batch(texts, languages)
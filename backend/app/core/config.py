@@ -27,6 +27,73 @@ class Settings(BaseSettings):
     # AI Service
     AI_SERVICE_URL: str = "http://localhost:8001"
     
+    # Triage model artifact: compact (memory-mapped .npy, falls back if missing), joblib,
+    # or lean (joblib weights evaluated with plain NumPy, exact to sklearn)
+    TRIAGE_MODEL_FORMAT: str = "compact"
+    
+    # Model registry (versioned artifacts + registry.json); poll 0 = reload only on admin request
+    MODEL_REGISTRY_PATH: str = "app/ai/models"
+    MODEL_REGISTRY_POLL_SECONDS: float = 0.0
+    
+    # Single-item p99 classification budget used by the model sweep (app/ai/model_sweep.py)
+    TRIAGE_LATENCY_BUDGET_MS: float = 1.0
+    
+    # Online learner state (weights + replay reservoir), see app/ai/online_learner.py
+    ONLINE_LEARNER_STATE_PATH: str = "./cache/online_learner.joblib"
+    
+    # Multilingual char n-gram model: classify non-English text natively and only
+    # translate when its confidence is below the threshold (or it is missing)
+    TRIAGE_MULTILINGUAL: bool = True
+    MULTILINGUAL_MIN_CONFIDENCE: float = 0.4
+    
+    # Triage cascade: whole-word keyword rules settle unambiguous English text before the
+    # model (distinct keywords, lead over the runner-up category); rule hits report
+    # CASCADE_RULE_CONFIDENCE, about the rule tier's precision on the training set
+    TRIAGE_CASCADE: bool = True
+    CASCADE_RULE_MIN_HITS: int = 2
+    CASCADE_RULE_MARGIN: int = 2
+    CASCADE_RULE_CONFIDENCE: float = 0.95
+    
+    # Duplicate detection index of open complaints per category, kept in sync through
+    # complaints.updated_at: minhash (LSH over shingles), tfidf (cosine of the triage
+    # vectorizer's TF-IDF rows) or none (scan the first 100 open complaints). The best
+    # DEDUP_CANDIDATES above the minimum similarity are fetched and re-ranked with
+    # SequenceMatcher + keyword overlap; without re-ranking the index similarity is the
+    # score and the minimum its threshold
+    DEDUP_INDEX: str = "minhash"
+    DEDUP_CANDIDATES: int = 10
+    DEDUP_RERANK: bool = True
+    DEDUP_MIN_JACCARD: float = 0.4
+    DEDUP_MIN_COSINE: float = 0.6
+    DEDUP_SYNC_SECONDS: float = 1.0
+    # Candidates of complaints with coordinates, within DEDUP_RADIUS_METERS: mongo (a
+    # $nearSphere query on location.geo, filtered by category, status and the time window
+    # in MongoDB; nearest DEDUP_GEO_CANDIDATES are compared), grid (in-process grid of
+    # open complaints per category; the DEDUP_CANDIDATES nearby with the highest MinHash
+    # estimate >= DEDUP_MIN_JACCARD are compared) or none (text candidates only)
+    DEDUP_GEO: str = "mongo"
+    DEDUP_RADIUS_METERS: float = 500.0
+    DEDUP_GEO_CANDIDATES: int = 50
+    
+    # Triage execution: inline (on the event loop), thread or process pool
+    TRIAGE_EXECUTOR: str = "thread"
+    TRIAGE_WORKERS: int = 2
+    TRIAGE_MAX_PENDING: int = 64
+    TRIAGE_QUEUE_TIMEOUT_SECONDS: float = 5.0
+    
+    # Translation (google | stub)
+    TRANSLATION_BACKEND: str = "google"
+    TRANSLATION_TIMEOUT_SECONDS: float = 2.0
+    TRANSLATION_CACHE_PATH: str = "./cache/translations.db"
+    TRANSLATION_BREAKER_THRESHOLD: int = 5
+    TRANSLATION_BREAKER_RESET_SECONDS: float = 30.0
+    
+    # Triage result cache
+    TRIAGE_CACHE_ENABLED: bool = True
+    TRIAGE_CACHE_MAX_ENTRIES: int = 10000
+    TRIAGE_CACHE_TTL_SECONDS: int = 3600  # 1 hour
+    TRIAGE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # 64MB
+    
     # Application
     APP_NAME: str = "PS12 Grievance Redressal"
     DEBUG: bool = True
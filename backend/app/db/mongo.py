@@ -1,5 +1,5 @@
 from motor.motor_asyncio import AsyncIOMotorClient
-from pymongo import ASCENDING, DESCENDING
+from pymongo import ASCENDING, DESCENDING, GEOSPHERE
 from typing import Optional
 from ..core.config import settings
 import logging
@@ -92,6 +92,24 @@ async def create_indexes():
         # Sort by creation time (most recent first)
         await db.complaints.create_index([("created_at", DESCENDING)])
         
+        # Incremental sync of the duplicate detection index
+        await db.complaints.create_index([("updated_at", ASCENDING)])
+        
+        # Duplicate candidates near a new complaint ($nearSphere); GeoJSON points
+        # are backfilled for complaints stored with plain latitude/longitude first
+        await db.complaints.update_many(
+            {
+                "location.geo": {"$exists": False},
+                "location.latitude": {"$gte": -90, "$lte": 90},
+                "location.longitude": {"$gte": -180, "$lte": 180}
+            },
+            [{"$set": {"location.geo": {
+                "type": "Point",
+                "coordinates": ["$location.longitude", "$location.latitude"]
+            }}}]
+        )
+        await db.complaints.create_index([("location.geo", GEOSPHERE)])
+        
         # Officer inbox queries
         await db.complaints.create_index([("routing.assigned_officer_id", ASCENDING)])
         
@@ -115,6 +133,12 @@ async def create_indexes():
         await db.departments.create_index([("name", ASCENDING)])
         logger.info("✅ Departments collection indexes created")
         
+        # ==================== TRIAGE CORRECTIONS COLLECTION ====================
+        # Online learner polls unconsumed events in insertion order
+        await db.triage_corrections.create_index([("consumed_at", ASCENDING), ("_id", ASCENDING)])
+        await db.triage_corrections.create_index([("complaint_id", ASCENDING)])
+        logger.info("✅ Triage corrections collection indexes created")
+        
         logger.info("🎉 All database indexes created successfully")
         
     except Exception as e:
@@ -2,8 +2,11 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 import logging
-from .db.mongo import connect_to_mongo, close_mongo_connection
-from .ai.triage import initialize_triage_engine
+from .db.mongo import connect_to_mongo, close_mongo_connection, get_database
+from .ai.engine import initialize_ai_engine
+from .services.duplicate_detector import duplicate_detector
+from .services.model_manager import model_manager
+from .services.triage_executor import triage_executor
 from .routers.auth import router as auth_router
 from .routers.complaints import router as complaints_router
 from .routers.officers import router as officers_router
@@ -25,16 +28,38 @@ async def lifespan(app: FastAPI):
     
     # Initialize AI Engine
     try:
-        initialize_triage_engine()
+        initialize_ai_engine()
         logger.info("AI Engine loaded successfully")
     except Exception as e:
         logger.error(f"Failed to load AI Engine: {e}")
     
+    # Index open complaints for duplicate detection
+    for index in (duplicate_detector.index, duplicate_detector.geo_index):
+        if index is None:
+            continue
+        try:
+            db = await get_database()
+            await index.load(db.complaints)
+        except Exception as e:
+            logger.warning(f"{type(index).__name__} not loaded, indexing new complaints only: {e}")
+    
+    # Start triage workers (thread/process pool, per TRIAGE_EXECUTOR)
+    try:
+        await triage_executor.start()
+    except Exception as e:
+        logger.error(f"Failed to start triage executor, triaging inline: {e}")
+        triage_executor.shutdown()
+    
+    # Follow registry version changes made through other API workers
+    model_manager.start_watching()
+    
     logger.info("Application ready")
     
     yield
     
     logger.info("Shutting down API...")
+    model_manager.stop_watching()
+    triage_executor.shutdown()
     await close_mongo_connection()
 
 app = FastAPI(
@@ -1,10 +1,18 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+from pydantic import BaseModel
+from ..ai.registry import ModelNotFound
 from ..schemas.analytics import MetricsResponse
 from ..core.deps import get_current_admin
 from ..services.analytics_service import analytics_service
+from ..services.model_manager import model_manager
+from ..services.triage_client import triage_client
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
+class ModelReloadRequest(BaseModel):
+    version: Optional[str] = None
+
 @router.get("/metrics", response_model=MetricsResponse)
 async def get_admin_metrics(current_user: dict = Depends(get_current_admin)):
     """
@@ -13,3 +21,44 @@ async def get_admin_metrics(current_user: dict = Depends(get_current_admin)):
     """
     metrics = await analytics_service.get_metrics()
     return metrics
+
+@router.get("/triage/cache")
+async def get_triage_cache_stats(current_user: dict = Depends(get_current_admin)):
+    """
+    Get triage result cache counters (hits, misses, evictions)
+    Admin only
+    """
+    if triage_client.cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **triage_client.cache.stats()}
+
+@router.get("/triage/models")
+async def get_triage_models(current_user: dict = Depends(get_current_admin)):
+    """
+    Get the serving model version and the registry contents
+    Admin only
+    """
+    return model_manager.status()
+
+@router.post("/triage/models/reload")
+async def reload_triage_model(
+    request: ModelReloadRequest,
+    current_user: dict = Depends(get_current_admin)
+):
+    """
+    Load a registry version (active version if omitted), warm it and swap it in
+    In-flight triage requests finish on the previous model
+    Admin only
+    """
+    try:
+        return await model_manager.reload(request.version)
+    except ModelNotFound as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e.args[0])
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Model reload failed: {e}"
+        )
@@ -5,10 +5,12 @@ import logging
 from ..auth.jwt import get_current_user
 from ..db.mongo import get_database
 from ..schemas.complaint import ComplaintCreate, ComplaintResponse
-from ..ai.triage import triage_engine
+from ..ai.analysis import AnalyzedText
+from ..services.triage_client import triage_client
 from ..services.routing_service import routing_service
 from ..services.notification_service import notification_service
 from ..services.duplicate_detector import duplicate_detector
+from ..utils.geo import geo_point
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -27,9 +29,9 @@ async def create_complaint(
     """
     Create a new complaint with AI triage and duplicate detection
     """
-    db = get_database()
+    db = await get_database()
     
-    if not db:
+    if db is None:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Database connection not available"
@@ -63,44 +65,22 @@ async def create_complaint(
         }]
     }
     
+    point = geo_point(latitude, longitude)
+    if point:
+        complaint_data["location"]["geo"] = point
+    
     # Handle image upload if provided
     if image:
         # Save image logic here
         image_path = f"uploads/{complaint_id}_{image.filename}"
         complaint_data["image_url"] = image_path
     
-    # Check for duplicates
-    try:
-        existing_complaints = await db.complaints.find({
-            "status": {"$in": ["SUBMITTED", "TRIAGED", "ASSIGNED", "IN_PROGRESS"]}
-        }).to_list(100)
-        
-        duplicate_check = duplicate_detector.check_for_duplicates(
-            complaint_data,
-            existing_complaints
-        )
-        
-        complaint_data["duplicate_check"] = duplicate_check
-        
-        if duplicate_check.get("is_duplicate"):
-            logger.info(f"Potential duplicate detected for {complaint_id}")
-            complaint_data["is_potential_duplicate"] = True
-            
-    except Exception as e:
-        logger.error(f"Duplicate detection failed: {e}")
-        complaint_data["duplicate_check"] = {
-            "is_duplicate": False,
-            "duplicate_count": 0,
-            "similar_complaints": []
-        }
+    # Analyze the complaint text once for duplicate detection and triage
+    analyzed = AnalyzedText(f"{title}. {description}")
     
     # AI Triage
     try:
-        triage_result = triage_engine.triage_complaint(
-            title=title,
-            description=description,
-            language=language
-        )
+        triage_result = await triage_client.triage_complaint(complaint_data, analyzed=analyzed)
         
         complaint_data["category"] = triage_result["category"]
         complaint_data["urgency_level"] = triage_result["urgency_level"]
@@ -118,6 +98,30 @@ async def create_complaint(
         complaint_data["category"] = "Administrative"
         complaint_data["urgency_level"] = "MEDIUM"
     
+    # Check for duplicates among open complaints of the same category
+    try:
+        duplicate_check = await duplicate_detector.check_open_complaints(
+            db.complaints,
+            complaint_data,
+            analyzed=analyzed
+        )
+        
+        complaint_data["duplicate_check"] = duplicate_check
+        
+        if duplicate_check.get("is_duplicate"):
+            logger.info(f"Potential duplicate detected for {complaint_id}")
+            complaint_data["is_potential_duplicate"] = True
+            
+    except Exception as e:
+        logger.error(f"Duplicate detection failed: {e}")
+        complaint_data["duplicate_check"] = {
+            "is_duplicate": False,
+            "duplicate_count": 0,
+            "similar_complaints": []
+        }
+    
+    complaint_data["dedup"] = duplicate_detector.signatures(analyzed)
+    
     # Smart Routing
     try:
         routing_result = routing_service.assign_officer(
@@ -160,6 +164,8 @@ async def create_complaint(
             detail="Failed to create complaint"
         )
     
+    duplicate_detector.index_complaint(complaint_data, analyzed=analyzed)
+    
     # Send notification to citizen
     try:
         notification_service.notify_complaint_submitted(
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, HTTPException, status, Depends
 from typing import List
-from ..schemas.complaint import ComplaintListResponse, UpdateStatusRequest
+from ..schemas.complaint import ComplaintListResponse, UpdateStatusRequest, UpdateCategoryRequest
+from ..ai.keywords import CATEGORY_KEYWORDS
 from ..db.mongo import get_database
 from ..core.deps import get_current_officer
 from ..models.complaint import ComplaintStatus, can_transition
@@ -106,3 +107,73 @@ async def update_complaint_status(
     logger.info(f"✅ Status updated: {complaint_id} -> {new_status}")
     
     return {"message": "Status updated successfully", "new_status": new_status}
+
+@router.patch("/complaints/{complaint_id}/category")
+async def correct_complaint_category(
+    complaint_id: str,
+    request: UpdateCategoryRequest,
+    current_user: dict = Depends(get_current_officer)
+):
+    """
+    Correct the AI-assigned category (officer/admin only)
+    Records a correction event for the online learner
+    """
+    db = await get_database()
+    
+    if request.category not in CATEGORY_KEYWORDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown category {request.category}. Valid: {', '.join(sorted(CATEGORY_KEYWORDS))}"
+        )
+    
+    complaint = await db.complaints.find_one({"complaint_id": complaint_id})
+    
+    if not complaint:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Complaint not found"
+        )
+    
+    # Authorization: officer can only correct assigned complaints, admin can correct all
+    if current_user["role"] == "officer":
+        if complaint.get("routing", {}).get("assigned_officer_id") != current_user["user_id"]:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You can only update your assigned complaints"
+            )
+    
+    triage = complaint.get("triage", {})
+    previous_category = triage.get("category") or complaint.get("category")
+    if previous_category == request.category:
+        return {"message": "Category unchanged", "category": request.category}
+    
+    await db.complaints.update_one(
+        {"complaint_id": complaint_id},
+        {
+            "$set": {
+                "category": request.category,
+                "triage.category": request.category,
+                "triage.corrected_from": previous_category,
+                "triage.corrected_by": current_user["user_id"],
+                "updated_at": utc_now()
+            }
+        }
+    )
+    
+    # Correction event, consumed by app/ai/online_learner.py
+    await db.triage_corrections.insert_one({
+        "complaint_id": complaint_id,
+        "text": f"{complaint.get('title', '')}. {complaint.get('description', '')}",
+        "language": complaint.get("language"),
+        "predicted_category": previous_category,
+        "corrected_category": request.category,
+        "model_version": triage.get("model_version"),
+        "note": request.note,
+        "corrected_by": current_user["user_id"],
+        "created_at": utc_now(),
+        "consumed_at": None
+    })
+    
+    logger.info(f"✅ Category corrected: {complaint_id} {previous_category} -> {request.category}")
+    
+    return {"message": "Category updated successfully", "category": request.category}
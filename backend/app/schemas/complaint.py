@@ -39,6 +39,7 @@ class TriageData(BaseModel):
     urgency_level: Optional[str] = None
     urgency_score: Optional[float] = Field(None, ge=0.0, le=1.0)
     keywords_detected: List[str] = Field(default_factory=list)
+    model_version: Optional[str] = None
 
 
 class EscalationData(BaseModel):
@@ -143,7 +144,8 @@ class ComplaintResponse(BaseModel):
                     "category_confidence": 0.87,
                     "urgency_level": "MEDIUM",
                     "urgency_score": 0.62,
-                    "keywords_detected": ["streetlight", "broken"]
+                    "keywords_detected": ["streetlight", "broken"],
+                    "model_version": "tfidf_lr_v1"
                 },
                 "routing": {
                     "assigned_department": "DEPT_UTIL",
@@ -204,3 +206,19 @@ class UpdateStatusRequest(BaseModel):
                 "note": "Team dispatched to location. Expected resolution in 4 hours."
             }
         }
+
+
+class UpdateCategoryRequest(BaseModel):
+    """
+    Request model for correcting the AI-assigned category (officer/admin)
+    """
+    category: str = Field(..., description="Correct category")
+    note: Optional[str] = Field(None, max_length=500, description="Reason for the correction")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "category": "Sanitation",
+                "note": "Overflowing drain, not a water supply issue"
+            }
+        }
@@ -0,0 +1,120 @@
+"""
+Duplicate detection signature backfill for stored complaints
+
+Complaints created before signatures were stored (or under an older
+SIGNATURE_VERSION) are compared and indexed from their raw text. This job
+walks db.complaints in _id order with one cursor, computes the signatures
+of each batch and writes them back with one unordered bulk_write of
+UpdateOne operations per batch, throttled to max_writes_per_second.
+
+Finished complaints no longer match the query, so an interrupted run simply
+continues when started again.
+
+Usage (from backend/):
+    python -m app.services.dedup_backfill --batch-size 1000 --max-writes-per-second 1000
+"""
+import argparse
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, UpdateOne
+
+from ..ai.analysis import AnalyzedText
+from ..core.config import settings
+from .dedup_signatures import SIGNATURE_VERSION, compute_signatures
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_PROJECTION = {"title": 1, "description": 1}
+
+
+async def backfill(
+    collection,
+    batch_size: int = 1000,
+    max_writes_per_second: float = 1000.0,
+    limit: Optional[int] = None
+) -> Dict:
+    """
+    Store signatures on complaints without signatures of SIGNATURE_VERSION
+
+    updated_at is left alone: the signatures do not change what the
+    indexes hold, so there is nothing for them to re-sync.
+
+    Returns:
+        dict: scanned/updated counts and throughput
+    """
+    query = {"dedup.version": {"$ne": SIGNATURE_VERSION}}
+    cursor = collection.find(query, BACKFILL_PROJECTION).sort("_id", ASCENDING).batch_size(batch_size)
+    if limit:
+        cursor = cursor.limit(limit)
+
+    stats = {"scanned": 0, "updated": 0}
+    started = time.perf_counter()
+
+    async def write(docs: List[Dict]) -> None:
+        batch_started = time.perf_counter()
+        updates = [
+            UpdateOne(
+                {"_id": doc["_id"], "dedup.version": {"$ne": SIGNATURE_VERSION}},
+                {"$set": {"dedup": compute_signatures(
+                    AnalyzedText(f"{doc.get('title', '')}. {doc.get('description', '')}")
+                )}}
+            )
+            for doc in docs
+        ]
+        result = await collection.bulk_write(updates, ordered=False)
+        stats["scanned"] += len(docs)
+        stats["updated"] += result.modified_count
+        logger.info(f"Signature backfill: {stats['scanned']} scanned, {stats['updated']} updated")
+
+        # Throttle: a batch of n writes takes at least n / max_writes_per_second seconds
+        if max_writes_per_second > 0:
+            min_duration = len(docs) / max_writes_per_second
+            elapsed = time.perf_counter() - batch_started
+            if elapsed < min_duration:
+                await asyncio.sleep(min_duration - elapsed)
+
+    batch = []
+    async for doc in cursor:
+        batch.append(doc)
+        if len(batch) == batch_size:
+            await write(batch)
+            batch = []
+    if batch:
+        await write(batch)
+
+    elapsed = time.perf_counter() - started
+    return {
+        "version": SIGNATURE_VERSION,
+        **stats,
+        "seconds": round(elapsed, 2),
+        "docs_per_sec": round(stats["scanned"] / elapsed, 1) if elapsed > 0 else 0.0
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Store duplicate detection signatures on complaints")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--max-writes-per-second", type=float, default=1000.0, help="0 disables throttling")
+    parser.add_argument("--limit", type=int, help="Stop after this many complaints")
+    args = parser.parse_args()
+
+    client = AsyncIOMotorClient(settings.MONGO_URI)
+    try:
+        summary = await backfill(
+            client[settings.DB_NAME].complaints,
+            batch_size=args.batch_size,
+            max_writes_per_second=args.max_writes_per_second,
+            limit=args.limit
+        )
+    finally:
+        client.close()
+    print(summary)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
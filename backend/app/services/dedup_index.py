@@ -0,0 +1,753 @@
+"""
+In-memory indexes of open complaints for duplicate detection
+
+Both indexes are partitioned by category, hold only open complaints of the
+time window, and stay in sync with db.complaints through updated_at (see
+load and sync). Removed complaints are tombstoned and a partition is
+compacted once a quarter of it is dead.
+
+MinHashLSHIndex
+    Every complaint is reduced to a MinHash signature of the byte shingles
+    of its cleaned text (title + description). Signatures are split into
+    bands; complaints sharing any band are candidates, so a lookup touches
+    only the buckets of the new complaint instead of every open complaint.
+    Candidates are ranked by the estimated shingle Jaccard similarity (the
+    share of equal signature values). Each partition keeps its band keys in
+    one sorted NumPy array (searched with searchsorted) plus a small buffer
+    of recent inserts that is merged in every merge_every inserts.
+    Signatures are kept as their low 16 bits (b-bit MinHash), which is
+    plenty for estimating similarities above ~0.3. Shingles are packed into
+    integers rather than hashed with hash(), so signatures are the same in
+    every process and can be stored.
+
+TfidfIndex
+    Every complaint is an L2-normalized TF-IDF row from the triage engine's
+    English vectorizer. Each partition is one growable CSR matrix, scored
+    against a new complaint with a single sparse matrix-vector product
+    (cosine similarity). The vectors belong to one model version: after a
+    model swap the index is stale but keeps scoring with the engine it was
+    built with while rebuild() loads a replacement.
+
+GeoGridIndex
+    Open complaints with coordinates, bucketed per category into a uniform
+    latitude/longitude grid whose cells are radius_meters high. Each record
+    is (complaint id, latitude, longitude, created epoch, MinHash
+    signature). A lookup gathers the slots of the cells around the new
+    complaint, keeps those within radius_meters by a vectorized haversine
+    over the partition's coordinate arrays, and ranks them by estimated
+    shingle Jaccard similarity.
+"""
+import copy
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from ..ai.analysis import AnalyzedText
+from ..utils.geo import EARTH_RADIUS_METERS, haversine_meters
+from .dedup_signatures import MinHasher, stored_minhash
+
+logger = logging.getLogger(__name__)
+
+OPEN_STATUSES = ["SUBMITTED", "TRIAGED", "ASSIGNED", "IN_PROGRESS"]
+INDEX_PROJECTION = {
+    "complaint_id": 1, "title": 1, "description": 1, "category": 1,
+    "status": 1, "created_at": 1, "updated_at": 1,
+    "dedup.version": 1, "dedup.minhash": 1
+}
+GEO_INDEX_PROJECTION = {**INDEX_PROJECTION, "location.latitude": 1, "location.longitude": 1}
+
+# Dead slots a partition tolerates before compacting, at least
+COMPACT_MIN_DEAD = 2048
+
+# Meters per degree of latitude on the sphere haversine_meters measures on
+_METERS_PER_DEGREE = EARTH_RADIUS_METERS * np.pi / 180
+
+
+def _epoch(value) -> float:
+    """Seconds since the epoch of a stored timestamp (naive datetimes are UTC)"""
+    if value is None:
+        return time.time()
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+# ==================== PARTITIONS ====================
+
+class _Partition:
+    """Open complaints of one category; subclasses store and score the entries"""
+
+    def __init__(self):
+        self.size = 0
+        self.dead = 0
+        self.ids: List[str] = []
+        self.created = np.empty(0)
+        self.live = np.empty(0, dtype=bool)
+
+    @property
+    def live_count(self) -> int:
+        return self.size - self.dead
+
+    @property
+    def nbytes(self) -> int:
+        return self.created.nbytes + self.live.nbytes
+
+    def _grow(self, capacity: int) -> None:
+        self.created = np.resize(self.created, capacity)
+        self.live = np.resize(self.live, capacity)
+
+    def add(self, complaint_id: str, entry, created: float) -> int:
+        if self.size == len(self.created):
+            self._grow(max(1024, 2 * len(self.created)))
+        slot = self.size
+        self.size += 1
+        self.ids.append(complaint_id)
+        self.created[slot] = created
+        self.live[slot] = True
+        self._store(slot, entry)
+        return slot
+
+    def _store(self, slot: int, entry) -> None:
+        raise NotImplementedError
+
+    def remove(self, slot: int) -> None:
+        self.live[slot] = False
+        self.dead += 1
+
+    def compact(self) -> Dict[str, int]:
+        """
+        Drop dead slots and renumber the live ones
+
+        Returns:
+            dict: New slot of every live complaint id
+        """
+        live = self.live[:self.size]
+        self._compact(live)
+        self.ids = [complaint_id for complaint_id, alive in zip(self.ids, live) if alive]
+        self.created = self.created[:self.size][live]
+        self.size = len(self.ids)
+        self.live = np.ones(self.size, dtype=bool)
+        self.dead = 0
+        return {complaint_id: slot for slot, complaint_id in enumerate(self.ids)}
+
+    def _compact(self, live: np.ndarray) -> None:
+        raise NotImplementedError
+
+    def score(self, entry, not_before: float) -> Tuple[np.ndarray, np.ndarray]:
+        """(slots, similarities) of live candidates created after not_before"""
+        raise NotImplementedError
+
+
+class _MinHashPartition(_Partition):
+    """Signatures and sorted band keys"""
+
+    def __init__(self, num_perm: int, bands: int, merge_every: int):
+        super().__init__()
+        self.signatures = np.empty((0, num_perm), dtype=np.uint16)
+        # Band keys of merged slots, sorted, with the slot of each key
+        self.keys = np.empty(0, dtype=np.uint64)
+        self.slots = np.empty(0, dtype=np.int32)
+        # Inserts not merged yet, scanned linearly
+        self.pending_keys = np.empty((merge_every, bands), dtype=np.uint64)
+        self.pending_slots = np.empty(merge_every, dtype=np.int32)
+        self.pending = 0
+
+    @property
+    def nbytes(self) -> int:
+        arrays = (self.signatures, self.keys, self.slots, self.pending_keys, self.pending_slots)
+        return super().nbytes + sum(array.nbytes for array in arrays)
+
+    def _grow(self, capacity: int) -> None:
+        super()._grow(capacity)
+        signatures = np.empty((capacity, self.signatures.shape[1]), dtype=np.uint16)
+        signatures[:self.size] = self.signatures[:self.size]
+        self.signatures = signatures
+
+    def _store(self, slot: int, entry) -> None:
+        band_keys, signature = entry
+        self.signatures[slot] = signature
+        self.pending_keys[self.pending] = band_keys
+        self.pending_slots[self.pending] = slot
+        self.pending += 1
+        if self.pending == len(self.pending_slots):
+            self.merge()
+
+    def merge(self) -> None:
+        """Insert the pending band keys into the sorted arrays"""
+        bands = self.pending_keys.shape[1]
+        keys = self.pending_keys[:self.pending].ravel()
+        slots = np.repeat(self.pending_slots[:self.pending], bands)
+        order = np.argsort(keys, kind="stable")
+        keys, slots = keys[order], slots[order]
+        positions = np.searchsorted(self.keys, keys)
+        self.keys = np.insert(self.keys, positions, keys)
+        self.slots = np.insert(self.slots, positions, slots)
+        self.pending = 0
+
+    def _compact(self, live: np.ndarray) -> None:
+        remap = np.cumsum(live, dtype=np.int32) - 1
+        keep = live[self.slots]
+        self.keys = self.keys[keep]
+        self.slots = remap[self.slots[keep]]
+        pending = self.pending_slots[:self.pending]
+        keep_pending = live[pending]
+        count = int(keep_pending.sum())
+        self.pending_keys[:count] = self.pending_keys[:self.pending][keep_pending]
+        self.pending_slots[:count] = remap[pending[keep_pending]]
+        self.pending = count
+        self.signatures = self.signatures[:self.size][live]
+
+    def score(self, entry, not_before: float) -> Tuple[np.ndarray, np.ndarray]:
+        band_keys, signature = entry
+        lo = np.searchsorted(self.keys, band_keys, side="left")
+        hi = np.searchsorted(self.keys, band_keys, side="right")
+        parts = [self.slots[start:end] for start, end in zip(lo, hi) if end > start]
+        if self.pending:
+            hit = (self.pending_keys[:self.pending] == band_keys).any(axis=1)
+            parts.append(self.pending_slots[:self.pending][hit])
+        if not parts:
+            return self.slots[:0], np.empty(0)
+        slots = np.unique(np.concatenate(parts))
+        slots = slots[self.live[slots] & (self.created[slots] >= not_before)]
+        return slots, (self.signatures[slots] == signature.astype(np.uint16)).mean(axis=1)
+
+
+class _TfidfPartition(_Partition):
+    """L2-normalized TF-IDF rows in growable CSR arrays"""
+
+    def __init__(self, n_features: int):
+        super().__init__()
+        self.n_features = n_features
+        self.indptr = np.zeros(1, dtype=np.int64)
+        self.indices = np.empty(0, dtype=np.int32)
+        self.data = np.empty(0, dtype=np.float32)
+
+    @property
+    def nnz(self) -> int:
+        return int(self.indptr[self.size])
+
+    @property
+    def nbytes(self) -> int:
+        return super().nbytes + self.indptr.nbytes + self.indices.nbytes + self.data.nbytes
+
+    def _grow(self, capacity: int) -> None:
+        super()._grow(capacity)
+        self.indptr = np.resize(self.indptr, capacity + 1)
+
+    def _store(self, slot: int, entry) -> None:
+        indices, data = entry
+        start = int(self.indptr[slot])
+        end = start + len(indices)
+        if end > len(self.indices):
+            capacity = max(16384, 2 * len(self.indices), end)
+            self.indices = np.resize(self.indices, capacity)
+            self.data = np.resize(self.data, capacity)
+        self.indices[start:end] = indices
+        self.data[start:end] = data
+        self.indptr[slot + 1] = end
+
+    def matrix(self) -> sparse.csr_matrix:
+        nnz = self.nnz
+        return sparse.csr_matrix(
+            (self.data[:nnz], self.indices[:nnz], self.indptr[:self.size + 1]),
+            shape=(self.size, self.n_features)
+        )
+
+    def _compact(self, live: np.ndarray) -> None:
+        X = self.matrix()[live]
+        self.indptr, self.indices, self.data = X.indptr.astype(np.int64), X.indices, X.data
+
+    def score(self, entry, not_before: float) -> Tuple[np.ndarray, np.ndarray]:
+        indices, data = entry
+        query = np.zeros(self.n_features, dtype=np.float32)
+        query[indices] = data
+        similarity = self.matrix() @ query
+        slots = np.flatnonzero(
+            (similarity > 0) & self.live[:self.size] & (self.created[:self.size] >= not_before)
+        )
+        return slots, similarity[slots]
+
+
+class _GeoGridPartition(_Partition):
+    """Coordinates and signatures, with the slots of every grid cell"""
+
+    def __init__(self, num_perm: int, cell_degrees: float):
+        super().__init__()
+        self.cell_degrees = cell_degrees
+        self.columns = int(np.ceil(360.0 / cell_degrees))
+        self.latitudes = np.empty(0)
+        self.longitudes = np.empty(0)
+        self.signatures = np.empty((0, num_perm), dtype=np.uint16)
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+
+    @property
+    def nbytes(self) -> int:
+        arrays = (self.latitudes, self.longitudes, self.signatures)
+        return super().nbytes + sum(array.nbytes for array in arrays) + 8 * self.size
+
+    def cell(self, latitude: float, longitude: float) -> Tuple[int, int]:
+        return (
+            int(np.floor((latitude + 90.0) / self.cell_degrees)),
+            int(np.floor((longitude + 180.0) / self.cell_degrees)) % self.columns
+        )
+
+    def _grow(self, capacity: int) -> None:
+        super()._grow(capacity)
+        self.latitudes = np.resize(self.latitudes, capacity)
+        self.longitudes = np.resize(self.longitudes, capacity)
+        signatures = np.empty((capacity, self.signatures.shape[1]), dtype=np.uint16)
+        signatures[:self.size] = self.signatures[:self.size]
+        self.signatures = signatures
+
+    def _store(self, slot: int, entry) -> None:
+        latitude, longitude, signature = entry
+        self.latitudes[slot] = latitude
+        self.longitudes[slot] = longitude
+        self.signatures[slot] = signature
+        self.cells.setdefault(self.cell(latitude, longitude), []).append(slot)
+
+    def _compact(self, live: np.ndarray) -> None:
+        self.latitudes = self.latitudes[:self.size][live]
+        self.longitudes = self.longitudes[:self.size][live]
+        self.signatures = self.signatures[:self.size][live]
+        self.cells = {}
+        for slot, (latitude, longitude) in enumerate(zip(self.latitudes, self.longitudes)):
+            self.cells.setdefault(self.cell(latitude, longitude), []).append(slot)
+
+    def nearby(self, latitude: float, longitude: float, radius_meters: float) -> np.ndarray:
+        """Slots of the cells that can hold points within radius_meters"""
+        span = radius_meters / _METERS_PER_DEGREE
+        rows = int(np.ceil(span / self.cell_degrees))
+        # Longitude degrees shrink with cos(latitude); widen the column span to match
+        cos = np.cos(np.radians(min(90.0, abs(latitude) + span)))
+        columns = self.columns if cos < 1e-9 else min(self.columns, int(np.ceil(span / cos / self.cell_degrees)))
+        row, column = self.cell(latitude, longitude)
+        column_range = range(self.columns) if 2 * columns + 1 >= self.columns else [
+            (column + offset) % self.columns for offset in range(-columns, columns + 1)
+        ]
+        parts = [
+            self.cells[key]
+            for key in ((r, c) for r in range(row - rows, row + rows + 1) for c in column_range)
+            if key in self.cells
+        ]
+        if not parts:
+            return np.empty(0, dtype=np.intp)
+        return np.fromiter((slot for part in parts for slot in part), dtype=np.intp)
+
+    def score(self, entry, not_before: float) -> Tuple[np.ndarray, np.ndarray]:
+        latitude, longitude, signature, radius_meters = entry
+        slots = self.nearby(latitude, longitude, radius_meters)
+        slots = slots[self.live[slots] & (self.created[slots] >= not_before)]
+        distance = haversine_meters(latitude, longitude, self.latitudes[slots], self.longitudes[slots])
+        slots = slots[distance <= radius_meters]
+        return slots, (self.signatures[slots] == signature.astype(np.uint16)).mean(axis=1)
+
+
+# ==================== INDEXES ====================
+
+class _OpenComplaintIndex:
+    """Partitions per category, kept in sync with db.complaints"""
+
+    projection = INDEX_PROJECTION
+
+    def __init__(self, window_days: int = 30, sync_interval: float = 1.0):
+        self.window_days = window_days
+        self.sync_interval = sync_interval
+        self._partitions: Dict[str, _Partition] = {}
+        self._where: Dict[str, Tuple[str, int]] = {}  # complaint_id -> (category, slot)
+        self._watermark = None
+        self._last_sync = 0.0
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def _encode(self, analyzed: AnalyzedText):
+        """What the partitions store and score for a text, None when there is nothing"""
+        raise NotImplementedError
+
+    def _new_partition(self) -> _Partition:
+        raise NotImplementedError
+
+    def stale(self) -> bool:
+        """True when the index has to be reloaded before it can be queried"""
+        return False
+
+    def clear(self) -> None:
+        self._partitions = {}
+        self._where = {}
+
+    # ==================== UPDATES ====================
+
+    def add(self, complaint_id: str, category: str, analyzed: AnalyzedText, created_at=None) -> bool:
+        """
+        Index (or re-index) an open complaint
+
+        Args:
+            analyzed: Title and description of the complaint
+            created_at: Creation time (datetime or ISO string), default now
+
+        Returns:
+            bool: False when there is nothing to index (no category or text)
+        """
+        self.remove(complaint_id)
+        entry = self._encode(analyzed) if category else None
+        return self._insert(complaint_id, category, entry, created_at)
+
+    def _insert(self, complaint_id: str, category: str, entry, created_at) -> bool:
+        if entry is None:
+            return False
+        partition = self._partitions.get(category)
+        if partition is None:
+            partition = self._partitions[category] = self._new_partition()
+        slot = partition.add(complaint_id, entry, _epoch(created_at))
+        self._where[complaint_id] = (category, slot)
+        return True
+
+    def remove(self, complaint_id: str) -> bool:
+        """Drop a complaint (resolved, rejected, ...); False if it was not indexed"""
+        location = self._where.pop(complaint_id, None)
+        if location is None:
+            return False
+        category, slot = location
+        partition = self._partitions[category]
+        partition.remove(slot)
+        if partition.dead > max(COMPACT_MIN_DEAD, partition.size // 4):
+            self._where.update({
+                complaint_id: (category, slot)
+                for complaint_id, slot in partition.compact().items()
+            })
+        return True
+
+    def index_document(self, doc: Dict) -> bool:
+        """Add an open complaint document, remove a closed one"""
+        complaint_id, category = doc.get("complaint_id"), doc.get("category")
+        if doc.get("status") not in OPEN_STATUSES:
+            return self.remove(complaint_id)
+        self.remove(complaint_id)
+        entry = self._encode_document(doc) if category else None
+        return self._insert(complaint_id, category, entry, doc.get("created_at"))
+
+    def _encode_document(self, doc: Dict):
+        """_encode of a stored complaint, from its stored signatures where possible"""
+        return self._encode(AnalyzedText(f"{doc.get('title', '')} {doc.get('description', '')}"))
+
+    async def load(self, collection) -> int:
+        """
+        Index the open complaints of the time window from db.complaints,
+        replacing the current contents
+
+        Returns:
+            int: Complaints indexed
+        """
+        self.clear()
+        start = datetime.utcnow()
+        cutoff = start - timedelta(days=self.window_days)
+        query = {"status": {"$in": OPEN_STATUSES}, "created_at": {"$gte": cutoff}}
+        async for doc in collection.find(query, self.projection):
+            self.index_document(doc)
+        # Slack for clock differences between API workers; re-indexing is idempotent
+        self._watermark = start - timedelta(seconds=5)
+        self._last_sync = time.monotonic()
+        logger.info(f"{type(self).__name__} loaded {len(self)} open complaints")
+        return len(self)
+
+    async def rebuild(self, collection) -> int:
+        """
+        load() into an empty copy while this index keeps serving, then take
+        over the copy's contents in one step; complaints written meanwhile
+        arrive with the next sync
+
+        Returns:
+            int: Complaints indexed
+        """
+        fresh = copy.copy(self)
+        fresh.clear()
+        count = await fresh.load(collection)
+        # No await until the caller resumes, so queries never see a mix of both
+        vars(self).update(vars(fresh))
+        return count
+
+    async def sync(self, collection, force: bool = False) -> int:
+        """
+        Apply complaints created or updated (e.g. resolved) since the last sync,
+        including those written by other API workers
+
+        Runs at most every sync_interval seconds unless forced.
+
+        Returns:
+            int: Documents applied
+        """
+        if self._watermark is None:
+            return 0
+        if not force and time.monotonic() - self._last_sync < self.sync_interval:
+            return 0
+
+        start = datetime.utcnow()
+        self._last_sync = time.monotonic()
+        # updated_at is a datetime or an ISO string depending on the writer
+        query = {"$or": [
+            {"updated_at": {"$gte": self._watermark}},
+            {"updated_at": {"$gte": self._watermark.replace(tzinfo=timezone.utc).isoformat()}},
+        ]}
+        applied = 0
+        async for doc in collection.find(query, self.projection):
+            self.index_document(doc)
+            applied += 1
+        self._watermark = start - timedelta(seconds=5)
+        return applied
+
+    # ==================== QUERIES ====================
+
+    def query(
+        self,
+        analyzed: AnalyzedText,
+        category: str,
+        top_k: int = 10,
+        min_similarity: float = 0.0,
+        exclude: Optional[str] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Most similar open complaints of a category
+
+        Args:
+            analyzed: Text of the new complaint
+            min_similarity: Smallest similarity returned
+            exclude: Complaint id to leave out (the complaint itself)
+
+        Returns:
+            list: (complaint_id, similarity), most similar first
+        """
+        partition = self._partitions.get(category)
+        entry = self._encode(analyzed) if partition is not None else None
+        return self._rank(partition, entry, top_k, min_similarity, exclude)
+
+    def _rank(
+        self,
+        partition: Optional[_Partition],
+        entry,
+        top_k: int,
+        min_similarity: float,
+        exclude: Optional[str]
+    ) -> List[Tuple[str, float]]:
+        """Best top_k scored candidates of a partition at min_similarity or above"""
+        if partition is None or entry is None:
+            return []
+        slots, similarity = partition.score(entry, time.time() - self.window_days * 86400)
+        keep = similarity >= min_similarity
+        slots, similarity = slots[keep], similarity[keep]
+        if len(slots) > top_k + 1:
+            best = np.argpartition(-similarity, top_k)[:top_k + 1]
+            slots, similarity = slots[best], similarity[best]
+
+        matches = []
+        for i in np.argsort(-similarity, kind="stable"):
+            complaint_id = partition.ids[slots[i]]
+            if complaint_id != exclude:
+                matches.append((complaint_id, round(float(similarity[i]), 4)))
+                if len(matches) == top_k:
+                    break
+        return matches
+
+    def stats(self) -> Dict:
+        return {
+            "complaints": len(self),
+            "categories": {category: partition.live_count for category, partition in self._partitions.items()},
+            "bytes": sum(partition.nbytes for partition in self._partitions.values()),
+            "watermark": self._watermark.isoformat() if self._watermark else None,
+        }
+
+
+class MinHashLSHIndex(_OpenComplaintIndex):
+    """
+    MinHash LSH index of open complaints, per category
+
+    Args:
+        num_perm: MinHash signature length
+        bands: LSH bands; num_perm / bands rows each. With 32 x 4 a pair at
+            shingle Jaccard 0.55 becomes a candidate 95% of the time, at
+            0.1 0.3% of the time
+        shingle_size: Bytes per shingle (at most 8)
+        merge_every: Inserts buffered per category before a merge
+    """
+
+    def __init__(
+        self,
+        num_perm: int = 128,
+        bands: int = 32,
+        shingle_size: int = 5,
+        window_days: int = 30,
+        merge_every: int = 2048,
+        sync_interval: float = 1.0,
+        seed: int = 1
+    ):
+        if num_perm % bands or bands > 256:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands}), bands <= 256")
+        super().__init__(window_days, sync_interval)
+        self.minhasher = MinHasher(num_perm, shingle_size, seed)
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.merge_every = merge_every
+
+        # Band key mixing constants, from a stream of their own
+        rng = np.random.default_rng([seed, bands])
+        self._mix = rng.integers(0, np.iinfo(np.uint64).max, size=self.rows, dtype=np.uint64) | np.uint64(1)
+        # Band number in the top 8 bits keeps the bands apart in one sorted array
+        self._band_ids = np.arange(bands, dtype=np.uint64) << np.uint64(56)
+
+    def signature(self, clean_text: str) -> Optional[np.ndarray]:
+        """MinHash signature (uint32) of text cleaned for comparison, None for empty text"""
+        return self.minhasher.signature(clean_text)
+
+    def band_keys(self, signature: np.ndarray) -> np.ndarray:
+        """One uint64 key per band"""
+        rows = signature.reshape(self.bands, self.rows).astype(np.uint64)
+        mixed = (rows * self._mix).sum(axis=1)
+        mixed ^= mixed >> np.uint64(29)
+        return (mixed >> np.uint64(8)) | self._band_ids
+
+    def _encode(self, analyzed: AnalyzedText):
+        signature = self.signature(analyzed.dedup_text)
+        if signature is None:
+            return None
+        return self.band_keys(signature), signature
+
+    def _encode_document(self, doc: Dict):
+        signature = stored_minhash(doc, self.minhasher)
+        if signature is None:
+            return super()._encode_document(doc)
+        return self.band_keys(signature), signature
+
+    def _new_partition(self) -> _Partition:
+        return _MinHashPartition(self.num_perm, self.bands, self.merge_every)
+
+
+class TfidfIndex(_OpenComplaintIndex):
+    """
+    TF-IDF cosine index of open complaints, per category
+
+    Args:
+        get_engine: Returns the triage engine whose vectorizer is used
+    """
+
+    def __init__(self, get_engine: Callable, window_days: int = 30, sync_interval: float = 1.0):
+        super().__init__(window_days, sync_interval)
+        self.get_engine = get_engine
+        self.engine = None  # Engine whose vectorizer encoded the indexed complaints
+        self._n_features = None
+
+    def stale(self) -> bool:
+        return self.engine is not None and self.get_engine().model_version != self.engine.model_version
+
+    def clear(self) -> None:
+        super().clear()
+        self.engine = None
+
+    def _encode(self, analyzed: AnalyzedText):
+        if self.engine is None:
+            self.engine = self.get_engine()
+        engine = self.engine
+        # Stored complaints are vectorized from their original text, so new ones are too
+        if analyzed.translated_text != analyzed.text:
+            analyzed = AnalyzedText(analyzed.text)
+        X = engine.tfidf_vectors([analyzed])
+        self._n_features = X.shape[1]
+        if not X.nnz:
+            return None
+        data = X.data.astype(np.float32)
+        data /= np.sqrt(np.dot(data, data))
+        return X.indices.astype(np.int32), data
+
+    def _new_partition(self) -> _Partition:
+        return _TfidfPartition(self._n_features)
+
+
+class GeoGridIndex(_OpenComplaintIndex):
+    """
+    Grid of open complaints with coordinates, per category
+
+    Args:
+        radius_meters: Distance within which complaints are looked up, also
+            the grid cell height
+        num_perm: MinHash signature length
+    """
+
+    projection = GEO_INDEX_PROJECTION
+
+    def __init__(
+        self,
+        radius_meters: float = 500.0,
+        num_perm: int = 128,
+        shingle_size: int = 5,
+        window_days: int = 30,
+        sync_interval: float = 1.0,
+        seed: int = 1
+    ):
+        super().__init__(window_days, sync_interval)
+        self.radius_meters = radius_meters
+        self.cell_degrees = radius_meters / _METERS_PER_DEGREE
+        self.minhasher = MinHasher(num_perm, shingle_size, seed)
+
+    def add(
+        self,
+        complaint_id: str,
+        category: str,
+        analyzed: AnalyzedText,
+        created_at=None,
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None
+    ) -> bool:
+        """
+        Index (or re-index) an open complaint
+
+        Returns:
+            bool: False when there is nothing to index (no category, text or coordinates)
+        """
+        self.remove(complaint_id)
+        if not category or latitude is None or longitude is None:
+            return False
+        signature = self.minhasher.signature(analyzed.dedup_text)
+        entry = None if signature is None else (float(latitude), float(longitude), signature)
+        return self._insert(complaint_id, category, entry, created_at)
+
+    def _encode_document(self, doc: Dict):
+        location = doc.get("location") or {}
+        latitude, longitude = location.get("latitude"), location.get("longitude")
+        if latitude is None or longitude is None:
+            return None
+        signature = stored_minhash(doc, self.minhasher)
+        if signature is None:
+            analyzed = AnalyzedText(f"{doc.get('title', '')} {doc.get('description', '')}")
+            signature = self.minhasher.signature(analyzed.dedup_text)
+        return None if signature is None else (float(latitude), float(longitude), signature)
+
+    def query(
+        self,
+        analyzed: AnalyzedText,
+        category: str,
+        latitude: float,
+        longitude: float,
+        top_k: int = 10,
+        min_similarity: float = 0.0,
+        exclude: Optional[str] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Most similar open complaints of a category within radius_meters
+
+        Returns:
+            list: (complaint_id, estimated shingle Jaccard), most similar first
+        """
+        partition = self._partitions.get(category)
+        signature = self.minhasher.signature(analyzed.dedup_text) if partition is not None else None
+        entry = None if signature is None else (latitude, longitude, signature, self.radius_meters)
+        return self._rank(partition, entry, top_k, min_similarity, exclude)
+
+    def _new_partition(self) -> _Partition:
+        return _GeoGridPartition(self.minhasher.num_perm, self.cell_degrees)
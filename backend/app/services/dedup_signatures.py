@@ -0,0 +1,148 @@
+"""
+Duplicate detection signatures stored on complaint documents
+
+Computed once when a complaint is created (or by the backfill job) and
+stored under complaint["dedup"]:
+
+    version     SIGNATURE_VERSION; signatures of another version are ignored
+    text        title + description cleaned for comparison (SequenceMatcher)
+    keywords    significant words of text, sorted (keyword overlap)
+    minhash     128 MinHash values (uint32, little-endian bytes) of the 5-byte
+                shingles of text, as used by the in-memory indexes
+    simhash     64-bit SimHash of the words of text (signed, as BSON int64)
+
+find_duplicates compares the stored text and keywords of existing complaints
+instead of re-cleaning them, and skips SequenceMatcher for complaints whose
+SimHash is within NEAR_IDENTICAL_BITS of the new one and whose text is equal
+(SimHash is computed from word counts, so reordered words hash alike). The indexes load stored
+MinHash signatures instead of re-shingling. Complaints stored before the signatures existed are
+filled in by app.services.dedup_backfill.
+"""
+import hashlib
+from collections import Counter
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from ..ai.analysis import AnalyzedText
+from ..ai.preprocess import clean_text_for_comparison, extract_comparison_keywords
+
+SIGNATURE_VERSION = 1
+
+# SimHash Hamming distance up to which two texts count as near-identical
+NEAR_IDENTICAL_BITS = 3
+
+_SHIFT32 = np.uint64(32)
+_BITS = np.arange(64, dtype=np.uint64)
+_MASK64 = (1 << 64) - 1
+
+
+def shingle_hashes(clean_text: str, size: int = 5) -> np.ndarray:
+    """Distinct overlapping byte shingles of the UTF-8 text, each packed into a uint64 (size <= 8)"""
+    data = clean_text.encode("utf-8")
+    if not data:
+        return np.empty(0, dtype=np.uint64)
+    shingles = {int.from_bytes(data[i:i + size], "little") for i in range(max(1, len(data) - size + 1))}
+    return np.fromiter(shingles, dtype=np.uint64, count=len(shingles))
+
+
+class MinHasher:
+    """
+    MinHash signatures of byte shingles
+
+    Args:
+        num_perm: Signature length
+        shingle_size: Bytes per shingle (at most 8)
+    """
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        if not 1 <= shingle_size <= 8:
+            raise ValueError(f"shingle_size must be 1 to 8, got {shingle_size}")
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.seed = seed
+        # Multiply-add-shift hash family: ((a * x + b) mod 2^64) >> 32, a odd
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(0, np.iinfo(np.uint64).max, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, np.iinfo(np.uint64).max, size=num_perm, dtype=np.uint64)
+
+    @property
+    def params(self) -> Tuple[int, int, int]:
+        return self.num_perm, self.shingle_size, self.seed
+
+    def signature(self, clean_text: str) -> Optional[np.ndarray]:
+        """MinHash signature (uint32) of text cleaned for comparison, None for empty text"""
+        hashes = shingle_hashes(clean_text, self.shingle_size)
+        if not len(hashes):
+            return None
+        values = (np.multiply.outer(self._a, hashes) + self._b[:, None]) >> _SHIFT32
+        return values.min(axis=1).astype(np.uint32)
+
+
+# Parameters of the stored MinHash signatures
+SIGNATURE_MINHASHER = MinHasher()
+
+
+def simhash(clean_text: str) -> Optional[int]:
+    """64-bit SimHash of the words of text cleaned for comparison, as a signed int64; None for empty text"""
+    counts = Counter(clean_text.split())
+    if not counts:
+        return None
+    hashes = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(word.encode("utf-8"), digest_size=8).digest(), "little") for word in counts),
+        dtype=np.uint64,
+        count=len(counts)
+    )
+    weights = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+    bits = ((hashes[:, None] >> _BITS) & np.uint64(1)).astype(np.float64)
+    votes = weights @ (2 * bits - 1)
+    value = int(np.sum(np.uint64(1) << _BITS[votes > 0], dtype=np.uint64))
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def hamming(a: int, b: int) -> int:
+    """Number of differing bits of two 64-bit SimHashes"""
+    return ((a ^ b) & _MASK64).bit_count()
+
+
+def compute_signatures(analyzed: AnalyzedText) -> Dict:
+    """Signatures of a complaint's title + description, stored as complaint["dedup"]"""
+    text = analyzed.dedup_text
+    signature = SIGNATURE_MINHASHER.signature(text)
+    return {
+        "version": SIGNATURE_VERSION,
+        "text": text,
+        "keywords": sorted(analyzed.dedup_keywords),
+        "minhash": None if signature is None else signature.astype("<u4").tobytes(),
+        "simhash": simhash(text),
+    }
+
+
+def _stored(doc: Dict) -> Optional[Dict]:
+    dedup = doc.get("dedup")
+    if not dedup or dedup.get("version") != SIGNATURE_VERSION:
+        return None
+    return dedup
+
+
+def stored_text(doc: Dict) -> Tuple[str, set]:
+    """(cleaned text, keywords) of a complaint document, from its signatures when present"""
+    dedup = _stored(doc)
+    if dedup is not None and "text" in dedup:
+        return dedup["text"], set(dedup.get("keywords") or ())
+    text = clean_text_for_comparison(f"{doc.get('title', '')} {doc.get('description', '')}")
+    return text, extract_comparison_keywords(text)
+
+
+def stored_minhash(doc: Dict, minhasher: MinHasher) -> Optional[np.ndarray]:
+    """Stored MinHash signature of a complaint document if it matches minhasher's parameters"""
+    dedup = _stored(doc)
+    if dedup is None or not dedup.get("minhash") or minhasher.params != SIGNATURE_MINHASHER.params:
+        return None
+    return np.frombuffer(dedup["minhash"], dtype="<u4").astype(np.uint32)
+
+
+def stored_simhash(doc: Dict) -> Optional[int]:
+    """Stored SimHash of a complaint document, None without signatures"""
+    dedup = _stored(doc)
+    return None if dedup is None else dedup.get("simhash")
@@ -1,63 +1,82 @@
 from typing import List, Dict, Optional
+import asyncio
 import logging
 from datetime import datetime, timedelta
 from difflib import SequenceMatcher
-import re
+from ..ai.analysis import AnalyzedText
+from ..ai.preprocess import clean_text_for_comparison, extract_comparison_keywords
+from ..core.config import settings
+from ..ai.engine import get_ai_engine
+from .dedup_index import OPEN_STATUSES, GeoGridIndex, MinHashLSHIndex, TfidfIndex
+from .dedup_signatures import NEAR_IDENTICAL_BITS, compute_signatures, hamming, simhash, stored_simhash, stored_text
 
 logger = logging.getLogger(__name__)
 
+CANDIDATE_PROJECTION = {
+    "complaint_id": 1, "title": 1, "description": 1, "category": 1,
+    "location.address": 1, "location.latitude": 1, "location.longitude": 1,
+    "status": 1, "created_at": 1,
+    "dedup.version": 1, "dedup.text": 1, "dedup.keywords": 1, "dedup.simhash": 1
+}
+
 class DuplicateDetector:
     """Service for detecting duplicate/similar complaints"""
     
     def __init__(self):
         self.similarity_threshold = 0.75  # 75% similarity to be considered duplicate
         self.time_window_days = 30  # Only check complaints from last 30 days
+        self.candidates = settings.DEDUP_CANDIDATES
+        self.rerank = settings.DEDUP_RERANK
+        self.geo = settings.DEDUP_GEO
+        self.radius_meters = settings.DEDUP_RADIUS_METERS
+        self.geo_candidates = settings.DEDUP_GEO_CANDIDATES
+        self.geo_index = GeoGridIndex(
+            radius_meters=self.radius_meters,
+            window_days=self.time_window_days,
+            sync_interval=settings.DEDUP_SYNC_SECONDS
+        ) if self.geo == "grid" else None
+        self.index = None
+        self._rebuild_task = None
+        if settings.DEDUP_INDEX == "minhash":
+            self.index = MinHashLSHIndex(
+                window_days=self.time_window_days,
+                sync_interval=settings.DEDUP_SYNC_SECONDS
+            )
+            self.min_similarity = settings.DEDUP_MIN_JACCARD
+        elif settings.DEDUP_INDEX == "tfidf":
+            self.index = TfidfIndex(
+                get_ai_engine,
+                window_days=self.time_window_days,
+                sync_interval=settings.DEDUP_SYNC_SECONDS
+            )
+            self.min_similarity = settings.DEDUP_MIN_COSINE
         
     def clean_text(self, text: str) -> str:
         """Clean and normalize text for comparison"""
-        if not text:
-            return ""
-        
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove special characters and extra spaces
-        text = re.sub(r'[^\w\s]', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
-        
-        return text.strip()
+        return clean_text_for_comparison(text)
     
     def calculate_similarity(self, text1: str, text2: str) -> float:
         """Calculate similarity score between two texts"""
-        clean1 = self.clean_text(text1)
-        clean2 = self.clean_text(text2)
-        
-        if not clean1 or not clean2:
-            return 0.0
-        
-        # Use SequenceMatcher for basic similarity
-        return SequenceMatcher(None, clean1, clean2).ratio()
+        return self._sequence_similarity(self.clean_text(text1), self.clean_text(text2))
     
     def extract_keywords(self, text: str) -> set:
         """Extract important keywords from text"""
-        clean = self.clean_text(text)
-        words = clean.split()
-        
-        # Remove common stop words
-        stop_words = {
-            'the', 'is', 'at', 'which', 'on', 'a', 'an', 'and', 'or', 'but',
-            'in', 'with', 'to', 'for', 'of', 'as', 'by', 'this', 'that',
-            'from', 'are', 'was', 'were', 'been', 'be', 'have', 'has', 'had'
-        }
-        
-        keywords = {word for word in words if len(word) > 3 and word not in stop_words}
-        return keywords
+        return extract_comparison_keywords(self.clean_text(text))
     
     def keyword_overlap(self, text1: str, text2: str) -> float:
         """Calculate keyword overlap between two texts"""
-        keywords1 = self.extract_keywords(text1)
-        keywords2 = self.extract_keywords(text2)
+        return self._jaccard(self.extract_keywords(text1), self.extract_keywords(text2))
+    
+    def _sequence_similarity(self, clean1: str, clean2: str) -> float:
+        """SequenceMatcher ratio between two already-cleaned texts"""
+        if not clean1 or not clean2:
+            return 0.0
         
+        # Use SequenceMatcher for basic similarity
+        return SequenceMatcher(None, clean1, clean2).ratio()
+    
+    def _jaccard(self, keywords1: set, keywords2: set) -> float:
+        """Jaccard overlap between two keyword sets"""
         if not keywords1 or not keywords2:
             return 0.0
         
@@ -101,11 +120,18 @@ class DuplicateDetector:
         self,
         new_complaint: Dict,
         existing_complaints: List[Dict],
-        check_location: bool = True
+        check_location: bool = True,
+        analyzed: Optional[AnalyzedText] = None,
+        scores: Optional[Dict[str, float]] = None
     ) -> List[Dict]:
         """
         Find potential duplicate complaints
         
+        Args:
+            analyzed: Pre-analyzed text of the new complaint, shared with triage
+            scores: Similarity per complaint_id (e.g. from the index) used instead
+                of SequenceMatcher + keyword overlap, against min_similarity
+        
         Returns list of similar complaints with similarity scores
         """
         duplicates = []
@@ -115,8 +141,12 @@ class DuplicateDetector:
         new_category = new_complaint.get('category', '')
         new_location = new_complaint.get('location', {})
         
-        # Combined text for comparison
-        new_text = f"{new_title} {new_desc}"
+        # Combined text for comparison, cleaned once for all candidates
+        if analyzed is None:
+            analyzed = AnalyzedText(f"{new_title} {new_desc}")
+        new_clean = analyzed.dedup_text
+        new_keywords = analyzed.dedup_keywords
+        new_simhash = simhash(new_clean) if scores is None else None
         
         for existing in existing_complaints:
             # Skip if different category
@@ -132,16 +162,27 @@ class DuplicateDetector:
                 if datetime.utcnow() - created_at > timedelta(days=self.time_window_days):
                     continue
             
-            # Calculate text similarity
             existing_title = existing.get('title', '')
-            existing_desc = existing.get('description', '')
-            existing_text = f"{existing_title} {existing_desc}"
-            
-            text_similarity = self.calculate_similarity(new_text, existing_text)
-            keyword_similarity = self.keyword_overlap(new_text, existing_text)
-            
-            # Average of both similarities
-            overall_similarity = (text_similarity + keyword_similarity) / 2
+            if scores is not None:
+                overall_similarity = scores.get(existing.get('complaint_id'), 0.0)
+                threshold = self.min_similarity
+            else:
+                # Calculate text similarity on the stored signatures (cleaned once at insert)
+                existing_clean, existing_keywords = stored_text(existing)
+                existing_simhash = stored_simhash(existing)
+                
+                if (new_simhash is not None and existing_simhash is not None
+                        and hamming(new_simhash, existing_simhash) <= NEAR_IDENTICAL_BITS
+                        and existing_clean == new_clean):
+                    # Same text (e.g. a resubmission); SimHash only ignores word order, so compare the strings
+                    text_similarity = 1.0
+                else:
+                    text_similarity = self._sequence_similarity(new_clean, existing_clean)
+                keyword_similarity = self._jaccard(new_keywords, existing_keywords)
+                
+                # Average of both similarities
+                overall_similarity = (text_similarity + keyword_similarity) / 2
+                threshold = self.similarity_threshold
             
             # Check location if required
             location_match = True
@@ -150,7 +191,7 @@ class DuplicateDetector:
                 location_match = self.location_similarity(new_location, existing_location)
             
             # Consider it a duplicate if similarity is high
-            if overall_similarity >= self.similarity_threshold and location_match:
+            if overall_similarity >= threshold and location_match:
                 duplicates.append({
                     'complaint_id': existing.get('complaint_id'),
                     'title': existing_title,
@@ -167,15 +208,23 @@ class DuplicateDetector:
     def check_for_duplicates(
         self,
         complaint: Dict,
-        db_complaints: List[Dict]
+        db_complaints: List[Dict],
+        analyzed: Optional[AnalyzedText] = None,
+        scores: Optional[Dict[str, float]] = None,
+        check_location: bool = True
     ) -> Optional[Dict]:
         """
         Check if a complaint is a duplicate
         
+        Args:
+            check_location: False when db_complaints were already selected by distance
+        
         Returns:
             Dict with duplicate info if found, None otherwise
         """
-        duplicates = self.find_duplicates(complaint, db_complaints)
+        duplicates = self.find_duplicates(
+            complaint, db_complaints, check_location=check_location, analyzed=analyzed, scores=scores
+        )
         
         if duplicates:
             logger.info(f"Found {len(duplicates)} potential duplicates")
@@ -192,4 +241,145 @@ class DuplicateDetector:
             'similar_complaints': []
         }
 
+    async def check_open_complaints(
+        self,
+        collection,
+        complaint: Dict,
+        analyzed: Optional[AnalyzedText] = None
+    ) -> Dict:
+        """
+        Check a categorized complaint against the open complaints in db.complaints
+        
+        A complaint with coordinates is compared with open complaints of its
+        category and time window within radius_meters: the nearest, selected
+        by MongoDB through the 2dsphere index (geo "mongo"), or the most
+        similar by MinHash estimate in the grid index (geo "grid").
+        
+        Otherwise, with an index, only its best candidates are fetched;
+        SequenceMatcher + keyword overlap re-rank them, or the index
+        similarity is the score when rerank is off. Without one, the first
+        100 open complaints are scanned.
+        
+        Args:
+            collection: db.complaints
+        """
+        if analyzed is None:
+            analyzed = AnalyzedText(f"{complaint.get('title', '')} {complaint.get('description', '')}")
+        
+        point = (complaint.get('location') or {}).get('geo')
+        if point and self.geo == "mongo":
+            existing = await collection.find(
+                self.nearby_query(complaint, point),
+                CANDIDATE_PROJECTION
+            ).to_list(self.geo_candidates)
+            return self.check_for_duplicates(complaint, existing, analyzed=analyzed, check_location=False)
+        
+        if point and self.geo_index is not None:
+            await self.geo_index.sync(collection)
+            longitude, latitude = point['coordinates']
+            matches = self.geo_index.query(
+                analyzed,
+                complaint.get('category'),
+                latitude,
+                longitude,
+                top_k=self.candidates,
+                min_similarity=settings.DEDUP_MIN_JACCARD,
+                exclude=complaint.get('complaint_id')
+            )
+            existing = await self._fetch_candidates(collection, matches)
+            return self.check_for_duplicates(complaint, existing, analyzed=analyzed, check_location=False)
+        
+        if self.index is None:
+            existing = await collection.find({"status": {"$in": OPEN_STATUSES}}).to_list(100)
+            return self.check_for_duplicates(complaint, existing, analyzed=analyzed)
+        
+        if self.index.stale():
+            # Model swapped: the current index keeps serving until the rebuild replaces it
+            self.start_index_rebuild(collection)
+        await self.index.sync(collection)
+        matches = self.index.query(
+            analyzed,
+            complaint.get('category'),
+            top_k=self.candidates,
+            min_similarity=self.min_similarity,
+            exclude=complaint.get('complaint_id')
+        )
+        existing = await self._fetch_candidates(collection, matches)
+        scores = None if self.rerank else dict(matches)
+        return self.check_for_duplicates(complaint, existing, analyzed=analyzed, scores=scores)
+    
+    def start_index_rebuild(self, collection) -> bool:
+        """
+        Rebuild a stale index in the background
+        
+        Args:
+            collection: db.complaints
+        
+        Returns:
+            bool: True when a rebuild was started; False when the index is
+                current or a rebuild is already running
+        """
+        if self.index is None or not self.index.stale():
+            return False
+        if self._rebuild_task is not None and not self._rebuild_task.done():
+            return False
+        self._rebuild_task = asyncio.create_task(self._rebuild_index(collection))
+        return True
+    
+    async def _rebuild_index(self, collection) -> None:
+        try:
+            count = await self.index.rebuild(collection)
+            logger.info(f"Duplicate index rebuilt for the new model ({count} open complaints)")
+        except Exception as e:
+            logger.error(f"Duplicate index rebuild failed, keeping the current index: {e}")
+    
+    async def _fetch_candidates(self, collection, matches: List) -> List[Dict]:
+        """Candidate documents of (complaint_id, similarity) index matches"""
+        if not matches:
+            return []
+        return await collection.find(
+            {"complaint_id": {"$in": [complaint_id for complaint_id, _ in matches]}},
+            CANDIDATE_PROJECTION
+        ).to_list(len(matches))
+    
+    def nearby_query(self, complaint: Dict, point: Dict) -> Dict:
+        """Open complaints of the category and time window within radius_meters of point, nearest first"""
+        query = {
+            "location.geo": {"$nearSphere": {"$geometry": point, "$maxDistance": self.radius_meters}},
+            "category": complaint.get('category'),
+            "status": {"$in": OPEN_STATUSES},
+            "created_at": {"$gte": datetime.utcnow() - timedelta(days=self.time_window_days)}
+        }
+        if complaint.get('complaint_id'):
+            query["complaint_id"] = {"$ne": complaint['complaint_id']}
+        return query
+    
+    def signatures(self, analyzed: AnalyzedText) -> Dict:
+        """Signatures to store as complaint["dedup"], so later checks compare without re-cleaning"""
+        return compute_signatures(analyzed)
+    
+    def index_complaint(self, complaint: Dict, analyzed: Optional[AnalyzedText] = None) -> None:
+        """Add a newly stored open complaint to the indexes"""
+        if complaint.get('status') not in OPEN_STATUSES:
+            return
+        if analyzed is None:
+            analyzed = AnalyzedText(f"{complaint.get('title', '')} {complaint.get('description', '')}")
+        if self.index is not None:
+            self.index.add(
+                complaint['complaint_id'],
+                complaint.get('category'),
+                analyzed,
+                complaint.get('created_at')
+            )
+        if self.geo_index is not None:
+            location = complaint.get('location') or {}
+            self.geo_index.add(
+                complaint['complaint_id'],
+                complaint.get('category'),
+                analyzed,
+                complaint.get('created_at'),
+                location.get('latitude'),
+                location.get('longitude')
+            )
+
 duplicate_detector = DuplicateDetector()
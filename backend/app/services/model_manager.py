@@ -0,0 +1,126 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict, Optional
+from ..ai.engine import get_ai_engine, load_ai_engine, swap_ai_engine
+from ..ai.registry import model_registry
+from ..core.config import settings
+from ..db.mongo import get_database
+from .duplicate_detector import duplicate_detector
+from .triage_executor import triage_executor
+
+logger = logging.getLogger(__name__)
+
+
+class ModelManager:
+    """
+    Hot reload of registry model versions
+
+    A reload loads and warms the new engine off the event loop, moves the
+    triage executor onto it, then swaps the global engine and starts
+    rebuilding the duplicate index in the background. Requests already
+    running keep the engine they started with. If loading fails the current
+    engine keeps serving.
+
+    Each API worker process holds its own engine: with several uvicorn workers,
+    set MODEL_REGISTRY_POLL_SECONDS so the others follow the active version.
+    """
+
+    def __init__(self, registry=model_registry, executor=triage_executor, poll_interval: float = 0.0):
+        self.registry = registry
+        self.executor = executor
+        self.poll_interval = poll_interval
+        self._lock = asyncio.Lock()
+        self._watcher = None
+        self.reloads = 0
+        self.failures = 0
+        self.last_reload_at = None
+        self.last_error = None
+
+    async def reload(self, version: Optional[str] = None) -> Dict:
+        """
+        Load a version (the registry's active one by default) and swap it in
+
+        Args:
+            version: Registered version to serve; it becomes the active version
+
+        Returns:
+            dict: Registry status after the swap
+        """
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            try:
+                engine = await loop.run_in_executor(None, load_ai_engine, version, self.registry)
+                await self.executor.swap_engine(engine)
+            except Exception as e:
+                self.failures += 1
+                self.last_error = str(e)
+                logger.error(f"Model reload failed, keeping current engine: {e}")
+                raise
+
+            previous = swap_ai_engine(engine)
+            if version is not None:
+                self.registry.activate(engine.model_version)
+            try:
+                db = await get_database()
+                duplicate_detector.start_index_rebuild(db.complaints)
+            except Exception as e:
+                logger.warning(f"Duplicate index rebuild not started, the next duplicate check starts it: {e}")
+
+            self.reloads += 1
+            self.last_reload_at = datetime.utcnow()
+            self.last_error = None
+            logger.info(
+                f"Model swapped: {previous.model_version if previous else None} -> {engine.model_version}"
+            )
+            return self.status()
+
+    def status(self) -> Dict:
+        """Serving version, registry contents and reload counters"""
+        manifest = self.registry.manifest()
+        try:
+            engine = get_ai_engine()
+            serving = {
+                "version": engine.model_version,
+                "format": engine.model_format,
+                "cascade": engine.cascade_stats()
+            }
+        except RuntimeError:
+            serving = None
+
+        return {
+            "serving": serving,
+            "active": manifest["active"],
+            "versions": manifest["versions"],
+            "reloads": self.reloads,
+            "failures": self.failures,
+            "last_reload_at": self.last_reload_at,
+            "last_error": self.last_error
+        }
+
+    def start_watching(self) -> None:
+        """Poll the registry and follow active-version changes made by other workers"""
+        if self.poll_interval > 0 and self._watcher is None:
+            self._watcher = asyncio.create_task(self._watch())
+
+    def stop_watching(self) -> None:
+        if self._watcher is not None:
+            self._watcher.cancel()
+            self._watcher = None
+
+    async def _watch(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                active = self.registry.active_version()
+                if active != get_ai_engine().model_version:
+                    logger.info(f"Registry active version changed to {active}, reloading")
+                    await self.reload()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Registry watch failed: {e}")
+
+
+# Singleton instance
+model_manager = ModelManager(poll_interval=settings.MODEL_REGISTRY_POLL_SECONDS)
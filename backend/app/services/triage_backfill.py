@@ -0,0 +1,237 @@
+"""
+Re-triage backfill for stored complaints
+
+After a new model ships, complaints triaged by older versions keep their old
+category and urgency. This job walks db.complaints in _id order with one
+cursor, selects complaints whose triage.model_version differs from the target,
+skipping complaints whose category an officer corrected (triage.corrected_by),
+triages each batch with a single process_batch call and writes the results back
+with one unordered bulk_write of UpdateOne operations per batch.
+
+Writes are throttled to max_writes_per_second. The last processed _id is saved
+after every batch, so an interrupted run continues where it stopped.
+
+Usage (from backend/):
+    python -m app.services.triage_backfill --batch-size 500 --max-writes-per-second 200
+    python -m app.services.triage_backfill --target-version tfidf_lr_v2 --dry-run
+"""
+import argparse
+import asyncio
+import logging
+import os
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional
+from bson import ObjectId, json_util
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, UpdateOne
+from ..ai.engine import AITriageEngine, load_ai_engine
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PROJECTION = {"title": 1, "description": 1, "language": 1, "triage.category": 1, "triage.model_version": 1}
+
+
+class TriageBackfill:
+    """Cursor-batched re-triage of complaints onto one model version"""
+
+    def __init__(
+        self,
+        collection,
+        engine: AITriageEngine,
+        batch_size: int = 500,
+        max_writes_per_second: float = 200.0,
+        checkpoint_path: Optional[str] = None
+    ):
+        self.collection = collection
+        self.engine = engine
+        self.batch_size = batch_size
+        self.max_writes_per_second = max_writes_per_second
+        self.checkpoint_path = checkpoint_path
+
+    # ==================== CHECKPOINT ====================
+
+    def load_checkpoint(self):
+        """Last processed _id from a previous run for the same model version, or None"""
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return None
+        with open(self.checkpoint_path) as f:
+            state = json_util.loads(f.read())
+        if state.get("model_version") != self.engine.model_version:
+            logger.info(f"Ignoring checkpoint for {state.get('model_version')}")
+            return None
+        return state["last_id"]
+
+    def save_checkpoint(self, last_id, stats: Dict) -> None:
+        if not self.checkpoint_path:
+            return
+        os.makedirs(os.path.dirname(self.checkpoint_path) or ".", exist_ok=True)
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(json_util.dumps({
+                "model_version": self.engine.model_version,
+                "last_id": last_id,
+                "stats": stats,
+                "updated_at": datetime.utcnow()
+            }))
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def clear_checkpoint(self) -> None:
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+    # ==================== RUN ====================
+
+    def build_updates(self, docs: List[Dict], results: List[Dict]) -> List[UpdateOne]:
+        """One UpdateOne per complaint; skipped if another writer got there first"""
+        now = datetime.utcnow()
+        updates = []
+        for doc, result in zip(docs, results):
+            triage = {**result, "backfilled_at": now}
+            updates.append(UpdateOne(
+                {
+                    "_id": doc["_id"],
+                    "triage.model_version": {"$ne": self.engine.model_version},
+                    # An officer may have corrected it since it was read
+                    "triage.corrected_by": {"$exists": False}
+                },
+                {"$set": {
+                    "triage": triage,
+                    "category": result["category"],
+                    "urgency_level": result["urgency_level"],
+                    "updated_at": now
+                }}
+            ))
+        return updates
+
+    async def run(
+        self,
+        resume_after=None,
+        limit: Optional[int] = None,
+        dry_run: bool = False
+    ) -> Dict:
+        """
+        Re-triage every complaint not yet on the engine's model version,
+        except those whose category an officer corrected
+
+        Args:
+            resume_after: Start after this _id (default: the saved checkpoint)
+            limit: Stop after this many complaints
+            dry_run: Triage and count category changes without writing
+
+        Returns:
+            dict: scanned/updated counts, category changes and throughput
+        """
+        version = self.engine.model_version
+        if resume_after is None:
+            resume_after = self.load_checkpoint()
+
+        query = {"triage.model_version": {"$ne": version}, "triage.corrected_by": {"$exists": False}}
+        if resume_after is not None:
+            query["_id"] = {"$gt": resume_after}
+            logger.info(f"Resuming after _id {resume_after}")
+
+        cursor = self.collection.find(query, PROJECTION).sort("_id", ASCENDING).batch_size(self.batch_size)
+        if limit:
+            cursor = cursor.limit(limit)
+
+        stats = {"scanned": 0, "updated": 0, "category_changed": 0}
+        transitions = Counter()
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+
+        batch = []
+        async for doc in cursor:
+            batch.append(doc)
+            if len(batch) < self.batch_size:
+                continue
+            await self._process_batch(batch, stats, transitions, loop, dry_run)
+            batch = []
+        if batch:
+            await self._process_batch(batch, stats, transitions, loop, dry_run)
+
+        if not dry_run:
+            self.clear_checkpoint()
+
+        elapsed = time.perf_counter() - started
+        return {
+            "model_version": version,
+            "dry_run": dry_run,
+            **stats,
+            "category_transitions": {f"{old} -> {new}": n for (old, new), n in transitions.most_common()},
+            "seconds": round(elapsed, 2),
+            "docs_per_sec": round(stats["scanned"] / elapsed, 1) if elapsed > 0 else 0.0
+        }
+
+    async def _process_batch(self, docs: List[Dict], stats: Dict, transitions: Counter, loop, dry_run: bool) -> None:
+        batch_started = time.perf_counter()
+
+        texts = [f"{doc.get('title', '')}. {doc.get('description', '')}" for doc in docs]
+        languages = [doc.get("language") or "auto" for doc in docs]
+
+        # One vectorized engine call per batch, off the event loop
+        results = await loop.run_in_executor(None, self.engine.process_batch, texts, languages)
+
+        for doc, result in zip(docs, results):
+            old_category = (doc.get("triage") or {}).get("category")
+            if old_category != result["category"]:
+                stats["category_changed"] += 1
+                transitions[(old_category, result["category"])] += 1
+        stats["scanned"] += len(docs)
+
+        if not dry_run:
+            write = await self.collection.bulk_write(self.build_updates(docs, results), ordered=False)
+            stats["updated"] += write.modified_count
+            self.save_checkpoint(docs[-1]["_id"], stats)
+
+        logger.info(
+            f"Backfill: {stats['scanned']} scanned, {stats['updated']} updated, "
+            f"{stats['category_changed']} category changes"
+        )
+
+        # Throttle: a batch of n writes takes at least n / max_writes_per_second seconds
+        if self.max_writes_per_second > 0 and not dry_run:
+            min_duration = len(docs) / self.max_writes_per_second
+            elapsed = time.perf_counter() - batch_started
+            if elapsed < min_duration:
+                await asyncio.sleep(min_duration - elapsed)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Re-triage stored complaints with a model version")
+    parser.add_argument("--target-version", help="Registry version to triage with (default: active)")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--max-writes-per-second", type=float, default=200.0, help="0 disables throttling")
+    parser.add_argument("--limit", type=int, help="Stop after this many complaints")
+    parser.add_argument("--resume-after", help="Start after this _id (ObjectId hex or string id)")
+    parser.add_argument("--checkpoint", default="./cache/triage_backfill.json", help="Progress file for resuming")
+    parser.add_argument("--dry-run", action="store_true", help="Report category changes without writing")
+    args = parser.parse_args()
+
+    engine = load_ai_engine(args.target_version)
+    client = AsyncIOMotorClient(settings.MONGO_URI)
+
+    resume_after = args.resume_after
+    if resume_after and ObjectId.is_valid(resume_after):
+        resume_after = ObjectId(resume_after)
+
+    try:
+        backfill = TriageBackfill(
+            client[settings.DB_NAME].complaints,
+            engine,
+            batch_size=args.batch_size,
+            max_writes_per_second=args.max_writes_per_second,
+            checkpoint_path=args.checkpoint
+        )
+        summary = await backfill.run(resume_after=resume_after, limit=args.limit, dry_run=args.dry_run)
+    finally:
+        client.close()
+
+    print(json_util.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
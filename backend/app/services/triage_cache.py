@@ -0,0 +1,146 @@
+import copy
+import hashlib
+import logging
+import sys
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _estimate_size(value) -> int:
+    """Rough deep size of a triage result (dicts, lists and scalars)"""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_estimate_size(k) + _estimate_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_estimate_size(item) for item in value)
+    return size
+
+
+class TriageCache:
+    """
+    Content-addressed LRU + TTL cache of triage results
+    
+    Keyed on a hash of (normalized text, language, model version) so that
+    resubmitted or retried complaints skip language detection, translation
+    and inference. Bounded by entry count and by estimated memory.
+    """
+    
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        ttl_seconds: float = 3600,
+        max_bytes: int = 64 * 1024 * 1024
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.model_version = None
+        
+        self._entries = OrderedDict()  # key -> (expires_at, size, result)
+        self._bytes = 0
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+    
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Cheap, script-preserving normalization used for cache keys"""
+        return " ".join((text or "").lower().split())
+    
+    def make_key(self, text: str, language: str, model_version: str) -> str:
+        """Hash of (normalized text, language, model version)"""
+        payload = f"{model_version}\x00{language}\x00{self.normalize(text)}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def get(self, text: str, language: str, model_version: str) -> Optional[Dict]:
+        """Return a copy of the cached result, or None on a miss"""
+        self._check_model_version(model_version)
+        
+        key = self.make_key(text, language, model_version)
+        entry = self._entries.get(key)
+        
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        expires_at, _, result = entry
+        if time.monotonic() >= expires_at:
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return copy.deepcopy(result)
+    
+    def put(self, text: str, language: str, model_version: str, result: Dict) -> None:
+        """Store a triage result, evicting least recently used entries past the caps"""
+        self._check_model_version(model_version)
+        
+        key = self.make_key(text, language, model_version)
+        if key in self._entries:
+            self._remove(key)
+        
+        size = _estimate_size(result)
+        if size > self.max_bytes:
+            return
+        
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, size, copy.deepcopy(result))
+        self._bytes += size
+        
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+    
+    def clear(self) -> None:
+        """Drop every cached result"""
+        self._entries.clear()
+        self._bytes = 0
+    
+    def stats(self) -> Dict:
+        """Cache counters for monitoring"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "model_version": self.model_version,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations
+        }
+    
+    def _check_model_version(self, model_version: str) -> None:
+        """Invalidate all entries when the serving model changes"""
+        if model_version != self.model_version:
+            if self._entries:
+                logger.info(f"Triage cache invalidated: model {self.model_version} -> {model_version}")
+                self.invalidations += 1
+            self.clear()
+            self.model_version = model_version
+    
+    def _remove(self, key: str) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+
+# Singleton instance
+triage_cache = TriageCache(
+    max_entries=settings.TRIAGE_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.TRIAGE_CACHE_TTL_SECONDS,
+    max_bytes=settings.TRIAGE_CACHE_MAX_BYTES
+)
@@ -1,21 +1,37 @@
 import logging
-from typing import Dict
+from typing import Dict, Optional
+from ..ai.analysis import AnalyzedText
 from ..ai.engine import get_ai_engine
+from ..core.config import settings
+from .triage_cache import triage_cache
+from .triage_executor import triage_executor
 
 logger = logging.getLogger(__name__)
 
+FALLBACK_MODEL_VERSION = "keyword_fallback"
+
 class TriageClient:
     """
     AI Triage Client - now uses local AI engine instead of HTTP calls
     Provides same interface but with direct function calls for speed
     """
     
-    async def triage_complaint(self, complaint: dict) -> dict:
+    def __init__(
+        self,
+        cache=triage_cache,
+        cache_enabled: bool = settings.TRIAGE_CACHE_ENABLED,
+        executor=triage_executor
+    ):
+        self.cache = cache if cache_enabled else None
+        self.executor = executor
+    
+    async def triage_complaint(self, complaint: dict, analyzed: Optional[AnalyzedText] = None) -> dict:
         """
         Triage complaint using local AI engine
         
         Args:
             complaint: Complaint document with title and description
+            analyzed: Pre-analyzed complaint text shared with duplicate detection
         
         Returns:
             dict: Triage results with category, confidence, urgency, etc.
@@ -28,9 +44,20 @@ class TriageClient:
             text = f"{complaint['title']}. {complaint['description']}"
             language = complaint.get("language", "auto")
             
-            # Process with AI
+            # Serve resubmitted / retried complaints from cache
+            if self.cache is not None:
+                cached = self.cache.get(text, language, engine.model_version)
+                if cached is not None:
+                    logger.info(f" Triage cache hit: {cached['category']} ({cached['urgency_level']})")
+                    return cached
+            
+            # Process with AI, off the event loop unless the executor is inline
             logger.info(f" Triaging complaint with AI engine...")
-            result = engine.process(text, language)
+            result = await self.executor.process(text, language, analyzed=analyzed)
+            
+            if self.cache is not None:
+                # The engine may have been swapped while this request was queued
+                self.cache.put(text, language, result.get("model_version", engine.model_version), result)
             
             logger.info(f" Triage complete: {result['category']} ({result['urgency_level']})")
             return result
@@ -76,7 +103,8 @@ class TriageClient:
             "category_confidence": 0.5,
             "urgency_level": urgency_level,
             "urgency_score": 0.3 if urgency_level == "LOW" else (0.6 if urgency_level == "MEDIUM" else 0.9),
-            "keywords_detected": keywords
+            "keywords_detected": keywords,
+            "model_version": FALLBACK_MODEL_VERSION
         }
 
 # Singleton instance
@@ -0,0 +1,172 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Optional
+from ..ai import worker
+from ..ai.analysis import AnalyzedText
+from ..ai.engine import get_ai_engine
+from ..ai.lang import translate_to_english_async
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+EXECUTOR_MODES = ("inline", "thread", "process")
+
+
+class TriageQueueFull(Exception):
+    """Raised when no triage slot frees up within the queue timeout"""
+
+
+class TriageExecutor:
+    """
+    Runs CPU-bound triage off the event loop
+    
+    Modes:
+        inline  - run on the event loop (original behaviour)
+        thread  - thread pool sharing the global AI engine
+        process - warm process pool, each worker holding its own engine
+    
+    At most max_pending requests are queued or running; further requests
+    wait up to queue_timeout seconds and then fail with TriageQueueFull.
+    """
+    
+    def __init__(
+        self,
+        mode: str = "inline",
+        max_workers: int = 2,
+        max_pending: int = 64,
+        queue_timeout: float = 5.0
+    ):
+        if mode not in EXECUTOR_MODES:
+            raise ValueError(f"Unknown triage executor mode: {mode}")
+        
+        self.mode = mode
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.queue_timeout = queue_timeout
+        
+        self._pool = None
+        self._slots = asyncio.Semaphore(max_pending)
+        self.pending = 0
+        self.rejected = 0
+    
+    async def start(self) -> None:
+        """Create the pool and wait until every worker has loaded its models"""
+        if self.mode == "inline" or self._pool is not None:
+            return
+        
+        loop = asyncio.get_running_loop()
+        
+        if self.mode == "thread":
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="triage")
+            await loop.run_in_executor(self._pool, get_ai_engine().warmup)
+        else:
+            engine = get_ai_engine()
+            self._pool = await self._start_process_pool(engine.model_path, engine.model_version)
+        
+        logger.info(f"Triage executor started ({self.mode}, {self.max_workers} workers)")
+    
+    async def _start_process_pool(self, model_path: str, model_version: str) -> ProcessPoolExecutor:
+        """Spawn a process pool for one model version and wait until every worker is warm"""
+        loop = asyncio.get_running_loop()
+        pool = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=worker.init_worker,
+            initargs=(model_path, model_version)
+        )
+        try:
+            pids = await asyncio.gather(*[
+                loop.run_in_executor(pool, worker.warmup) for _ in range(self.max_workers)
+            ])
+        except Exception:
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        logger.info(f"Triage process pool warm: {len(set(pids))} workers ({model_version})")
+        return pool
+    
+    async def swap_engine(self, engine) -> None:
+        """
+        Move the pool onto a newly loaded engine
+        
+        Thread and inline modes look up the global engine per request, so only
+        the process pool needs replacing: a warm pool is started for the new
+        version, then the old pool is shut down after its queued work finishes.
+        """
+        if self.mode != "process" or self._pool is None:
+            return
+        
+        new_pool = await self._start_process_pool(engine.model_path, engine.model_version)
+        old_pool, self._pool = self._pool, new_pool
+        old_pool.shutdown(wait=False)
+    
+    def shutdown(self) -> None:
+        """Stop the worker pool"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+    
+    async def process(self, text: str, language: str = "auto", analyzed: Optional[AnalyzedText] = None) -> Dict:
+        """Triage one complaint according to the configured mode"""
+        if analyzed is None:
+            analyzed = AnalyzedText(text)
+        
+        if self.mode == "inline" or self._pool is None:
+            engine = get_ai_engine()
+            engine.analyze(text, language, analyzed, translate=False)
+            await self._translate(engine, analyzed)
+            return engine.process(text, language, analyzed=analyzed)
+        
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise TriageQueueFull(f"{self.max_pending} triage requests already pending")
+        
+        self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            if self.mode == "thread":
+                # Translation is awaited here rather than blocking a pool thread
+                engine = get_ai_engine()
+                await loop.run_in_executor(self._pool, engine.analyze, text, language, analyzed, False)
+                await self._translate(engine, analyzed)
+                return await loop.run_in_executor(
+                    self._pool, lambda: engine.process(text, language, analyzed=analyzed)
+                )
+            # Only plain text crosses the process boundary
+            return await loop.run_in_executor(self._pool, worker.process, text, language)
+        finally:
+            self.pending -= 1
+            self._slots.release()
+    
+    async def _translate(self, engine, analyzed: AnalyzedText) -> None:
+        """Finish an analysis waiting for translation without blocking the event loop"""
+        if analyzed.pending_translation is None:
+            return
+        text, detected_lang, _ = analyzed.pending_translation
+        try:
+            translated_text, detected_lang = await translate_to_english_async(text, detected_lang)
+        except Exception:
+            translated_text, detected_lang = text, "en"
+        engine.finish_translation(analyzed, translated_text, detected_lang)
+    
+    def stats(self) -> Dict:
+        """Executor counters for monitoring"""
+        return {
+            "mode": self.mode,
+            "workers": self.max_workers if self.mode != "inline" else 0,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "rejected": self.rejected
+        }
+
+
+# Singleton instance
+triage_executor = TriageExecutor(
+    mode=settings.TRIAGE_EXECUTOR,
+    max_workers=settings.TRIAGE_WORKERS,
+    max_pending=settings.TRIAGE_MAX_PENDING,
+    queue_timeout=settings.TRIAGE_QUEUE_TIMEOUT_SECONDS
+)
@@ -1,6 +1,7 @@
 # This file makes the utils directory a Python package
 from .ids import generate_user_id, generate_complaint_id, generate_department_id
 from .time import utc_now, format_timestamp, parse_timestamp
+from .geo import geo_point, haversine_meters
 
 __all__ = [
     "generate_user_id",
@@ -8,5 +9,7 @@ __all__ = [
     "generate_department_id",
     "utc_now",
     "format_timestamp",
-    "parse_timestamp"
+    "parse_timestamp",
+    "geo_point",
+    "haversine_meters"
 ]
@@ -0,0 +1,48 @@
+from typing import Dict, Optional
+
+import numpy as np
+
+EARTH_RADIUS_METERS = 6371008.8
+
+
+def geo_point(latitude: Optional[float], longitude: Optional[float]) -> Optional[Dict]:
+    """
+    GeoJSON point for a 2dsphere index
+
+    Args:
+        latitude: Degrees, -90 to 90
+        longitude: Degrees, -180 to 180
+
+    Returns:
+        dict: GeoJSON point (longitude first), or None without valid coordinates
+
+    Examples:
+        >>> geo_point(13.0843, 80.2705)
+        {'type': 'Point', 'coordinates': [80.2705, 13.0843]}
+    """
+    if latitude is None or longitude is None:
+        return None
+    if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+        return None
+    return {"type": "Point", "coordinates": [float(longitude), float(latitude)]}
+
+
+def haversine_meters(latitude: float, longitude: float, latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    """
+    Great-circle distances from one point to many
+
+    Args:
+        latitude, longitude: The point, in degrees
+        latitudes, longitudes: Arrays of points, in degrees
+
+    Returns:
+        np.ndarray: Distance to each point in meters
+
+    Examples:
+        >>> haversine_meters(13.0843, 80.2705, np.array([13.0843, 13.0888]), np.array([80.2705, 80.2705]))
+        array([  0.        , 500.37786105])
+    """
+    lat1, lon1 = np.radians(latitude), np.radians(longitude)
+    lat2, lon2 = np.radians(latitudes), np.radians(longitudes)
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_METERS * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
@@ -0,0 +1,2 @@
+# This file makes the benchmarks directory a Python package
+# Run benchmarks from the backend directory, e.g. `python -m benchmarks.triage_batch`
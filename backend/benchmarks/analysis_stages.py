@@ -0,0 +1,104 @@
+"""
+Per-stage timing of text analysis on the create_complaint path:
+re-analyzing the text in every stage vs one shared AnalyzedText
+
+Only the text-preparation work is timed; model inference and the
+SequenceMatcher comparison itself are the same in both pipelines.
+
+Usage (from backend/):
+    python -m benchmarks.analysis_stages --complaints 500 --candidates 100
+"""
+import argparse
+import random
+import time
+from collections import defaultdict
+
+import pandas as pd
+
+from app.ai.analysis import AnalyzedText
+from app.ai.engine import AITriageEngine
+from app.ai.keywords import CATEGORY_KEYWORDS, detect_urgency_keywords, match_keywords
+from app.ai.preprocess import preprocess_text, word_ngrams
+from app.services.duplicate_detector import DuplicateDetector
+
+
+class StageTimer:
+    """Accumulates wall-clock time per named stage"""
+
+    def __init__(self):
+        self.totals = defaultdict(float)
+
+    def run(self, stage: str, fn, *args):
+        start = time.perf_counter()
+        result = fn(*args)
+        self.totals[stage] += time.perf_counter() - start
+        return result
+
+
+def separate_stages(timer, engine, detector, text, candidates):
+    """Every consumer re-derives what it needs from the raw text"""
+    analyzer = engine.vectorizer.build_analyzer()
+    for existing in candidates:
+        # calculate_similarity and keyword_overlap each cleaned both sides
+        for _ in range(2):
+            timer.run("dedup cleaning", detector.clean_text, text)
+            timer.run("dedup cleaning", detector.clean_text, existing)
+        timer.run("dedup cleaning", detector.extract_keywords, text)
+        timer.run("dedup cleaning", detector.extract_keywords, existing)
+    normalized = timer.run("normalize", preprocess_text, text)
+    timer.run("tf-idf analyzer", analyzer, normalized)
+    timer.run("keyword scans", match_keywords, normalized, CATEGORY_KEYWORDS)
+    timer.run("keyword scans", detect_urgency_keywords, normalized)
+    timer.run("keyword scans", match_keywords, normalized, CATEGORY_KEYWORDS)
+
+
+def shared_stages(timer, engine, detector, text, candidates):
+    """One AnalyzedText per complaint handed to every consumer"""
+    analyzed = AnalyzedText(text)
+    timer.run("dedup cleaning", lambda: analyzed.dedup_keywords)
+    for existing in candidates:
+        existing_analyzed = AnalyzedText(existing)
+        timer.run("dedup cleaning", lambda: existing_analyzed.dedup_keywords)
+    timer.run("normalize", lambda: analyzed.normalized)
+    timer.run("tf-idf analyzer", lambda: word_ngrams(analyzed.tokens, engine.ngram_range))
+    hits = timer.run("keyword scans", lambda: analyzed.keyword_hits)
+    timer.run("keyword scans", match_keywords, analyzed.normalized, CATEGORY_KEYWORDS, hits)
+    timer.run("keyword scans", detect_urgency_keywords, analyzed.normalized, hits)
+    timer.run("keyword scans", match_keywords, analyzed.normalized, CATEGORY_KEYWORDS, hits)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-stage timing of the complaint text pipeline")
+    parser.add_argument("--complaints", type=int, default=500)
+    parser.add_argument("--candidates", type=int, default=100, help="Open complaints compared for duplicates")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    corpus = pd.read_csv("data/complaints_train.csv")["text"].tolist()
+    texts = [f"{rng.choice(corpus)}. {rng.choice(corpus)}" for _ in range(args.complaints)]
+    candidates = [f"{rng.choice(corpus)} {rng.choice(corpus)}" for _ in range(args.candidates)]
+
+    engine = AITriageEngine(model_format="joblib")  # the separate path uses the sklearn analyzer
+    detector = DuplicateDetector()
+
+    timings = {}
+    for name, pipeline in [("separate", separate_stages), ("shared", shared_stages)]:
+        timer = StageTimer()
+        for text in texts:
+            pipeline(timer, engine, detector, text, candidates)
+        timings[name] = timer.totals
+
+    print(f"{args.complaints} complaints, {args.candidates} duplicate candidates each (us/complaint)\n")
+    print(f"{'stage':<18}{'separate':>12}{'shared':>12}{'speedup':>10}")
+    total_before = total_after = 0.0
+    for stage in timings["separate"]:
+        before = timings["separate"][stage] / args.complaints * 1e6
+        after = timings["shared"][stage] / args.complaints * 1e6
+        print(f"{stage:<18}{before:>12.1f}{after:>12.1f}{before / after:>9.1f}x")
+        total_before += before
+        total_after += after
+    print(f"{'total':<18}{total_before:>12.1f}{total_after:>12.1f}{total_before / total_after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
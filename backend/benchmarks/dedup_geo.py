@@ -0,0 +1,136 @@
+"""
+Benchmark: grid index proximity lookups vs the per-pair location check
+
+Indexes N open complaints (corpus of benchmarks.dedup_index) with
+coordinates spread uniformly over a city disc --extent-km across. For each
+query, its planted variations are placed within the radius of the query
+point and background complaints anywhere.
+
+Reported per size:
+
+    build       us per indexed complaint, index size in MB
+    grid        GeoGridIndex.query latency (cells around the point,
+                vectorized haversine, MinHash estimate)
+    exact       share of queries whose nearby set from the grid equals a
+                haversine over every complaint of the category
+    box         DuplicateDetector.location_similarity (the +-0.005 degree box)
+                over every open complaint of the category, per query
+
+Usage (from backend/):
+    python -m benchmarks.dedup_geo --sizes 10000 100000 1000000
+"""
+import argparse
+import math
+import random
+import time
+
+import numpy as np
+
+from app.ai.analysis import AnalyzedText
+from app.services.dedup_index import GeoGridIndex
+from app.services.duplicate_detector import DuplicateDetector
+from app.utils.geo import haversine_meters
+from benchmarks.dedup_index import build_corpus
+
+CENTER = (13.0843, 80.2705)
+
+
+def place(rng: random.Random, latitude: float, longitude: float, meters: float) -> tuple:
+    """Random point within meters of (latitude, longitude)"""
+    distance, bearing = meters * math.sqrt(rng.random()), rng.uniform(0, 2 * math.pi)
+    return (
+        latitude + distance * math.cos(bearing) / 111320.0,
+        longitude + distance * math.sin(bearing) / (111320.0 * math.cos(math.radians(latitude))),
+    )
+
+
+def run_size(size: int, args) -> dict:
+    rng = random.Random(args.seed)
+    docs, pairs = build_corpus(size, args.queries, args.duplicates, args.seed)
+    by_id = {doc["complaint_id"]: doc for doc in docs}
+    half = args.extent_km * 500.0
+    for doc in docs:
+        latitude, longitude = place(rng, *CENTER, half)
+        doc["location"] = {"latitude": latitude, "longitude": longitude}
+    for query, planted in pairs:
+        latitude, longitude = place(rng, *CENTER, half)
+        query["location"] = {"latitude": latitude, "longitude": longitude}
+        for complaint_id in planted:
+            point = place(rng, latitude, longitude, args.radius * 0.9)
+            by_id[complaint_id]["location"] = {"latitude": point[0], "longitude": point[1]}
+
+    detector = DuplicateDetector()
+    index = GeoGridIndex(radius_meters=args.radius, window_days=detector.time_window_days)
+    start = time.perf_counter()
+    for doc in docs:
+        index.index_document(doc)
+    build_us = (time.perf_counter() - start) / len(docs) * 1e6
+
+    categories = {}
+    for doc in docs:
+        categories.setdefault(doc["category"], []).append(doc)
+    coordinates = {
+        category: (
+            np.array([doc["location"]["latitude"] for doc in category_docs]),
+            np.array([doc["location"]["longitude"] for doc in category_docs]),
+        )
+        for category, category_docs in categories.items()
+    }
+
+    grid_ms, exact = [], 0
+    for query, _ in pairs:
+        analyzed = AnalyzedText(query["title"])
+        latitude, longitude = query["location"]["latitude"], query["location"]["longitude"]
+        start = time.perf_counter()
+        index.query(analyzed, query["category"], latitude, longitude, top_k=detector.candidates)
+        grid_ms.append((time.perf_counter() - start) * 1000)
+
+        nearby = index.query(analyzed, query["category"], latitude, longitude, top_k=len(docs))
+        distance = haversine_meters(latitude, longitude, *coordinates[query["category"]])
+        expected = {categories[query["category"]][i]["complaint_id"] for i in np.flatnonzero(distance <= args.radius)}
+        exact += {complaint_id for complaint_id, _ in nearby} == expected
+
+    box_ms = []
+    for query, _ in pairs[:args.box_queries]:
+        start = time.perf_counter()
+        for doc in categories[query["category"]]:
+            detector.location_similarity(query["location"], doc["location"])
+        box_ms.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "size": size,
+        "build_us": build_us,
+        "index_mb": index.stats()["bytes"] / 1e6,
+        "grid_p50": float(np.median(grid_ms)),
+        "grid_p95": float(np.percentile(grid_ms, 95)),
+        "exact": exact / len(pairs),
+        "box_p50": float(np.median(box_ms)) if box_ms else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Grid index proximity lookups vs per-pair location checks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--queries", type=int, default=300)
+    parser.add_argument("--duplicates", type=int, default=3, help="Variations planted per query")
+    parser.add_argument("--radius", type=float, default=500.0, help="Lookup radius in meters")
+    parser.add_argument("--extent-km", type=float, default=20.0, help="Diameter of the area the complaints cover")
+    parser.add_argument("--box-queries", type=int, default=20, help="Queries timed with the per-pair check")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    header = f"{'open':>9}{'add us':>8}{'MB':>7}{'grid p50':>10}{'p95':>7}{'exact':>7}{'box p50':>10}"
+    print(f"{args.queries} queries, radius {args.radius:.0f} m over {args.extent_km:.0f} km; latency in ms\n")
+    print(header)
+    print("-" * len(header))
+    for size in args.sizes:
+        r = run_size(size, args)
+        box = f"{r['box_p50']:>10.1f}" if r["box_p50"] is not None else f"{'-':>10}"
+        print(
+            f"{r['size']:>9}{r['build_us']:>8.0f}{r['index_mb']:>7.0f}"
+            f"{r['grid_p50']:>10.3f}{r['grid_p95']:>7.3f}{r['exact']:>7.3f}{box}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+Benchmark: MinHash LSH duplicate candidates vs a linear SequenceMatcher scan
+
+Indexes N open complaints. Background complaints are random word sequences
+from their category's template vocabulary, with the usual openings, places,
+durations and closings, so they rarely resemble each other. For each query,
+--duplicates variations of one template are planted among them, and the
+query is a new variation of the same template.
+
+Reported per size:
+
+    build       us per indexed complaint, index size in MB, us per removal
+    index       index.query latency (candidates and estimated similarity)
+    rerank      index.query + DuplicateDetector.find_duplicates on the top
+                candidates, the production path
+    recall      share of planted variations that the old scoring
+                (SequenceMatcher + keyword overlap >= 0.75) calls duplicates
+                which the re-ranked index path also reports
+    estimate    recall and precision when the estimated Jaccard is the score
+                (DEDUP_RERANK off)
+    linear      find_duplicates over every open complaint of the category,
+                timed on --linear-queries queries; "missed" counts its
+                duplicates that the re-ranked index path did not report
+
+Locations are left out, as if every complaint were at the same place.
+
+Usage (from backend/):
+    python -m benchmarks.dedup_index --sizes 10000 100000 1000000
+"""
+import argparse
+import random
+import time
+from datetime import datetime
+
+import numpy as np
+
+from app.ai.analysis import AnalyzedText
+from app.ai.preprocess import clean_text_for_comparison
+from app.services.dedup_index import MinHashLSHIndex
+from app.services.duplicate_detector import DuplicateDetector
+from data.generate_dataset import CLOSINGS, DURATIONS, OPENINGS, PLACES, TEST_DATA, TRAIN_DATA
+
+
+def decorate(rng: random.Random, text: str) -> str:
+    return f"{rng.choice(OPENINGS)}{text}{rng.choice(PLACES)}{rng.choice(DURATIONS)}{rng.choice(CLOSINGS)}"
+
+
+def build_corpus(size: int, queries: int, duplicates: int, seed: int) -> tuple:
+    """
+    Open complaint documents plus (query document, planted ids) pairs
+
+    Planted and query documents carry the index of their template under
+    "template"; queries may share a template.
+
+    Returns:
+        tuple: (docs, queries)
+    """
+    rng = random.Random(seed)
+    templates = [
+        (text, category)
+        for data in (TRAIN_DATA, TEST_DATA)
+        for category, texts in data.items()
+        for text in texts
+    ]
+    vocab = {
+        category: sorted({word for text in texts for word in clean_text_for_comparison(text).split()})
+        for category, texts in TRAIN_DATA.items()
+    }
+    categories = sorted(vocab)
+    now = datetime.utcnow()
+
+    def doc(complaint_id, text, category, template=None):
+        return {"complaint_id": complaint_id, "title": text, "description": "", "category": category,
+                "status": "TRIAGED", "created_at": now, "template": template}
+
+    docs = []
+    for i in range(size - queries * duplicates):
+        category = rng.choice(categories)
+        words = rng.sample(vocab[category], rng.randint(5, 9))
+        docs.append(doc(f"B{i}", decorate(rng, " ".join(words).capitalize()), category))
+
+    pairs = []
+    for q in range(queries):
+        template = rng.randrange(len(templates))
+        text, category = templates[template]
+        planted = [f"D{q}_{d}" for d in range(duplicates)]
+        docs.extend(doc(complaint_id, decorate(rng, text), category, template) for complaint_id in planted)
+        pairs.append((doc(f"Q{q}", decorate(rng, text), category, template), planted))
+    rng.shuffle(docs)
+    return docs, pairs
+
+
+def run_size(size: int, args) -> dict:
+    docs, pairs = build_corpus(size, args.queries, args.duplicates, args.seed)
+    by_id = {doc["complaint_id"]: doc for doc in docs}
+    detector = DuplicateDetector()
+    index = MinHashLSHIndex(window_days=detector.time_window_days)
+
+    start = time.perf_counter()
+    for doc in docs:
+        index.index_document(doc)
+    build_us = (time.perf_counter() - start) / len(docs) * 1e6
+
+    index_ms, rerank_ms = [], []
+    truth_total = found_rerank = found_estimate = reported_estimate = 0
+    for query, planted in pairs:
+        analyzed = AnalyzedText(query["title"])
+        truth = {
+            duplicate["complaint_id"]
+            for duplicate in detector.find_duplicates(query, [by_id[i] for i in planted], False, analyzed)
+        }
+
+        start = time.perf_counter()
+        matches = index.query(analyzed, query["category"], detector.candidates, detector.min_similarity)
+        index_ms.append((time.perf_counter() - start) * 1000)
+        reranked = detector.find_duplicates(query, [by_id[i] for i, _ in matches], False, analyzed)
+        rerank_ms.append((time.perf_counter() - start) * 1000)
+
+        estimated = detector.find_duplicates(query, [by_id[i] for i, _ in matches], False, analyzed,
+                                             scores=dict(matches))
+        truth_total += len(truth)
+        found_rerank += len(truth & {duplicate["complaint_id"] for duplicate in reranked})
+        found_estimate += len(truth & {duplicate["complaint_id"] for duplicate in estimated})
+        reported_estimate += len(estimated)
+
+    linear_ms, missed = [], 0
+    for query, _ in pairs[:args.linear_queries]:
+        analyzed = AnalyzedText(query["title"])
+        category_docs = [doc for doc in docs if doc["category"] == query["category"]]
+        start = time.perf_counter()
+        linear = detector.find_duplicates(query, category_docs, False, analyzed)
+        linear_ms.append((time.perf_counter() - start) * 1000)
+        matches = index.query(analyzed, query["category"], detector.candidates, detector.min_similarity)
+        reranked = {d["complaint_id"] for d in detector.find_duplicates(query, [by_id[i] for i, _ in matches],
+                                                                        False, analyzed)}
+        missed += sum(duplicate["complaint_id"] not in reranked for duplicate in linear[:detector.candidates])
+
+    removals = [doc["complaint_id"] for doc in docs[:args.queries]]
+    start = time.perf_counter()
+    for complaint_id in removals:
+        index.remove(complaint_id)
+    remove_us = (time.perf_counter() - start) / len(removals) * 1e6
+
+    return {
+        "size": size,
+        "build_us": build_us,
+        "index_mb": index.stats()["bytes"] / 1e6,
+        "remove_us": remove_us,
+        "index_p50": float(np.median(index_ms)),
+        "index_p95": float(np.percentile(index_ms, 95)),
+        "rerank_p50": float(np.median(rerank_ms)),
+        "rerank_p95": float(np.percentile(rerank_ms, 95)),
+        "recall": found_rerank / truth_total if truth_total else 1.0,
+        "estimate_recall": found_estimate / truth_total if truth_total else 1.0,
+        "estimate_precision": found_estimate / reported_estimate if reported_estimate else 1.0,
+        "linear_p50": float(np.median(linear_ms)) if linear_ms else None,
+        "linear_missed": missed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MinHash LSH duplicate candidates vs linear scan")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--queries", type=int, default=300)
+    parser.add_argument("--duplicates", type=int, default=3, help="Variations planted per query")
+    parser.add_argument("--linear-queries", type=int, default=10, help="Queries timed with the linear scan")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    header = (
+        f"{'open':>9}{'add us':>8}{'MB':>7}{'rm us':>7}{'index p50':>11}{'p95':>7}{'rerank p50':>12}{'p95':>7}"
+        f"{'recall':>8}{'est rec':>9}{'est prec':>10}{'linear p50':>12}{'missed':>8}"
+    )
+    print(f"{args.queries} queries, {args.duplicates} planted variations each; latency in ms\n")
+    print(header)
+    print("-" * len(header))
+    for size in args.sizes:
+        r = run_size(size, args)
+        linear = f"{r['linear_p50']:>12.1f}" if r["linear_p50"] is not None else f"{'-':>12}"
+        print(
+            f"{r['size']:>9}{r['build_us']:>8.0f}{r['index_mb']:>7.0f}{r['remove_us']:>7.1f}"
+            f"{r['index_p50']:>11.3f}{r['index_p95']:>7.3f}{r['rerank_p50']:>12.3f}{r['rerank_p95']:>7.3f}"
+            f"{r['recall']:>8.3f}{r['estimate_recall']:>9.3f}{r['estimate_precision']:>10.3f}"
+            f"{linear}{r['linear_missed']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Benchmark: TF-IDF cosine duplicate search vs SequenceMatcher + keyword overlap
+
+Uses the corpus of benchmarks.dedup_index: random background complaints per
+category plus --duplicates planted variations of each query's template.
+Variations of the query's template (planted for it or for another query
+with the same template) are true duplicates, anything else a false one.
+
+Reported per size, with precision and recall against those variations:
+
+    build       us per indexed complaint (triage vectorizer + L2 row), MB
+    cosine      TfidfIndex.query with the cosine as the score
+                (DEDUP_INDEX=tfidf, DEDUP_RERANK off), per --thresholds
+    rerank      TfidfIndex.query at DEDUP_MIN_COSINE, then SequenceMatcher +
+                keyword overlap on the top candidates (DEDUP_RERANK on)
+    linear      the old scoring over every open complaint of the category,
+                on --linear-queries queries
+
+Usage (from backend/):
+    python -m benchmarks.dedup_tfidf --sizes 10000 100000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from app.ai.analysis import AnalyzedText
+from app.ai.engine import AITriageEngine
+from app.services.dedup_index import TfidfIndex
+from app.services.duplicate_detector import DuplicateDetector
+from benchmarks.dedup_index import build_corpus
+
+
+def precision_recall(found: int, reported: int, truth: int) -> tuple:
+    return (found / reported if reported else 1.0), (found / truth if truth else 1.0)
+
+
+def run_size(size: int, engine: AITriageEngine, args) -> dict:
+    docs, pairs = build_corpus(size, args.queries, args.duplicates, args.seed)
+    by_id = {doc["complaint_id"]: doc for doc in docs}
+    variations = {}
+    for doc in docs:
+        if doc["template"] is not None:
+            variations.setdefault(doc["template"], set()).add(doc["complaint_id"])
+    detector = DuplicateDetector()
+    index = TfidfIndex(lambda: engine, window_days=detector.time_window_days)
+
+    start = time.perf_counter()
+    for doc in docs:
+        index.index_document(doc)
+    build_us = (time.perf_counter() - start) / len(docs) * 1e6
+
+    lowest = min(args.thresholds)
+    cosine = {threshold: [0, 0] for threshold in args.thresholds}
+    rerank = [0, 0]
+    cosine_ms, rerank_ms = [], []
+    truth = 0
+    for query, _ in pairs:
+        analyzed = AnalyzedText(query["title"])
+        planted = variations[query["template"]]
+        truth += len(planted)
+
+        start = time.perf_counter()
+        matches = index.query(analyzed, query["category"], detector.candidates, lowest)
+        cosine_ms.append((time.perf_counter() - start) * 1000)
+        for threshold, counts in cosine.items():
+            reported = [complaint_id for complaint_id, score in matches if score >= threshold]
+            counts[0] += len(planted.intersection(reported))
+            counts[1] += len(reported)
+
+        start = time.perf_counter()
+        matches = index.query(analyzed, query["category"], detector.candidates, detector.min_similarity)
+        reported = detector.find_duplicates(query, [by_id[i] for i, _ in matches], False, analyzed)
+        rerank_ms.append((time.perf_counter() - start) * 1000)
+        rerank[0] += len(planted.intersection(d["complaint_id"] for d in reported))
+        rerank[1] += len(reported)
+
+    linear = [0, 0, 0]
+    linear_ms = []
+    for query, _ in pairs[:args.linear_queries]:
+        planted = variations[query["template"]]
+        linear[2] += len(planted)
+        analyzed = AnalyzedText(query["title"])
+        category_docs = [doc for doc in docs if doc["category"] == query["category"]]
+        start = time.perf_counter()
+        reported = detector.find_duplicates(query, category_docs, False, analyzed)
+        linear_ms.append((time.perf_counter() - start) * 1000)
+        linear[0] += len(planted.intersection(d["complaint_id"] for d in reported))
+        linear[1] += len(reported)
+
+    return {
+        "size": size,
+        "build_us": build_us,
+        "index_mb": index.stats()["bytes"] / 1e6,
+        "cosine_p50": float(np.median(cosine_ms)),
+        "rerank_p50": float(np.median(rerank_ms)),
+        "linear_p50": float(np.median(linear_ms)) if linear_ms else None,
+        "cosine": {t: precision_recall(*counts, truth) for t, counts in cosine.items()},
+        "rerank": precision_recall(*rerank, truth),
+        "linear": precision_recall(*linear),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TF-IDF cosine duplicates vs SequenceMatcher + keyword overlap")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--queries", type=int, default=300)
+    parser.add_argument("--duplicates", type=int, default=3, help="Variations planted per query")
+    parser.add_argument("--thresholds", type=float, nargs="+", default=[0.3, 0.4, 0.5, 0.6, 0.7])
+    parser.add_argument("--linear-queries", type=int, default=20, help="Queries scored with the linear scan")
+    parser.add_argument("--model-path", default="app/ai/models")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    engine = AITriageEngine(args.model_path)
+    engine.warmup()
+    print(f"{args.queries} queries, {args.duplicates} planted variations each; latency in ms\n")
+
+    for size in args.sizes:
+        r = run_size(size, engine, args)
+        linear = f"{r['linear_p50']:.1f}" if r["linear_p50"] is not None else "-"
+        print(f"{r['size']} open: {r['build_us']:.0f} us/add, {r['index_mb']:.0f} MB; "
+              f"p50 cosine {r['cosine_p50']:.3f}, rerank {r['rerank_p50']:.3f}, linear {linear}")
+        header = f"  {'scoring':<22}{'precision':>10}{'recall':>8}"
+        print(header)
+        print("  " + "-" * (len(header) - 2))
+        for threshold, (precision, recall) in r["cosine"].items():
+            print(f"  {f'cosine >= {threshold:.2f}':<22}{precision:>10.3f}{recall:>8.3f}")
+        print(f"  {'rerank':<22}{r['rerank'][0]:>10.3f}{r['rerank'][1]:>8.3f}")
+        if r["linear_p50"] is not None:
+            print(f"  {'linear':<22}{r['linear'][0]:>10.3f}{r['linear'][1]:>8.3f}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
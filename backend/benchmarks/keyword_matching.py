@@ -0,0 +1,86 @@
+"""
+Microbenchmark: per-keyword substring scans vs the Aho-Corasick automaton
+
+Usage (from backend/):
+    python -m benchmarks.keyword_matching --words 1000
+"""
+import argparse
+import random
+import time
+
+import pandas as pd
+
+from app.ai.keywords import (
+    CATEGORY_KEYWORDS,
+    URGENCY_KEYWORDS,
+    detect_urgency_keywords,
+    match_keywords,
+    scan_keywords,
+)
+
+
+def substring_scan(text: str, keyword_dict: dict) -> dict:
+    """The pre-automaton matching: one `kw in text` scan per keyword"""
+    text_lower = text.lower()
+    return {
+        group: [kw for kw in keywords if kw in text_lower]
+        for group, keywords in keyword_dict.items()
+    }
+
+
+def build_description(words: int, rng: random.Random, vocabulary: list) -> str:
+    return " ".join(rng.choice(vocabulary) for _ in range(words))
+
+
+def bench(fn, texts: list, repeat: int) -> float:
+    """Return mean microseconds per text"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            fn(text)
+    return (time.perf_counter() - start) / (repeat * len(texts)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark keyword matching on long complaint descriptions")
+    parser.add_argument("--words", type=int, default=1000, help="Words per description")
+    parser.add_argument("--texts", type=int, default=50, help="Number of descriptions")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    vocabulary = " ".join(pd.read_csv("data/complaints_train.csv")["text"]).lower().split()
+    texts = [build_description(args.words, rng, vocabulary) for _ in range(args.texts)]
+
+    # The engine used to call match_keywords twice and detect_urgency_keywords once per complaint
+    def legacy_single(text):
+        substring_scan(text, CATEGORY_KEYWORDS)
+        substring_scan(text, URGENCY_KEYWORDS)
+
+    def legacy_pipeline(text):
+        substring_scan(text, CATEGORY_KEYWORDS)
+        substring_scan(text, URGENCY_KEYWORDS)
+        substring_scan(text, CATEGORY_KEYWORDS)
+
+    def automaton_pipeline(text):
+        hits = scan_keywords(text)
+        match_keywords(text, CATEGORY_KEYWORDS, hits=hits)
+        detect_urgency_keywords(text, hits=hits)
+        match_keywords(text, CATEGORY_KEYWORDS, hits=hits)
+
+    results = [
+        ("substring scan (1 pass)", bench(legacy_single, texts, args.repeat)),
+        ("automaton (1 pass)", bench(scan_keywords, texts, args.repeat)),
+        ("legacy engine pattern", bench(legacy_pipeline, texts, args.repeat)),
+        ("automaton engine pattern", bench(automaton_pipeline, texts, args.repeat)),
+        ("automaton, word boundary", bench(lambda t: scan_keywords(t, word_boundary=True), texts, args.repeat)),
+    ]
+
+    print(f"{args.texts} descriptions x {args.words} words (~{sum(map(len, texts)) // len(texts)} chars)\n")
+    for name, micros in results:
+        print(f"{name:<28}{micros:>10.1f} us/text")
+    print(f"\nEngine keyword stage speedup: {results[2][1] / results[3][1]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark: script-histogram pre-detection vs langdetect
+
+Measures detection latency and reports how often the pre-detector answers on
+its own and how well it agrees with langdetect and with the generated labels.
+
+Usage (from backend/):
+    python -m benchmarks.language_detection --samples 500
+"""
+import argparse
+import time
+from collections import Counter, defaultdict
+
+import pandas as pd
+from langdetect import detect, LangDetectException
+
+from app.ai.lang import detect_language, detect_script_language
+from data.generate_multilingual import generate_multilingual_rows
+
+
+def langdetect_only(text: str) -> str:
+    """The previous detect_language: langdetect on every text"""
+    try:
+        return detect(text)
+    except LangDetectException:
+        return "unknown"
+
+
+def expected_code(label: str) -> str:
+    """Romanized Hindi is labelled hi-Latn; langdetect has no such code"""
+    return label.split("-")[0]
+
+
+def bench(fn, texts: list) -> float:
+    """Return mean microseconds per text"""
+    start = time.perf_counter()
+    for text in texts:
+        fn(text)
+    return (time.perf_counter() - start) / len(texts) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark language pre-detection on a multilingual corpus")
+    parser.add_argument("--samples", type=int, default=500, help="Samples per language")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    english = pd.read_csv("data/complaints_train.csv")
+    rows = generate_multilingual_rows(
+        args.samples, seed=args.seed, english_texts=list(zip(english["text"], english["category"]))
+    )
+    texts = [row["text"] for row in rows]
+
+    baseline_us = bench(langdetect_only, texts)
+    predetect_us = bench(detect_script_language, texts)
+    combined_us = bench(detect_language, texts)
+
+    per_language = defaultdict(Counter)
+    for row in rows:
+        label = row["language"]
+        expected = expected_code(label)
+        reference = langdetect_only(row["text"])
+        fast = detect_script_language(row["text"])
+        final = fast if fast is not None else reference
+        stats = per_language[label]
+        stats["n"] += 1
+        stats["short_circuit"] += fast is not None
+        stats["agree"] += final == reference
+        stats["fast_wrong"] += fast is not None and fast != expected
+        stats["langdetect_correct"] += reference == expected
+        stats["final_correct"] += final == expected
+
+    print(f"{len(texts)} texts, {len(per_language)} languages\n")
+    print(f"{'langdetect only':<28}{baseline_us:>10.1f} us/text")
+    print(f"{'script pre-detector':<28}{predetect_us:>10.1f} us/text")
+    print(f"{'detect_language (combined)':<28}{combined_us:>10.1f} us/text")
+    print(f"\nSpeedup: {baseline_us / combined_us:.1f}x\n")
+
+    header = f"{'language':<10}{'short-circuit':>14}{'agree w/ ld':>13}{'fast wrong':>12}{'ld correct':>12}{'new correct':>13}"
+    print(header)
+    print("-" * len(header))
+    totals = Counter()
+    for label in sorted(per_language):
+        stats = per_language[label]
+        totals.update(stats)
+        n = stats["n"]
+        print(
+            f"{label:<10}{stats['short_circuit'] / n:>14.1%}{stats['agree'] / n:>13.1%}"
+            f"{stats['fast_wrong']:>12}{stats['langdetect_correct'] / n:>12.1%}{stats['final_correct'] / n:>13.1%}"
+        )
+    n = totals["n"]
+    print("-" * len(header))
+    print(
+        f"{'all':<10}{totals['short_circuit'] / n:>14.1%}{totals['agree'] / n:>13.1%}"
+        f"{totals['fast_wrong']:>12}{totals['langdetect_correct'] / n:>12.1%}{totals['final_correct'] / n:>13.1%}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark: single-complaint latency of sklearn vs lean NumPy inference
+
+Loads the saved model three ways and times _classify_category (n-gram build,
+features, predict_proba) on already-translated texts with
+model_sweep.measure_latency:
+
+    joblib      sklearn vectorizer.transform + model.predict_proba
+    compact     memory-mapped float32 artifact (scipy sparse features)
+    lean        LeanModel on the joblib weights, plain NumPy
+
+Max error is the largest predict_proba difference from sklearn over the
+training and test texts; lean must stay below 1e-9.
+
+Usage (from backend/):
+    python -m benchmarks.lean_inference --samples 5000
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from app.ai.analysis import AnalyzedText
+from app.ai.engine import AITriageEngine
+from app.ai.model_sweep import measure_latency
+
+FORMATS = ["joblib", "compact", "lean"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="sklearn vs lean NumPy single-item inference")
+    parser.add_argument("--samples", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, default=64)
+    args = parser.parse_args()
+
+    test_texts = pd.read_csv("data/complaints_test.csv")["text"].tolist()
+    all_texts = pd.read_csv("data/complaints_train.csv")["text"].tolist() + test_texts
+    analyzed = [AnalyzedText(text, language="en") for text in all_texts]
+
+    engines = {model_format: AITriageEngine(model_format=model_format) for model_format in FORMATS}
+    reference = engines["joblib"]
+    expected = reference.model.predict_proba(reference.vectorizer.transform([item.normalized for item in analyzed]))
+
+    print(f"{args.samples} single-item classifications, error over {len(all_texts)} texts\n")
+    header = f"{'format':<9}{'p50 us':>9}{'p95 us':>9}{'p99 us':>9}{'batch us/item':>15}{'max error':>11}{'speedup':>9}"
+    print(header)
+    print("-" * len(header))
+
+    baseline_p50 = None
+    for model_format, engine in engines.items():
+        engine.multilingual_model = None
+        latency = measure_latency(engine, test_texts, samples=args.samples, batch_size=args.batch_size)
+        error = float(np.abs(engine._predict_proba(engine._vectorize(analyzed)) - expected).max())
+        baseline_p50 = baseline_p50 or latency["p50_ms"]
+        print(
+            f"{engine.model_format:<9}{latency['p50_ms'] * 1000:>9.1f}{latency['p95_ms'] * 1000:>9.1f}"
+            f"{latency['p99_ms'] * 1000:>9.1f}{latency['batch_ms_per_item'] * 1000:>15.1f}{error:>11.1e}"
+            f"{baseline_p50 / latency['p50_ms']:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
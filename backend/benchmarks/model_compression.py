@@ -0,0 +1,131 @@
+"""
+Benchmark: per-worker memory and latency of the model artifact formats
+
+Exports the saved joblib model into temporary directories and loads each
+variant the way a worker does:
+
+    joblib      unpickled sklearn vectorizer, model and label encoder
+    unpruned    compact artifact, float32 weights, no pruning (max_error=0)
+    pruned      compact artifact as train_model.py exports it: centered,
+                pruned weights stored as CSR when that is smaller
+
+Compact arrays are memory-mapped, so their file bytes are shared through the
+page cache by every worker on the host; "private MB" is what each worker
+allocates on top (traced while loading). Latency is measured with
+model_sweep.measure_latency. --baseline adds an existing compact directory
+(e.g. a format 1 export) to the table.
+
+Usage (from backend/):
+    python -m benchmarks.model_compression
+    python -m benchmarks.model_compression --baseline /tmp/v1/compact --workers 8
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import tracemalloc
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from app.ai.artifact import COMPACT_DIR, CompactModel, export_compact_model
+from app.ai.engine import AITriageEngine
+from app.ai.model_sweep import measure_latency
+from app.ai.preprocess import preprocess_text
+from app.ai.train_model import MODEL_DIR, pruning_texts
+
+
+def traced_mb(fn, *args) -> tuple:
+    """(result, MB still allocated after fn returns)"""
+    tracemalloc.start()
+    result = fn(*args)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current / 1e6
+
+
+def load_joblib(path: str) -> tuple:
+    return tuple(joblib.load(f"{path}/{name}.joblib") for name in ("tfidf_vectorizer", "category_model", "label_encoder"))
+
+
+def file_mb(path: str, suffix: str) -> float:
+    return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path) if name.endswith(suffix)) / 1e6
+
+
+def max_proba_error(engine: AITriageEngine, reference: AITriageEngine, texts: list) -> float:
+    actual = engine._predict_proba(engine._vectorize(texts))
+    expected = reference._predict_proba(reference._vectorize(texts))
+    return float(np.abs(actual - expected).max())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory and latency of joblib vs compact model artifacts")
+    parser.add_argument("--baseline", help="Extra compact artifact directory to compare")
+    parser.add_argument("--workers", type=int, default=4, help="Workers per host for the total-memory column")
+    parser.add_argument("--samples", type=int, default=2000)
+    args = parser.parse_args()
+
+    test = pd.read_csv("data/complaints_test.csv")
+    texts = test["text"].tolist()
+    train_texts = [preprocess_text(text) for text in pd.read_csv("data/complaints_train.csv")["text"]]
+    sample_texts, check_texts = pruning_texts(train_texts, [preprocess_text(text) for text in texts])
+    vectorizer, model, label_encoder = load_joblib(MODEL_DIR)
+
+    staging = tempfile.mkdtemp()
+    variants = {}
+    for name, max_error in (("unpruned", 0.0), ("pruned", None)):
+        path = os.path.join(staging, name)
+        options = {} if max_error is None else {"max_error": max_error}
+        export_compact_model(vectorizer, model, label_encoder, path, "benchmark", sample_texts, check_texts=check_texts, **options)
+        variants[name] = path
+    if args.baseline:
+        path = os.path.join(staging, "baseline")
+        shutil.copytree(args.baseline, path)
+        variants["baseline"] = path
+
+    reference = AITriageEngine(model_format="joblib")
+    reference.multilingual_model = None
+    analyzed = [reference.analyze(text, "en") for text in texts]
+
+    header = (
+        f"{'format':<10}{'shared MB':>10}{'private MB':>11}{f'{args.workers} workers MB':>15}"
+        f"{'p50 ms':>9}{'p99 ms':>9}{'batch ms':>10}{'max err':>10}"
+    )
+    print(f"{len(texts)} test texts, {args.samples} timed classifications per format\n")
+    print(header)
+    print("-" * len(header))
+
+    rows = [("joblib", None)] + list(variants.items())
+    for name, path in rows:
+        if path is None:
+            _, private_mb = traced_mb(load_joblib, MODEL_DIR)
+            shared_mb = 0.0
+            engine = reference
+        else:
+            _, private_mb = traced_mb(CompactModel.load, path)
+            shared_mb = file_mb(path, ".npy")
+            version_dir = os.path.join(staging, f"{name}_version")
+            os.makedirs(version_dir, exist_ok=True)
+            if not os.path.exists(os.path.join(version_dir, COMPACT_DIR)):
+                os.symlink(path, os.path.join(version_dir, COMPACT_DIR))
+            engine = AITriageEngine(version_dir, model_format="compact")
+            engine.multilingual_model = None
+
+        latency = measure_latency(engine, texts, samples=args.samples)
+        error = max_proba_error(engine, reference, analyzed)
+        total_mb = shared_mb + private_mb * args.workers
+        print(
+            f"{name:<10}{shared_mb:>10.3f}{private_mb:>11.3f}{total_mb:>15.3f}"
+            f"{latency['p50_ms']:>9.3f}{latency['p99_ms']:>9.3f}{latency['batch_ms_per_item']:>10.4f}{error:>10.1e}"
+        )
+
+    pruned = CompactModel.load(variants["pruned"]).manifest
+    print(f"\nPruned artifact: {pruned['nonzero_weights']}/{pruned['n_features'] * pruned['n_classes']} weights kept "
+          f"(threshold {pruned['prune_threshold']:.4g}), {pruned['weights']} layout")
+    print("joblib models are private to each worker; compact arrays are shared pages, counted once per host")
+    shutil.rmtree(staging, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
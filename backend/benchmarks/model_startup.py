@@ -0,0 +1,106 @@
+"""
+Cold start and per-worker memory: joblib artifacts vs the compact mmap artifact
+
+Starts N worker processes per format (like a process pool or N uvicorn
+workers), waits until all of them have loaded the engine, then reads
+/proc/<pid>/smaps_rollup while they are alive so shared pages show up in PSS.
+
+Usage (from backend/):
+    python -m benchmarks.model_startup --workers 4
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+
+def child(model_format: str):
+    """Worker process: import + load the engine, report, then wait to be released"""
+    start = time.perf_counter()
+    from app.ai.engine import AITriageEngine
+    engine = AITriageEngine(model_format=model_format)
+    load_seconds = time.perf_counter() - start
+    engine.process("Garbage not collected for 5 days near school gate", "en")
+    first_seconds = time.perf_counter() - start
+
+    print(json.dumps({
+        "format": engine.model_format,
+        "load_s": load_seconds,
+        "first_result_s": first_seconds,
+        "sklearn_imported": "sklearn" in sys.modules,
+    }), flush=True)
+    sys.stdin.read()
+
+
+def memory_kb(pid: int) -> dict:
+    """Rss/Pss/private totals for a process, in kB"""
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[0].endswith(":") and parts[1].isdigit():
+                fields[parts[0][:-1]] = int(parts[1])
+    return {
+        "rss": fields.get("Rss", 0),
+        "pss": fields.get("Pss", 0),
+        "private": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+    }
+
+
+def run(model_format: str, workers: int) -> dict:
+    env = dict(os.environ, PYTHONPATH=os.getcwd())
+    procs = [
+        subprocess.Popen(
+            [sys.executable, "-m", "benchmarks.model_startup", "--child", model_format],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, env=env
+        )
+        for _ in range(workers)
+    ]
+    try:
+        reports = [json.loads(proc.stdout.readline()) for proc in procs]
+        memory = [memory_kb(proc.pid) for proc in procs]
+    finally:
+        for proc in procs:
+            proc.stdin.close()
+            proc.wait()
+
+    def mean(values):
+        return sum(values) / len(values)
+
+    return {
+        "format": reports[0]["format"],
+        "sklearn_imported": reports[0]["sklearn_imported"],
+        "load_ms": mean([r["load_s"] for r in reports]) * 1000,
+        "first_result_ms": mean([r["first_result_s"] for r in reports]) * 1000,
+        "rss_mb": mean([m["rss"] for m in memory]) / 1024,
+        "pss_mb": mean([m["pss"] for m in memory]) / 1024,
+        "private_mb": mean([m["private"] for m in memory]) / 1024,
+        "total_pss_mb": sum(m["pss"] for m in memory) / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare engine cold start and memory per artifact format")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--child", choices=["joblib", "compact", "lean"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child)
+        return
+
+    results = [run(model_format, args.workers) for model_format in ("joblib", "compact")]
+
+    print(f"{args.workers} workers per format (times include imports)\n")
+    print(f"{'format':<10}{'load ms':>10}{'1st result ms':>15}{'RSS MB':>10}{'PSS MB':>10}{'private MB':>12}{'total PSS MB':>14}  sklearn")
+    for r in results:
+        print(
+            f"{r['format']:<10}{r['load_ms']:>10.0f}{r['first_result_ms']:>15.0f}{r['rss_mb']:>10.1f}"
+            f"{r['pss_mb']:>10.1f}{r['private_mb']:>12.1f}{r['total_pss_mb']:>14.1f}  {r['sklearn_imported']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark: native multilingual classification vs translate-then-classify
+
+Runs the non-English rows of data/complaints_multilingual_test.csv (templates
+never seen in training) through AITriageEngine.process three ways:
+
+    native      multilingual char n-gram model, translation only below
+                MULTILINGUAL_MIN_CONFIDENCE
+    translate   every text translated, then the English model
+    reference   English model on the English test set: the accuracy of
+                translate-then-classify with perfect translations
+
+Without --backend google the translation call is simulated with a fixed
+delay (--translation-ms) and returns the input text, i.e. it behaves like a
+failed translation; that is also what production sees when googletrans is
+down or the circuit breaker is open.
+
+Usage (from backend/):
+    python -m benchmarks.multilingual_triage --translation-ms 250
+    python -m benchmarks.multilingual_triage --backend google
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from app.ai import lang
+from app.ai.engine import AITriageEngine
+from app.ai.lang import GoogleTranslateBackend, StubTranslationBackend, TranslationService
+
+
+def run(engine: AITriageEngine, texts: list, language: str = "auto") -> tuple:
+    """(categories, per-text latencies in ms)"""
+    categories, latencies = [], []
+    for text in texts:
+        start = time.perf_counter()
+        result = engine.process(text, language)
+        latencies.append((time.perf_counter() - start) * 1000)
+        categories.append(result["category"])
+    return categories, np.array(latencies)
+
+
+def report(name: str, categories: list, expected: list, latencies: np.ndarray, native_share: float) -> None:
+    accuracy = float(np.mean([a == b for a, b in zip(categories, expected)]))
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    print(f"{name:<12}{accuracy:>9.3f}{p50:>10.2f}{p95:>10.2f}{p99:>10.2f}{native_share:>16.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Native multilingual model vs translate-then-classify")
+    parser.add_argument("--backend", choices=["stub", "google"], default="stub")
+    parser.add_argument("--translation-ms", type=float, default=250.0, help="Simulated translation latency (stub)")
+    args = parser.parse_args()
+
+    test = pd.read_csv("data/complaints_multilingual_test.csv")
+    regional = test[test["language"] != "en"]
+    english = pd.read_csv("data/complaints_test.csv")
+    texts, expected = regional["text"].tolist(), regional["category"].tolist()
+
+    def fresh_service():
+        if args.backend == "google":
+            backend = GoogleTranslateBackend()
+        else:
+            backend = StubTranslationBackend(delay=args.translation_ms / 1000)
+        # No cache, so every text pays for its translation
+        lang.translation_service = TranslationService(backend, timeout=5.0)
+
+    engine = AITriageEngine()
+    if engine.multilingual_model is None:
+        raise SystemExit("No multilingual model; run python -m app.ai.multilingual first")
+    multilingual_model = engine.multilingual_model
+    engine.warmup()
+
+    print(f"{len(texts)} regional-language texts, translation backend: {args.backend}"
+          + (f" ({args.translation_ms:.0f} ms simulated)" if args.backend == "stub" else "") + "\n")
+    header = f"{'path':<12}{'accuracy':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'no translation':>16}"
+    print(header)
+    print("-" * len(header))
+
+    fresh_service()
+    native_categories, latencies = run(engine, texts)
+    untranslated = 1 - lang.translation_service.backend_calls / len(texts)
+    report("native", native_categories, expected, latencies, untranslated)
+
+    fresh_service()
+    engine.multilingual_model = None
+    categories, latencies = run(engine, texts)
+    untranslated = 1 - lang.translation_service.backend_calls / len(texts)
+    report("translate", categories, expected, latencies, untranslated)
+
+    categories, latencies = run(engine, english["text"].tolist(), "en")
+    report("reference", categories, english["category"].tolist(), latencies, 1.0)
+    engine.multilingual_model = multilingual_model
+
+    print("\nNative accuracy by language:")
+    per_language = regional.assign(correct=[a == b for a, b in zip(native_categories, expected)])
+    for language, group in per_language.groupby("language"):
+        print(f"  {language:<8}{group['correct'].mean():.3f}")
+
+
+if __name__ == "__main__":
+    main()
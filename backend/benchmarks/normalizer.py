@@ -0,0 +1,97 @@
+"""
+Verify and benchmark the fused preprocess_text against the original
+seven-pass regex normalizer
+
+Usage (from backend/):
+    python -m benchmarks.normalizer --size 100000
+
+Exits non-zero if any output differs from the reference implementation.
+"""
+import argparse
+import random
+import re
+import sys
+import time
+
+import pandas as pd
+
+from app.ai.preprocess import preprocess_text
+
+
+def reference_preprocess_text(text: str) -> str:
+    """The original normalizer: seven uncompiled re.sub passes"""
+    if not text:
+        return ""
+
+    text = text.lower()
+    text = re.sub(r'http\S+|www\S+', '', text)  # Remove URLs
+    text = re.sub(r'\S+@\S+', '', text)  # Remove emails
+    text = re.sub(r'(\+91|0)?[6-9]\d{9}', '', text)  # Remove phone numbers
+    text = re.sub(r'\s+', ' ', text)  # Remove extra whitespace
+    text = re.sub(r'[^\x00-\x7F]+', '', text)  # Remove emojis
+    text = re.sub(r'[^a-zA-Z0-9\s\.\,\!\?]', '', text)  # Keep alphanumeric
+    text = text.strip()
+
+    return text
+
+
+NOISE = [
+    "call 9876543210", "+919812345678", "contact 08123456789", "mail me at ravi.k@example.com",
+    "see https://portal.gov.in/track?id=12", "www.example.org/complaint", "😡😡", "कृपया मदद करें",
+    "#urgent", "(ward-12)", "   ", "\t", "NOW!!!", "Rs. 500/-", "A/C", "a@b", "@home", "50%",
+]
+
+
+def build_corpus(size: int, seed: int = 42) -> list:
+    """Training texts with URLs, emails, phones, emoji and Hindi mixed in"""
+    rng = random.Random(seed)
+    base = pd.read_csv("data/complaints_train.csv")["text"].tolist()
+    corpus = []
+    for _ in range(size):
+        words = rng.choice(base).split()
+        for _ in range(rng.randint(0, 3)):
+            words.insert(rng.randint(0, len(words)), rng.choice(NOISE))
+        corpus.append(" ".join(words))
+    return corpus
+
+
+def verify(texts: list, label: str) -> int:
+    mismatches = [t for t in texts if preprocess_text(t) != reference_preprocess_text(t)]
+    print(f"{label:<28}{len(texts):>8} texts, {len(mismatches)} mismatches")
+    for text in mismatches[:5]:
+        print(f"    {text!r}")
+    return len(mismatches)
+
+
+def bench(fn, texts: list) -> float:
+    start = time.perf_counter()
+    for text in texts:
+        fn(text)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Verify and benchmark the fused text normalizer")
+    parser.add_argument("--size", type=int, default=100_000, help="Number of synthetic texts")
+    args = parser.parse_args()
+
+    train = pd.read_csv("data/complaints_train.csv")["text"].tolist()
+    test = pd.read_csv("data/complaints_test.csv")["text"].tolist()
+    noisy = build_corpus(args.size)
+    plain = [random.Random(i).choice(train) for i in range(args.size)]
+
+    failures = verify(train, "complaints_train.csv")
+    failures += verify(test, "complaints_test.csv")
+    failures += verify(noisy, "synthetic noisy corpus")
+
+    print(f"\n{'corpus':<16}{'seven-pass':>12}{'fused':>12}{'speedup':>10}")
+    for label, texts in [("plain", plain), ("noisy", noisy)]:
+        before = bench(reference_preprocess_text, texts)
+        after = bench(preprocess_text, texts)
+        print(f"{label:<16}{before:>11.2f}s{after:>11.2f}s{before / after:>9.1f}x")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Benchmark: online partial_fit learner vs full TF-IDF + LR retrain
+
+Replays a synthetic stream of officer corrections (training texts with
+random prefixes/suffixes and word dropout). Every publish interval the full
+retrain fits train_model.py's TF-IDF + LogisticRegression on the training CSV
+plus every correction so far; the online learner only runs partial_fit on
+each mini-batch. Reports cumulative wall clock and holdout accuracy at each
+publish point, then peak traced memory of one more window for each approach
+(timed runs are untraced, tracemalloc slows Python code down a lot).
+
+Usage (from backend/):
+    python -m benchmarks.online_learning --events 20000 --publish-every 2000
+"""
+import argparse
+import random
+import time
+import tracemalloc
+
+import pandas as pd
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import LabelEncoder
+
+from app.ai.online_learner import OnlineLearner
+from app.ai.preprocess import preprocess_text
+
+PREFIXES = ["", "", "Urgent: ", "Please help, ", "Complaint from resident: ", "Again reporting - "]
+SUFFIXES = ["", "", " Please act soon.", " No action taken yet.", " Kindly resolve.", " Ward office informed."]
+
+
+def correction_stream(texts: list, categories: list, events: int, seed: int) -> list:
+    """Augmented (text, category) events drawn from the training set"""
+    rng = random.Random(seed)
+    stream = []
+    for _ in range(events):
+        i = rng.randrange(len(texts))
+        words = [word for word in texts[i].split() if rng.random() > 0.15] or texts[i].split()
+        stream.append((rng.choice(PREFIXES) + " ".join(words) + rng.choice(SUFFIXES), categories[i]))
+    return stream
+
+
+def full_retrain(texts: list, categories: list):
+    """Same features and classifier as app/ai/train_model.py"""
+    vectorizer = TfidfVectorizer(
+        ngram_range=(1, 3), max_features=3000, min_df=1, max_df=0.9,
+        sublinear_tf=True, strip_accents='unicode'
+    )
+    label_encoder = LabelEncoder()
+    y = label_encoder.fit_transform(categories)
+    X = vectorizer.fit_transform([preprocess_text(text) for text in texts])
+    model = LogisticRegression(max_iter=3000, C=2.0, class_weight='balanced', random_state=42, solver='lbfgs')
+    model.fit(X, y)
+    return vectorizer, model, label_encoder
+
+
+def retrain_accuracy(trained, texts: list, categories: list) -> float:
+    vectorizer, model, label_encoder = trained
+    X = vectorizer.transform([preprocess_text(text) for text in texts])
+    return float((model.predict(X) == label_encoder.transform(categories)).mean())
+
+
+def timed(fn, *args):
+    """Run fn, returning (result, seconds)"""
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def peak_mb(fn, *args) -> float:
+    """Peak memory allocated while fn runs, in MB"""
+    tracemalloc.start()
+    fn(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1e6
+
+
+def learn_window(learner: OnlineLearner, window: list, batch_size: int) -> None:
+    for offset in range(0, len(window), batch_size):
+        batch = window[offset:offset + batch_size]
+        learner.learn([text for text, _ in batch], [category for _, category in batch])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Online learner vs full retrain on a correction stream")
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--publish-every", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    train = pd.read_csv("data/complaints_train.csv")
+    test = pd.read_csv("data/complaints_test.csv")
+    base_texts, base_categories = train["text"].tolist(), train["category"].tolist()
+    test_texts, test_categories = test["text"].tolist(), test["category"].tolist()
+    stream = correction_stream(base_texts, base_categories, args.events, args.seed)
+
+    learner, bootstrap_s = timed(_bootstrapped, base_texts, base_categories)
+    print(f"{len(stream)} correction events, publish every {args.publish_every}, bootstrap {bootstrap_s:.2f}s\n")
+
+    header = f"{'events':>8}{'retrain s':>11}{'cum s':>9}{'acc':>7}{'online s':>11}{'cum s':>9}{'acc':>7}"
+    print(header)
+    print("-" * len(header))
+
+    retrain_total = online_total = 0.0
+    for start in range(0, len(stream), args.publish_every):
+        window = stream[start:start + args.publish_every]
+        _, online_s = timed(learn_window, learner, window, args.batch_size)
+        online_total += online_s
+
+        seen = stream[:start + len(window)]
+        trained, retrain_s = timed(
+            full_retrain,
+            base_texts + [text for text, _ in seen],
+            base_categories + [category for _, category in seen]
+        )
+        retrain_total += retrain_s
+
+        print(
+            f"{len(seen):>8}{retrain_s:>11.2f}{retrain_total:>9.2f}"
+            f"{retrain_accuracy(trained, test_texts, test_categories):>7.3f}"
+            f"{online_s:>11.2f}{online_total:>9.2f}"
+            f"{learner.accuracy(test_texts, test_categories):>7.3f}"
+        )
+
+    window = stream[-args.publish_every:]
+    retrain_mb = peak_mb(
+        full_retrain,
+        base_texts + [text for text, _ in stream],
+        base_categories + [category for _, category in stream]
+    )
+    online_mb = peak_mb(learn_window, learner, window, args.batch_size)
+
+    print(f"\nCumulative wall clock: full retrain {retrain_total:.1f}s, online {online_total:.1f}s "
+          f"({retrain_total / online_total:.1f}x)")
+    print(f"Peak memory of one more publish window: full retrain {retrain_mb:.1f} MB, online {online_mb:.1f} MB")
+    print(f"Online replay reservoir: {len(learner.replay)}/{learner.replay_size} examples, "
+          f"weights {learner.model.coef_.nbytes / 1e6:.1f} MB")
+
+
+def _bootstrapped(texts: list, categories: list) -> OnlineLearner:
+    learner = OnlineLearner()
+    learner.bootstrap(texts, categories)
+    return learner
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark: early-exit triage cascade vs every complaint through the model
+
+Runs each evaluation set through AITriageEngine.process with the cascade off
+and on. Each text is processed by both configurations back to back, so slow
+and fast periods of the machine hit both equally. Reports category accuracy,
+how often the two agree on category and urgency, the tier hit rates and the
+latency of each.
+
+Translation uses the stub backend (returns the input), as in the regression
+gate.
+
+Usage (from backend/):
+    python -m benchmarks.triage_cascade --repeats 3
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from app.ai import lang
+from app.ai.engine import AITriageEngine
+from app.ai.lang import StubTranslationBackend, TranslationService
+from app.ai.regression_gate import DATASETS
+
+
+def timed_process(engine: AITriageEngine, text: str, cascade: bool) -> tuple:
+    engine.cascade = cascade
+    start = time.perf_counter()
+    result = engine.process(text)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Triage cascade vs model-only accuracy and latency")
+    parser.add_argument("--repeats", type=int, default=3, help="Timings per text and configuration (fastest counts)")
+    args = parser.parse_args()
+
+    lang.translation_service = TranslationService(StubTranslationBackend(), timeout=5.0)
+    engine = AITriageEngine()
+    engine.warmup()
+
+    header = (
+        f"{'dataset':<13}{'size':>6}{'acc off':>9}{'acc on':>8}{'same cat':>10}{'same urg':>10}"
+        f"{'rules':>8}{'ml':>7}{'transl':>8}{'off p50':>9}{'on p50':>8}{'off mean':>10}{'on mean':>9}"
+    )
+    print(f"Latency in ms, fastest of {args.repeats} per text\n")
+    print(header)
+    print("-" * len(header))
+
+    for name, path in DATASETS.items():
+        df = pd.read_csv(path)
+        texts, expected = df["text"].tolist(), df["category"].tolist()
+
+        off = [timed_process(engine, text, False)[0] for text in texts]
+        engine.tier_counts = dict.fromkeys(engine.tier_counts, 0)
+        on = [timed_process(engine, text, True)[0] for text in texts]
+        tiers = engine.cascade_stats()["tiers"]
+
+        seconds = {False: np.full(len(texts), np.inf), True: np.full(len(texts), np.inf)}
+        for _ in range(args.repeats):
+            for i, text in enumerate(texts):
+                for cascade in (False, True):
+                    seconds[cascade][i] = min(seconds[cascade][i], timed_process(engine, text, cascade)[1])
+
+        accuracy_off = np.mean([r["category"] == c for r, c in zip(off, expected)])
+        accuracy_on = np.mean([r["category"] == c for r, c in zip(on, expected)])
+        same_category = np.mean([a["category"] == b["category"] for a, b in zip(off, on)])
+        same_urgency = np.mean([a["urgency_level"] == b["urgency_level"] for a, b in zip(off, on)])
+        off_ms, on_ms = seconds[False] * 1000, seconds[True] * 1000
+
+        print(
+            f"{name:<13}{len(texts):>6}{accuracy_off:>9.3f}{accuracy_on:>8.3f}"
+            f"{same_category:>10.3f}{same_urgency:>10.3f}"
+            f"{tiers['rules']['rate']:>8.1%}{tiers['ml']['rate']:>7.1%}{tiers['translation']['rate']:>8.1%}"
+            f"{np.median(off_ms):>9.3f}{np.median(on_ms):>8.3f}"
+            f"{off_ms.mean():>10.3f}{on_ms.mean():>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Load test: latency of an unrelated endpoint while triage is saturated
+
+Starts a small API (the real TriageClient plus an in-memory stand-in for
+GET /complaints/{id}) under uvicorn once per executor mode. For each mode it
+probes the GET endpoint idle, then again while concurrent clients keep
+POST /triage busy, and reports p50/p99.
+
+Usage (from backend/):
+    python -m benchmarks.triage_load --modes inline thread process --concurrency 16
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import asynccontextmanager
+
+import httpx
+from fastapi import FastAPI
+
+from app.ai.engine import initialize_ai_engine
+from app.services.triage_client import triage_client
+from app.services.triage_executor import triage_executor
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    initialize_ai_engine()
+    await triage_executor.start()
+    yield
+    triage_executor.shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
+
+COMPLAINTS = {
+    f"CMP{i:06d}": {"complaint_id": f"CMP{i:06d}", "title": "Streetlight broken", "status": "ASSIGNED"}
+    for i in range(1000)
+}
+
+
+@app.post("/triage")
+async def triage(complaint: dict):
+    return await triage_client.triage_complaint(complaint)
+
+
+@app.get("/complaints/{complaint_id}")
+async def get_complaint(complaint_id: str):
+    await asyncio.sleep(0)  # Stands in for the Mongo round trip
+    return COMPLAINTS.get(complaint_id, {})
+
+
+WORDS = (
+    "garbage not collected water supply cut road pothole street light broken hospital "
+    "doctor absent certificate pending harassment near bus stand drain blocked smell"
+).split()
+
+
+def percentile(samples: list, pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def probe(client: httpx.AsyncClient, count: int, interval: float) -> list:
+    latencies = []
+    for i in range(count):
+        start = time.perf_counter()
+        response = await client.get(f"/complaints/CMP{i % 1000:06d}")
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(interval)
+    return latencies
+
+
+async def saturate(client: httpx.AsyncClient, stop: asyncio.Event, seed: int, counter: list):
+    rng = random.Random(seed)
+    while not stop.is_set():
+        description = " ".join(rng.choice(WORDS) for _ in range(200))
+        await client.post("/triage", json={"title": "Complaint", "description": description, "language": "auto"})
+        counter[0] += 1
+
+
+async def measure(base_url: str, probes: int, concurrency: int) -> dict:
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+        idle = await probe(client, probes, 0.005)
+
+        stop = asyncio.Event()
+        counter = [0]
+        started = time.perf_counter()
+        load = [asyncio.create_task(saturate(client, stop, seed, counter)) for seed in range(concurrency)]
+        await asyncio.sleep(1.0)
+        busy = await probe(client, probes, 0.005)
+        stop.set()
+        await asyncio.gather(*load)
+        elapsed = time.perf_counter() - started
+
+    return {
+        "idle_p50": statistics.median(idle), "idle_p99": percentile(idle, 99),
+        "busy_p50": statistics.median(busy), "busy_p99": percentile(busy, 99),
+        "triage_rps": counter[0] / elapsed,
+    }
+
+
+def wait_until_ready(base_url: str, timeout: float = 120):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"{base_url}/complaints/CMP000000").status_code == 200:
+                return
+        except Exception:  # Connection refused while uvicorn is still booting
+            pass
+        time.sleep(0.5)
+    raise RuntimeError("Server did not start")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Event-loop latency under triage load")
+    parser.add_argument("--modes", nargs="+", default=["inline", "thread", "process"])
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent triage clients")
+    parser.add_argument("--probes", type=int, default=300, help="GET requests per phase")
+    parser.add_argument("--workers", type=int, default=2, help="TRIAGE_WORKERS")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    rows = []
+    for mode in args.modes:
+        env = dict(
+            os.environ,
+            TRIAGE_EXECUTOR=mode,
+            TRIAGE_WORKERS=str(args.workers),
+            TRIAGE_CACHE_ENABLED="false",
+        )
+        server = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "benchmarks.triage_load:app",
+             "--port", str(args.port), "--log-level", "warning"],
+            env=env,
+        )
+        try:
+            wait_until_ready(base_url)
+            rows.append((mode, asyncio.run(measure(base_url, args.probes, args.concurrency))))
+        finally:
+            server.terminate()
+            server.wait()
+
+    print(f"\nGET /complaints/{{id}} latency (ms), {args.concurrency} concurrent triage clients\n")
+    print(f"{'mode':<10}{'idle p50':>10}{'idle p99':>10}{'busy p50':>10}{'busy p99':>10}{'triage/s':>10}")
+    for mode, r in rows:
+        print(f"{mode:<10}{r['idle_p50']:>10.2f}{r['idle_p99']:>10.2f}"
+              f"{r['busy_p50']:>10.2f}{r['busy_p99']:>10.2f}{r['triage_rps']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
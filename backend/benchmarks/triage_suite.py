@@ -0,0 +1,300 @@
+"""
+Triage latency and throughput suite
+
+Generates complaint corpora of any size (1k to 1M) from the
+data/generate_dataset.py templates, with random openings, places, durations
+and closings so texts are not all identical, plus an optional share of
+regional-language rows from data/generate_multilingual.py. For each size it
+measures:
+
+    stages       per-complaint latency of each triage stage on a sample:
+                 language detection, translation (regional rows only; the
+                 multilingual model or a stubbed translation), preprocess,
+                 rules (cascade rule tier), vectorize, classify, urgency,
+                 keywords
+    end_to_end   AITriageEngine.process latency, category accuracy and
+                 the cascade tier hit rates
+    throughput   process_batch complaints/s for each batch size, over the
+                 whole corpus
+
+Cold start (import, model load, first result) is measured in fresh
+processes. Translation uses a stub backend (--translation-ms delay, returns
+the input), so results do not depend on the network.
+
+Everything is written as JSON (with the commit, model and environment) so
+runs can be compared across commits; a summary table is printed.
+
+Usage (from backend/):
+    python -m benchmarks.triage_suite --sizes 1000 10000
+    python -m benchmarks.triage_suite --sizes 1000000 --batch-sizes 64 512 --output cache/suite_1m.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, List
+
+import numpy as np
+
+from app.ai import lang
+from app.ai.analysis import AnalyzedText
+from app.ai.engine import AITriageEngine
+from app.ai.keywords import CATEGORY_KEYWORDS, match_keywords
+from app.ai.lang import StubTranslationBackend, TranslationService, detect_language
+from app.core.config import settings
+from data.generate_dataset import TEST_DATA, TRAIN_DATA, generate_variations
+from data.generate_multilingual import template_pools
+
+STAGES = ["language", "translation", "preprocess", "rules", "vectorize", "classify", "urgency", "keywords"]
+
+
+def generate_corpus(size: int, seed: int = 42, multilingual_share: float = 0.0) -> List[Dict]:
+    """
+    Complaint rows (text, category, language) built from the dataset templates
+
+    Args:
+        size: Number of complaints
+        multilingual_share: Fraction of regional-language rows
+    """
+    rng = random.Random(seed)
+    regional = [
+        (text, category, language)
+        for language, pool in template_pools().items()
+        for text, category in pool
+    ]
+    templates = {
+        category: TRAIN_DATA[category] + TEST_DATA.get(category, [])
+        for category in TRAIN_DATA
+    }
+    n_regional = sum(rng.random() < multilingual_share for _ in range(size)) if regional else 0
+    english = generate_variations(templates, size - n_regional, seed)
+    rows = [{**row, "language": "en"} for row in english]
+    for _ in range(n_regional):
+        text, category, language = rng.choice(regional)
+        rows.append({"text": text, "category": category, "language": language})
+    rng.shuffle(rows)
+    return rows
+
+
+def percentiles(seconds: List[float]) -> Dict:
+    """mean/p50/p95/p99/max of timings, in microseconds"""
+    us = np.asarray(seconds) * 1e6
+    p50, p95, p99 = np.percentile(us, [50, 95, 99])
+    return {"count": len(us), "mean_us": float(us.mean()), "p50_us": float(p50), "p95_us": float(p95),
+            "p99_us": float(p99), "max_us": float(us.max())}
+
+
+def stage_latencies(engine: AITriageEngine, texts: List[str]) -> Dict:
+    """
+    Time each stage of AITriageEngine.process separately, one complaint at a time
+
+    The translation stage runs engine.analyze, which detects the language
+    again; it is only timed for non-English texts.
+    """
+    timings = defaultdict(list)
+
+    def timed(stage, fn, *args):
+        start = time.perf_counter()
+        result = fn(*args)
+        timings[stage].append(time.perf_counter() - start)
+        return result
+
+    for text in texts:
+        detected = timed("language", detect_language, text)
+        if detected in ("en", "unknown"):
+            analyzed = AnalyzedText(text, language=detected)
+        else:
+            analyzed = timed("translation", engine.analyze, text)
+
+        timed("preprocess", lambda: analyzed.tokens)
+        rule = timed("rules", engine._rule_prediction, analyzed) if analyzed.prediction is None else None
+        if rule is not None:
+            category = rule[0]
+        elif analyzed.prediction is None:
+            X = timed("vectorize", engine._vectorize, [analyzed])
+            proba = timed("classify", engine._predict_proba, X)[0]
+            category = engine.labels[int(proba.argmax())]
+        else:
+            category = analyzed.prediction[0]
+        hits = timed("keywords", lambda: analyzed.keyword_hits)
+        timed("urgency", engine._detect_urgency, analyzed.normalized, category, hits)
+        # Keyword scan and category matching count as one keywords stage
+        start = time.perf_counter()
+        match_keywords(analyzed.normalized, CATEGORY_KEYWORDS, hits=hits)
+        timings["keywords"][-1] += time.perf_counter() - start
+
+    return {stage: percentiles(timings[stage]) for stage in STAGES if timings[stage]}
+
+
+def end_to_end(engine: AITriageEngine, rows: List[Dict]) -> Dict:
+    """process() latency per complaint, category accuracy and cascade tier hit rates"""
+    engine.tier_counts = dict.fromkeys(engine.tier_counts, 0)
+    timings, correct = [], 0
+    for row in rows:
+        start = time.perf_counter()
+        result = engine.process(row["text"])
+        timings.append(time.perf_counter() - start)
+        correct += result["category"] == row["category"]
+    return {**percentiles(timings), "accuracy": correct / len(rows), "cascade": engine.cascade_stats()}
+
+
+def throughput(engine: AITriageEngine, texts: List[str], batch_size: int) -> Dict:
+    """process_batch over the whole corpus"""
+    start = time.perf_counter()
+    for offset in range(0, len(texts), batch_size):
+        engine.process_batch(texts[offset:offset + batch_size])
+    seconds = time.perf_counter() - start
+    return {"batch_size": batch_size, "seconds": seconds, "items_per_s": len(texts) / seconds}
+
+
+def cold_start(model_format: str, runs: int) -> Dict:
+    """Median import + load and first-result time of fresh worker processes"""
+    env = dict(os.environ, PYTHONPATH=os.getcwd())
+    reports = []
+    for _ in range(runs):
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "benchmarks.model_startup", "--child", model_format],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, env=env
+        )
+        try:
+            reports.append(json.loads(proc.stdout.readline()))
+        finally:
+            proc.stdin.close()
+            proc.wait()
+    return {
+        "runs": runs,
+        "format": reports[0]["format"],
+        "load_ms": statistics.median(r["load_s"] for r in reports) * 1000,
+        "first_result_ms": statistics.median(r["first_result_s"] for r in reports) * 1000,
+    }
+
+
+def environment() -> Dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+    }
+
+
+def run_suite(
+    sizes: List[int],
+    batch_sizes: List[int],
+    latency_samples: int = 2000,
+    multilingual_share: float = 0.1,
+    translation_ms: float = 0.0,
+    cold_starts: int = 3,
+    model_format: str = settings.TRIAGE_MODEL_FORMAT,
+    seed: int = 42
+) -> Dict:
+    """
+    Run every measurement
+
+    Returns:
+        dict: JSON-serializable results
+    """
+    lang.translation_service = TranslationService(StubTranslationBackend(delay=translation_ms / 1000), timeout=5.0)
+    engine = AITriageEngine(model_format=model_format)
+    engine.warmup()
+
+    result = {
+        "environment": environment(),
+        "model": {"format": engine.model_format, "version": engine.model_version,
+                  "multilingual": engine.multilingual_model is not None},
+        "config": {"sizes": sizes, "batch_sizes": batch_sizes, "latency_samples": latency_samples,
+                   "multilingual_share": multilingual_share, "translation_ms": translation_ms, "seed": seed},
+        "cold_start": cold_start(engine.model_format, cold_starts) if cold_starts else None,
+        "corpora": [],
+    }
+
+    for size in sizes:
+        start = time.perf_counter()
+        rows = generate_corpus(size, seed, multilingual_share)
+        generate_seconds = time.perf_counter() - start
+        texts = [row["text"] for row in rows]
+        sample = rows[:latency_samples]
+
+        result["corpora"].append({
+            "size": size,
+            "generate_seconds": generate_seconds,
+            "stages": stage_latencies(engine, [row["text"] for row in sample]),
+            "end_to_end": end_to_end(engine, sample),
+            "throughput": [throughput(engine, texts, batch_size) for batch_size in batch_sizes],
+        })
+    return result
+
+
+def print_report(result: Dict) -> None:
+    model = result["model"]
+    print(f"Model {model['version']} ({model['format']}), commit {result['environment']['commit']}")
+    if result["cold_start"]:
+        cold = result["cold_start"]
+        print(f"Cold start: load {cold['load_ms']:.0f} ms, first result {cold['first_result_ms']:.0f} ms "
+              f"(median of {cold['runs']})")
+
+    for corpus in result["corpora"]:
+        print(f"\n{corpus['size']} complaints (generated in {corpus['generate_seconds']:.1f}s)")
+        header = f"{'stage':<14}{'count':>8}{'mean us':>10}{'p50 us':>10}{'p95 us':>10}{'p99 us':>10}"
+        print(header)
+        print("-" * len(header))
+        for stage, stats in list(corpus["stages"].items()) + [("end to end", corpus["end_to_end"])]:
+            print(f"{stage:<14}{stats['count']:>8}{stats['mean_us']:>10.1f}{stats['p50_us']:>10.1f}"
+                  f"{stats['p95_us']:>10.1f}{stats['p99_us']:>10.1f}")
+        tiers = corpus["end_to_end"]["cascade"]["tiers"]
+        print(f"accuracy {corpus['end_to_end']['accuracy']:.3f}, cascade tiers: "
+              + ", ".join(f"{tier} {stats['rate']:.1%}" for tier, stats in tiers.items()))
+        print("batch size -> complaints/s: " + ", ".join(
+            f"{run['batch_size']}: {run['items_per_s']:.0f}" for run in corpus["throughput"]
+        ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Triage latency and throughput suite")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000], help="Corpus sizes")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 16, 64, 256])
+    parser.add_argument("--latency-samples", type=int, default=2000, help="Complaints timed per stage")
+    parser.add_argument("--multilingual-share", type=float, default=0.1)
+    parser.add_argument("--translation-ms", type=float, default=0.0, help="Stub translation delay")
+    parser.add_argument("--cold-starts", type=int, default=3, help="Fresh processes for cold start (0 to skip)")
+    parser.add_argument("--model-format", default=settings.TRIAGE_MODEL_FORMAT,
+                        choices=["compact", "joblib", "lean"])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="./cache/triage_suite.json", help="JSON results file")
+    args = parser.parse_args()
+
+    result = run_suite(
+        sizes=args.sizes,
+        batch_sizes=args.batch_sizes,
+        latency_samples=args.latency_samples,
+        multilingual_share=args.multilingual_share,
+        translation_ms=args.translation_ms,
+        cold_starts=args.cold_starts,
+        model_format=args.model_format,
+        seed=args.seed
+    )
+    print_report(result)
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(result, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
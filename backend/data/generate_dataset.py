@@ -1,5 +1,6 @@
 import pandas as pd
 import os
+import random
 
 # Training data - 180 samples (30 per category)
 TRAIN_DATA = {
@@ -197,21 +198,6 @@ TRAIN_DATA = {
     ]
 }
 
-# Generate training CSV
-train_rows = []
-for category, texts in TRAIN_DATA.items():
-    for text in texts:
-        train_rows.append({"text": text, "category": category})
-
-train_df = pd.DataFrame(train_rows)
-train_df = train_df.sample(frac=1, random_state=42).reset_index(drop=True)
-
-# Save
-os.makedirs("data", exist_ok=True)
-train_df.to_csv("data/complaints_train.csv", index=False)
-print(f"✅ Generated {len(train_df)} training samples")
-print(f"📊 Category distribution:\n{train_df['category'].value_counts()}")
-
 # Generate test data (30 samples - 5 per category)
 TEST_DATA = {
     "Infrastructure": [
@@ -258,11 +244,54 @@ TEST_DATA = {
     ]
 }
 
-test_rows = []
-for category, texts in TEST_DATA.items():
-    for text in texts:
-        test_rows.append({"text": text, "category": category})
+# Decorations for synthetic variations of the templates
+OPENINGS = ["", "", "", "Urgent: ", "Please help, ", "Complaint: ", "Sir, ", "Again reporting - "]
+PLACES = ["", "", "", " near the market", " in ward 12", " opposite the bus stand", " behind the school",
+          " on MG road", " in our colony"]
+DURATIONS = ["", "", " since last week", " for 3 days", " from yesterday", " since two months"]
+CLOSINGS = ["", "", "", ". Please act soon.", ". No action taken yet.", ". Kindly resolve.", "!!"]
+
+def generate_variations(data: dict, size: int, seed: int = 42) -> list:
+    """
+    Sample (text, category) rows from {category: [templates]} with random
+    openings, places, durations and closings
+    """
+    rng = random.Random(seed)
+    templates = [(text, category) for category, texts in data.items() for text in texts]
+    rows = []
+    for _ in range(size):
+        text, category = rng.choice(templates)
+        text = f"{rng.choice(OPENINGS)}{text}{rng.choice(PLACES)}{rng.choice(DURATIONS)}{rng.choice(CLOSINGS)}"
+        rows.append({"text": text, "category": category})
+    return rows
+
+
+if __name__ == "__main__":
+    # Generate training CSV
+    train_rows = []
+    for category, texts in TRAIN_DATA.items():
+        for text in texts:
+            train_rows.append({"text": text, "category": category})
+
+    train_df = pd.DataFrame(train_rows)
+    train_df = train_df.sample(frac=1, random_state=42).reset_index(drop=True)
+
+    # Save
+    os.makedirs("data", exist_ok=True)
+    train_df.to_csv("data/complaints_train.csv", index=False)
+    print(f"✅ Generated {len(train_df)} training samples")
+    print(f"📊 Category distribution:\n{train_df['category'].value_counts()}")
+
+    test_rows = []
+    for category, texts in TEST_DATA.items():
+        for text in texts:
+            test_rows.append({"text": text, "category": category})
+
+    test_df = pd.DataFrame(test_rows)
+    test_df.to_csv("data/complaints_test.csv", index=False)
+    print(f"✅ Generated {len(test_df)} test samples")
 
-test_df = pd.DataFrame(test_rows)
-test_df.to_csv("data/complaints_test.csv", index=False)
-print(f"✅ Generated {len(test_df)} test samples")
+    # Synthetic holdout: variations of the test templates, never seen in training
+    holdout_df = pd.DataFrame(generate_variations(TEST_DATA, 2000, seed=7))
+    holdout_df.to_csv("data/complaints_holdout.csv", index=False)
+    print(f"✅ Generated {len(holdout_df)} holdout samples")
@@ -0,0 +1,566 @@
+"""
+Multilingual complaint generator
+
+Regional-language versions of the complaint templates in generate_dataset.py,
+used to evaluate language detection and train the multilingual classifier.
+The train/test split holds out one template per language and category, so
+test sentences are never seen during training.
+
+Usage (from backend/):
+    python data/generate_multilingual.py
+"""
+import os
+import random
+
+import pandas as pd
+
+MULTILINGUAL_DATA = {
+    "hi": {
+        "Infrastructure": [
+            "सड़क पर बड़ा गड्ढा है, दुर्घटना का खतरा है",
+            "पुल की हालत बहुत खराब है मरम्मत की जरूरत है",
+            "ट्रैफिक सिग्नल कई दिनों से काम नहीं कर रहा",
+            "फुटपाथ टूटा हुआ है लोग गिर रहे हैं",
+            "मुख्य सड़क पर मैनहोल का ढक्कन गायब है",
+            "बारिश के बाद पूरी सड़क टूट गई है",
+            "गली की दीवार गिरने वाली है, बच्चों को खतरा है",
+            "स्पीड ब्रेकर टूट गया है और गाड़ियां तेज चलती हैं",
+            "पुल में दरार आ गई है",
+            "सड़क का निर्माण कई महीनों से अधूरा पड़ा है"
+        ],
+        "Sanitation": [
+            "पांच दिनों से कचरा नहीं उठाया गया है",
+            "नाली जाम है और गंदा पानी सड़क पर बह रहा है",
+            "सार्वजनिक शौचालय बहुत गंदा है",
+            "सीवर का पानी घरों में घुस रहा है, बहुत बदबू है",
+            "कूड़ेदान भरा हुआ है और बदबू आ रही है",
+            "लोग खुले में कचरा जला रहे हैं, धुआं फैल रहा है",
+            "सड़क पर मरा हुआ जानवर पड़ा है, कोई हटा नहीं रहा",
+            "रुके हुए पानी में मच्छर पनप रहे हैं",
+            "सफाई कर्मचारी हफ्ते भर से नहीं आया",
+            "कचरा गाड़ी हमारी गली में नहीं आती"
+        ],
+        "Utilities": [
+            "सुबह से बिजली नहीं है",
+            "हमारे इलाके में पानी की आपूर्ति बंद है",
+            "ट्रांसफार्मर से चिंगारी निकल रही है",
+            "स्ट्रीट लाइट कई दिनों से खराब है",
+            "बिजली का बिल गलत आया है",
+            "नल में गंदा पानी आ रहा है",
+            "दिन में कई बार बिजली कटती है",
+            "बिजली का तार नीचे लटक रहा है",
+            "बिजली का मीटर खराब हो गया है",
+            "पानी का टैंकर तीन दिन से नहीं आया"
+        ],
+        "Safety": [
+            "बस स्टैंड के पास कोई मुझे धमकी दे रहा है",
+            "कल रात हमारे मोहल्ले में चोरी हुई",
+            "कॉलेज के पास लड़कियों के साथ छेड़छाड़ हो रही है",
+            "रात में पुलिस गश्त नहीं होती, इलाका असुरक्षित है",
+            "शराब की दुकान के पास रोज़ लड़ाई होती है",
+            "गली में अंधेरा रहता है, महिलाओं के लिए असुरक्षित है",
+            "बाजार में चेन छीनने की घटना हुई",
+            "आवारा कुत्तों ने बच्चे को काट लिया",
+            "रात को शराबी लोग गाड़ी तेज चलाते हैं",
+            "पार्क में रोज़ रात को झगड़ा और मारपीट होती है"
+        ],
+        "Health": [
+            "सरकारी अस्पताल में डॉक्टर उपलब्ध नहीं है",
+            "एम्बुलेंस बहुत देर से आई, मरीज़ की हालत गंभीर है",
+            "स्वास्थ्य केंद्र में दवाइयों की कमी है",
+            "इलाके में डेंगू फैल रहा है",
+            "अस्पताल का स्टाफ लापरवाह है",
+            "अस्पताल में मरीजों की लंबी लाइन है, कोई सुनवाई नहीं",
+            "मोहल्ले में मलेरिया के कई मामले आए हैं",
+            "अस्पताल के वार्ड बहुत गंदे हैं",
+            "स्वास्थ्य केंद्र में टीका उपलब्ध नहीं है",
+            "अस्पताल में बिस्तर खाली नहीं है, मरीज़ ज़मीन पर हैं"
+        ],
+        "Administrative": [
+            "जन्म प्रमाण पत्र का आवेदन तीन महीने से लंबित है",
+            "राशन कार्ड अभी तक नहीं बना",
+            "कार्यालय में कर्मचारी रिश्वत मांग रहा है",
+            "पेंशन पिछले चार महीने से नहीं मिली",
+            "दस्तावेज़ सत्यापन में बहुत देरी हो रही है",
+            "जाति प्रमाण पत्र दो महीने से नहीं मिला",
+            "संपत्ति कर का बिल गलत भेजा गया है",
+            "कार्यालय से मेरी शिकायत का कोई जवाब नहीं आया",
+            "ज़मीन के रिकॉर्ड में नाम गलत लिखा है",
+            "छात्रवृत्ति का पैसा अभी तक नहीं आया"
+        ]
+    },
+    "mr": {
+        "Infrastructure": [
+            "रस्त्यावर मोठा खड्डा पडला आहे",
+            "पूल धोकादायक अवस्थेत आहे",
+            "सिग्नल बंद असल्यामुळे अपघात होत आहेत",
+            "फुटपाथ तुटलेला आहे",
+            "गटाराचे झाकण उघडे आहे",
+            "पावसानंतर संपूर्ण रस्ता खराब झाला आहे",
+            "गल्लीतील भिंत कोसळण्याच्या स्थितीत आहे, मुलांना धोका आहे",
+            "गतिरोधक तुटला आहे आणि वाहने वेगाने जातात",
+            "पुलाला तडे गेले आहेत",
+            "रस्त्याचे काम अनेक महिन्यांपासून अपूर्ण आहे"
+        ],
+        "Sanitation": [
+            "पाच दिवसांपासून कचरा उचलला गेला नाही",
+            "गटार तुंबले आहे आणि दुर्गंधी येत आहे",
+            "सार्वजनिक शौचालय खूप घाण आहे",
+            "कचराकुंडी भरून वाहत आहे",
+            "नाल्याची सफाई झालेली नाही",
+            "लोक उघड्यावर कचरा जाळत आहेत, धूर पसरत आहे",
+            "रस्त्यावर मेलेले जनावर पडले आहे, कोणी उचलत नाही",
+            "साचलेल्या पाण्यात डास वाढत आहेत",
+            "सफाई कामगार आठवडाभर आला नाही",
+            "घंटागाडी आमच्या गल्लीत येत नाही"
+        ],
+        "Utilities": [
+            "सकाळपासून वीज नाही",
+            "आमच्या भागात पाणीपुरवठा बंद आहे",
+            "रस्त्यावरील दिवे बंद आहेत",
+            "विजेचे बिल चुकीचे आले आहे",
+            "पाण्याची पाईपलाईन फुटली आहे",
+            "नळाला गढूळ पाणी येत आहे",
+            "दिवसातून अनेक वेळा वीज जाते",
+            "विजेची तार खाली लोंबकळत आहे",
+            "वीज मीटर खराब झाला आहे",
+            "पाण्याचा टँकर तीन दिवसांपासून आला नाही"
+        ],
+        "Safety": [
+            "बस स्थानकाजवळ कोणीतरी मला धमकी देत आहे",
+            "काल रात्री आमच्या परिसरात चोरी झाली",
+            "रात्री पोलीस गस्त नसते, परिसर असुरक्षित आहे",
+            "कॉलेजजवळ मुलींची छेड काढली जाते",
+            "दारूच्या दुकानाजवळ रोज भांडणे होतात",
+            "गल्लीत अंधार असतो, महिलांसाठी असुरक्षित आहे",
+            "बाजारात सोनसाखळी चोरीची घटना घडली",
+            "भटक्या कुत्र्यांनी मुलाला चावा घेतला",
+            "रात्री दारू पिऊन लोक वेगाने गाडी चालवतात",
+            "बागेत रोज रात्री भांडणे आणि मारामारी होते"
+        ],
+        "Health": [
+            "सरकारी रुग्णालयात डॉक्टर उपलब्ध नाहीत",
+            "रुग्णवाहिका उशिरा आली, रुग्णाची प्रकृती गंभीर आहे",
+            "आरोग्य केंद्रात औषधांचा तुटवडा आहे",
+            "परिसरात डेंग्यूची साथ पसरली आहे",
+            "रुग्णालयातील कर्मचारी निष्काळजी आहेत",
+            "रुग्णालयात रुग्णांची लांब रांग आहे, कोणी ऐकत नाही",
+            "परिसरात मलेरियाचे अनेक रुग्ण आढळले आहेत",
+            "रुग्णालयातील वॉर्ड खूप अस्वच्छ आहेत",
+            "आरोग्य केंद्रात लस उपलब्ध नाही",
+            "रुग्णालयात खाटा रिकाम्या नाहीत, रुग्ण जमिनीवर आहेत"
+        ],
+        "Administrative": [
+            "जन्म दाखल्याचा अर्ज तीन महिन्यांपासून प्रलंबित आहे",
+            "रेशन कार्ड अजून मिळाले नाही",
+            "कार्यालयातील कर्मचारी लाच मागत आहे",
+            "चार महिन्यांपासून पेन्शन मिळाली नाही",
+            "कागदपत्र पडताळणीला खूप उशीर होत आहे",
+            "जातीचा दाखला दोन महिन्यांपासून मिळाला नाही",
+            "मालमत्ता कराचे बिल चुकीचे पाठवले आहे",
+            "कार्यालयाकडून माझ्या तक्रारीला उत्तर आले नाही",
+            "सातबारा उताऱ्यावर नाव चुकीचे आहे",
+            "शिष्यवृत्तीचे पैसे अजून मिळाले नाहीत"
+        ]
+    },
+    "bn": {
+        "Infrastructure": [
+            "রাস্তায় বড় গর্ত হয়েছে, দুর্ঘটনার ভয় আছে",
+            "সেতুর অবস্থা খুব খারাপ",
+            "ট্রাফিক সিগন্যাল কাজ করছে না",
+            "ফুটপাত ভেঙে গেছে",
+            "ম্যানহোলের ঢাকনা নেই",
+            "বৃষ্টির পরে পুরো রাস্তা ভেঙে গেছে",
+            "গলির দেয়াল ভেঙে পড়ার মতো অবস্থা, শিশুদের বিপদ",
+            "স্পিড ব্রেকার ভেঙে গেছে, গাড়ি জোরে চলে",
+            "সেতুতে ফাটল দেখা দিয়েছে",
+            "রাস্তার কাজ কয়েক মাস ধরে অসম্পূর্ণ পড়ে আছে"
+        ],
+        "Sanitation": [
+            "পাঁচ দিন ধরে আবর্জনা তোলা হয়নি",
+            "নর্দমা আটকে গেছে, নোংরা জল রাস্তায়",
+            "পাবলিক টয়লেট খুব নোংরা",
+            "ডাস্টবিন উপচে পড়ছে, দুর্গন্ধ আসছে",
+            "ড্রেন পরিষ্কার করা হয়নি",
+            "লোকেরা খোলা জায়গায় আবর্জনা পোড়াচ্ছে, ধোঁয়া ছড়াচ্ছে",
+            "রাস্তায় মরা পশু পড়ে আছে, কেউ সরাচ্ছে না",
+            "জমে থাকা জলে মশা জন্মাচ্ছে",
+            "সাফাই কর্মী এক সপ্তাহ ধরে আসেনি",
+            "ময়লার গাড়ি আমাদের গলিতে আসে না"
+        ],
+        "Utilities": [
+            "সকাল থেকে বিদ্যুৎ নেই",
+            "আমাদের এলাকায় জল সরবরাহ বন্ধ",
+            "রাস্তার আলো জ্বলছে না",
+            "বিদ্যুতের বিল ভুল এসেছে",
+            "জলের পাইপ ফেটে গেছে",
+            "কলে নোংরা জল আসছে",
+            "দিনে কয়েকবার বিদ্যুৎ চলে যায়",
+            "বিদ্যুতের তার নিচে ঝুলছে",
+            "বিদ্যুতের মিটার খারাপ হয়ে গেছে",
+            "জলের ট্যাংকার তিন দিন ধরে আসেনি"
+        ],
+        "Safety": [
+            "বাস স্ট্যান্ডের কাছে কেউ আমাকে হুমকি দিচ্ছে",
+            "গত রাতে আমাদের পাড়ায় চুরি হয়েছে",
+            "রাতে পুলিশের টহল নেই, এলাকা অনিরাপদ",
+            "কলেজের কাছে মেয়েদের হয়রানি করা হচ্ছে",
+            "মদের দোকানের কাছে রোজ মারামারি হয়",
+            "গলিতে অন্ধকার থাকে, মহিলাদের জন্য অনিরাপদ",
+            "বাজারে চেন ছিনতাইয়ের ঘটনা ঘটেছে",
+            "রাস্তার কুকুর একটি শিশুকে কামড়েছে",
+            "রাতে মাতাল লোকেরা জোরে গাড়ি চালায়",
+            "পার্কে প্রতি রাতে ঝগড়া আর মারামারি হয়"
+        ],
+        "Health": [
+            "সরকারি হাসপাতালে ডাক্তার নেই",
+            "অ্যাম্বুলেন্স অনেক দেরিতে এসেছে, রোগীর অবস্থা গুরুতর",
+            "স্বাস্থ্য কেন্দ্রে ওষুধের অভাব",
+            "এলাকায় ডেঙ্গু ছড়াচ্ছে",
+            "হাসপাতালের কর্মীরা অবহেলা করছে",
+            "হাসপাতালে রোগীদের লম্বা লাইন, কেউ শোনে না",
+            "এলাকায় ম্যালেরিয়ার অনেক রোগী পাওয়া গেছে",
+            "হাসপাতালের ওয়ার্ড খুব নোংরা",
+            "স্বাস্থ্য কেন্দ্রে টিকা পাওয়া যাচ্ছে না",
+            "হাসপাতালে বেড খালি নেই, রোগীরা মেঝেতে আছে"
+        ],
+        "Administrative": [
+            "জন্ম সনদের আবেদন তিন মাস ধরে আটকে আছে",
+            "রেশন কার্ড এখনও পাইনি",
+            "অফিসের কর্মচারী ঘুষ চাইছে",
+            "চার মাস ধরে পেনশন পাইনি",
+            "নথি যাচাইয়ে অনেক দেরি হচ্ছে",
+            "জাতি শংসাপত্র দুই মাস ধরে পাইনি",
+            "সম্পত্তি করের বিল ভুল পাঠানো হয়েছে",
+            "অফিস থেকে আমার অভিযোগের কোনো উত্তর আসেনি",
+            "জমির রেকর্ডে নাম ভুল লেখা আছে",
+            "বৃত্তির টাকা এখনও আসেনি"
+        ]
+    },
+    "ta": {
+        "Infrastructure": [
+            "சாலையில் பெரிய பள்ளம் உள்ளது, விபத்து ஏற்படும் அபாயம்",
+            "பாலம் மிகவும் மோசமான நிலையில் உள்ளது",
+            "போக்குவரத்து சிக்னல் வேலை செய்யவில்லை",
+            "நடைபாதை உடைந்துள்ளது",
+            "பாதாள சாக்கடை மூடி இல்லை",
+            "மழைக்குப் பிறகு சாலை முழுவதும் சேதமடைந்துள்ளது",
+            "தெருவின் சுவர் இடிந்து விழும் நிலையில் உள்ளது, குழந்தைகளுக்கு ஆபத்து",
+            "வேகத்தடை உடைந்துள்ளது, வாகனங்கள் வேகமாக செல்கின்றன",
+            "பாலத்தில் விரிசல் ஏற்பட்டுள்ளது",
+            "சாலை வேலை பல மாதங்களாக முடிக்கப்படவில்லை"
+        ],
+        "Sanitation": [
+            "ஐந்து நாட்களாக குப்பை அள்ளப்படவில்லை",
+            "சாக்கடை அடைத்துக் கொண்டு கழிவுநீர் தெருவில் ஓடுகிறது",
+            "பொது கழிப்பறை மிகவும் அசுத்தமாக உள்ளது",
+            "குப்பைத் தொட்டி நிரம்பி துர்நாற்றம் வீசுகிறது",
+            "கால்வாய் சுத்தம் செய்யப்படவில்லை",
+            "மக்கள் திறந்த வெளியில் குப்பையை எரிக்கிறார்கள், புகை பரவுகிறது",
+            "சாலையில் இறந்த விலங்கு கிடக்கிறது, யாரும் அகற்றவில்லை",
+            "தேங்கிய நீரில் கொசுக்கள் பெருகுகின்றன",
+            "துப்புரவு பணியாளர் ஒரு வாரமாக வரவில்லை",
+            "குப்பை வண்டி எங்கள் தெருவுக்கு வருவதில்லை"
+        ],
+        "Utilities": [
+            "காலை முதல் மின்சாரம் இல்லை",
+            "எங்கள் பகுதியில் குடிநீர் விநியோகம் நின்றுவிட்டது",
+            "தெரு விளக்குகள் எரியவில்லை",
+            "மின் கட்டணம் தவறாக வந்துள்ளது",
+            "குடிநீர் குழாய் உடைந்துள்ளது",
+            "குழாயில் அழுக்கு தண்ணீர் வருகிறது",
+            "ஒரு நாளில் பல முறை மின்சாரம் துண்டிக்கப்படுகிறது",
+            "மின் கம்பி கீழே தொங்குகிறது",
+            "மின் மீட்டர் பழுதடைந்துள்ளது",
+            "தண்ணீர் லாரி மூன்று நாட்களாக வரவில்லை"
+        ],
+        "Safety": [
+            "பேருந்து நிலையம் அருகே ஒருவர் என்னை மிரட்டுகிறார்",
+            "நேற்று இரவு எங்கள் தெருவில் திருட்டு நடந்தது",
+            "இரவில் காவல் ரோந்து இல்லை, பகுதி பாதுகாப்பற்றது",
+            "கல்லூரி அருகே பெண்களுக்கு தொல்லை கொடுக்கப்படுகிறது",
+            "மதுக்கடை அருகே தினமும் சண்டை நடக்கிறது",
+            "தெருவில் இருட்டாக உள்ளது, பெண்களுக்கு பாதுகாப்பில்லை",
+            "சந்தையில் சங்கிலி பறிப்பு சம்பவம் நடந்தது",
+            "தெரு நாய்கள் ஒரு குழந்தையை கடித்தன",
+            "இரவில் குடிபோதையில் வாகனங்களை வேகமாக ஓட்டுகிறார்கள்",
+            "பூங்காவில் தினமும் இரவு சண்டை நடக்கிறது"
+        ],
+        "Health": [
+            "அரசு மருத்துவமனையில் மருத்துவர் இல்லை",
+            "ஆம்புலன்ஸ் தாமதமாக வந்தது, நோயாளியின் நிலை கவலைக்கிடம்",
+            "சுகாதார நிலையத்தில் மருந்து பற்றாக்குறை",
+            "பகுதியில் டெங்கு காய்ச்சல் பரவுகிறது",
+            "மருத்துவமனை ஊழியர்கள் அலட்சியமாக உள்ளனர்",
+            "மருத்துவமனையில் நோயாளிகளின் நீண்ட வரிசை, யாரும் கவனிக்கவில்லை",
+            "பகுதியில் மலேரியா நோயாளிகள் அதிகரித்துள்ளனர்",
+            "மருத்துவமனை வார்டுகள் மிகவும் அசுத்தமாக உள்ளன",
+            "சுகாதார நிலையத்தில் தடுப்பூசி கிடைக்கவில்லை",
+            "மருத்துவமனையில் படுக்கை இல்லை, நோயாளிகள் தரையில் உள்ளனர்"
+        ],
+        "Administrative": [
+            "பிறப்பு சான்றிதழ் விண்ணப்பம் மூன்று மாதங்களாக நிலுவையில் உள்ளது",
+            "ரேஷன் கார்டு இன்னும் கிடைக்கவில்லை",
+            "அலுவலக ஊழியர் லஞ்சம் கேட்கிறார்",
+            "நான்கு மாதங்களாக ஓய்வூதியம் வரவில்லை",
+            "ஆவண சரிபார்ப்பில் அதிக தாமதம்",
+            "சாதி சான்றிதழ் இரண்டு மாதங்களாக கிடைக்கவில்லை",
+            "சொத்து வரி பில் தவறாக அனுப்பப்பட்டுள்ளது",
+            "அலுவலகத்திலிருந்து என் புகாருக்கு பதில் வரவில்லை",
+            "நில பதிவேட்டில் பெயர் தவறாக உள்ளது",
+            "உதவித்தொகை இன்னும் வரவில்லை"
+        ]
+    },
+    "te": {
+        "Infrastructure": [
+            "రోడ్డుపై పెద్ద గుంత ఉంది, ప్రమాదం జరిగే అవకాశం ఉంది",
+            "వంతెన చాలా దారుణమైన స్థితిలో ఉంది",
+            "ట్రాఫిక్ సిగ్నల్ పనిచేయడం లేదు",
+            "ఫుట్‌పాత్ విరిగిపోయింది",
+            "మ్యాన్‌హోల్ మూత లేదు",
+            "వర్షం తర్వాత రోడ్డు మొత్తం పాడైపోయింది",
+            "వీధి గోడ కూలిపోయే స్థితిలో ఉంది, పిల్లలకు ప్రమాదం",
+            "స్పీడ్ బ్రేకర్ విరిగిపోయింది, వాహనాలు వేగంగా వెళ్తున్నాయి",
+            "వంతెనకు పగుళ్లు వచ్చాయి",
+            "రోడ్డు పని చాలా నెలలుగా పూర్తి కాలేదు"
+        ],
+        "Sanitation": [
+            "ఐదు రోజులుగా చెత్త తీయలేదు",
+            "మురుగు కాలువ మూసుకుపోయింది, మురికి నీరు రోడ్డుపై ప్రవహిస్తోంది",
+            "పబ్లిక్ టాయిలెట్ చాలా మురికిగా ఉంది",
+            "చెత్త డబ్బా నిండిపోయి దుర్వాసన వస్తోంది",
+            "కాలువ శుభ్రం చేయలేదు",
+            "ప్రజలు బహిరంగంగా చెత్తను కాల్చుతున్నారు, పొగ వ్యాపిస్తోంది",
+            "రోడ్డుపై చనిపోయిన జంతువు పడి ఉంది, ఎవరూ తీయడం లేదు",
+            "నిలిచిన నీటిలో దోమలు పెరుగుతున్నాయి",
+            "పారిశుద్ధ్య కార్మికుడు వారం రోజులుగా రాలేదు",
+            "చెత్త బండి మా వీధికి రావడం లేదు"
+        ],
+        "Utilities": [
+            "ఉదయం నుండి కరెంట్ లేదు",
+            "మా ప్రాంతంలో నీటి సరఫరా ఆగిపోయింది",
+            "వీధి దీపాలు వెలగడం లేదు",
+            "కరెంట్ బిల్లు తప్పుగా వచ్చింది",
+            "నీటి పైపు పగిలిపోయింది",
+            "కుళాయిలో మురికి నీరు వస్తోంది",
+            "రోజుకు చాలాసార్లు కరెంటు పోతోంది",
+            "కరెంటు తీగ కిందకు వేలాడుతోంది",
+            "విద్యుత్ మీటర్ పాడైపోయింది",
+            "నీటి ట్యాంకర్ మూడు రోజులుగా రాలేదు"
+        ],
+        "Safety": [
+            "బస్ స్టాండ్ దగ్గర ఎవరో నన్ను బెదిరిస్తున్నారు",
+            "నిన్న రాత్రి మా కాలనీలో దొంగతనం జరిగింది",
+            "రాత్రి పోలీసు గస్తీ లేదు, ప్రాంతం సురక్షితం కాదు",
+            "కాలేజీ దగ్గర అమ్మాయిలను వేధిస్తున్నారు",
+            "మద్యం దుకాణం దగ్గర రోజూ గొడవలు జరుగుతున్నాయి",
+            "వీధిలో చీకటిగా ఉంది, మహిళలకు సురక్షితం కాదు",
+            "మార్కెట్లో గొలుసు దొంగతనం జరిగింది",
+            "వీధి కుక్కలు ఒక పిల్లవాడిని కరిచాయి",
+            "రాత్రి తాగి వాహనాలు వేగంగా నడుపుతున్నారు",
+            "పార్కులో ప్రతి రాత్రి గొడవలు జరుగుతున్నాయి"
+        ],
+        "Health": [
+            "ప్రభుత్వ ఆసుపత్రిలో డాక్టర్ లేరు",
+            "అంబులెన్స్ ఆలస్యంగా వచ్చింది, రోగి పరిస్థితి విషమంగా ఉంది",
+            "ఆరోగ్య కేంద్రంలో మందుల కొరత ఉంది",
+            "ప్రాంతంలో డెంగ్యూ వ్యాపిస్తోంది",
+            "ఆసుపత్రి సిబ్బంది నిర్లక్ష్యంగా ఉన్నారు",
+            "ఆసుపత్రిలో రోగుల పొడవైన క్యూ ఉంది, ఎవరూ పట్టించుకోవడం లేదు",
+            "ప్రాంతంలో మలేరియా కేసులు పెరిగాయి",
+            "ఆసుపత్రి వార్డులు చాలా అపరిశుభ్రంగా ఉన్నాయి",
+            "ఆరోగ్య కేంద్రంలో టీకా అందుబాటులో లేదు",
+            "ఆసుపత్రిలో పడకలు లేవు, రోగులు నేలపై ఉన్నారు"
+        ],
+        "Administrative": [
+            "జనన ధృవీకరణ పత్రం దరఖాస్తు మూడు నెలలుగా పెండింగ్‌లో ఉంది",
+            "రేషన్ కార్డు ఇంకా రాలేదు",
+            "కార్యాలయ ఉద్యోగి లంచం అడుగుతున్నాడు",
+            "నాలుగు నెలలుగా పెన్షన్ రాలేదు",
+            "పత్రాల ధృవీకరణలో చాలా ఆలస్యం",
+            "కుల ధృవీకరణ పత్రం రెండు నెలలుగా రాలేదు",
+            "ఆస్తి పన్ను బిల్లు తప్పుగా పంపారు",
+            "కార్యాలయం నుండి నా ఫిర్యాదుకు సమాధానం రాలేదు",
+            "భూమి రికార్డులో పేరు తప్పుగా ఉంది",
+            "స్కాలర్‌షిప్ డబ్బు ఇంకా రాలేదు"
+        ]
+    },
+    "hi-Latn": {
+        "Infrastructure": [
+            "sadak par bahut bada gaddha hai",
+            "pul ki halat bahut kharab hai",
+            "traffic signal kaam nahi kar raha",
+            "footpath toota hua hai log gir rahe hain",
+            "manhole ka dhakkan gayab hai",
+            "baarish ke baad poori sadak toot gayi hai",
+            "gali ki deewar girne wali hai bachon ko khatra hai",
+            "speed breaker toot gaya hai gaadiyan tez chalti hain",
+            "pul mein daraar aa gayi hai",
+            "sadak ka kaam kai mahino se adhoora pada hai"
+        ],
+        "Sanitation": [
+            "paanch din se kachra nahi uthaya gaya",
+            "naali jaam hai ganda paani sadak par beh raha hai",
+            "shauchalay bahut ganda hai",
+            "kooda daan bhara hua hai badbu aa rahi hai",
+            "nali ki safai nahi hui",
+            "log khule mein kachra jala rahe hain dhuan fail raha hai",
+            "sadak par mara hua janwar pada hai koi nahi hata raha",
+            "ruke hue paani mein machhar badh rahe hain",
+            "safai karmchari hafte bhar se nahi aaya",
+            "kachra gaadi hamari gali mein nahi aati"
+        ],
+        "Utilities": [
+            "subah se bijli nahi hai",
+            "hamare mohalle mein paani nahi aa raha",
+            "street light kai dino se kharab hai",
+            "bijli ka bill galat aaya hai",
+            "paani ki pipe phat gayi hai",
+            "nal mein ganda paani aa raha hai",
+            "din mein kai baar bijli kat jaati hai",
+            "bijli ka taar neeche latak raha hai",
+            "bijli ka meter kharab ho gaya hai",
+            "paani ka tanker teen din se nahi aaya"
+        ],
+        "Safety": [
+            "bus stand ke paas koi mujhe dhamki de raha hai",
+            "kal raat mohalle mein chori hui",
+            "raat ko police gasht nahi hoti",
+            "college ke paas ladkiyon ko pareshan karte hain",
+            "sharab ki dukaan ke paas roz ladai hoti hai",
+            "gali mein andhera rehta hai mahilaon ke liye asurakshit hai",
+            "bazaar mein chain snatching hui",
+            "awara kutton ne bachche ko kaat liya",
+            "raat ko sharabi log gaadi tez chalate hain",
+            "park mein roz raat ko jhagda aur maarpeet hoti hai"
+        ],
+        "Health": [
+            "sarkari aspatal mein doctor nahi hai",
+            "ambulance bahut der se aayi mareez ki halat gambhir hai",
+            "swasthya kendra mein dawai nahi hai",
+            "ilake mein dengue fail raha hai",
+            "aspatal ka staff laparwah hai",
+            "aspatal mein mareezon ki lambi line hai koi sunwai nahi",
+            "mohalle mein malaria ke kai case aaye hain",
+            "aspatal ke ward bahut gande hain",
+            "swasthya kendra mein teeka nahi hai",
+            "aspatal mein bed khali nahi hai mareez zameen par hain"
+        ],
+        "Administrative": [
+            "janm praman patra ka aavedan teen mahine se atka hai",
+            "ration card abhi tak nahi bana",
+            "daftar mein karmachari rishwat maang raha hai",
+            "chaar mahine se pension nahi mili",
+            "dastavez satyapan mein bahut deri ho rahi hai",
+            "jaati praman patra do mahine se nahi mila",
+            "property tax ka bill galat bheja gaya hai",
+            "daftar se meri shikayat ka koi jawab nahi aaya",
+            "zameen ke record mein naam galat likha hai",
+            "scholarship ka paisa abhi tak nahi aaya"
+        ]
+    }
+}
+
+# Language-specific phrases appended to vary the templates
+SUFFIXES = {
+    "hi": ["", "कृपया जल्दी कार्रवाई करें", "बाज़ार के पास", "स्कूल के सामने", "कई दिनों से"],
+    "mr": ["", "कृपया लवकर कारवाई करा", "बाजाराजवळ", "शाळेसमोर", "बऱ्याच दिवसांपासून"],
+    "bn": ["", "দয়া করে দ্রুত ব্যবস্থা নিন", "বাজারের কাছে", "স্কুলের সামনে", "অনেক দিন ধরে"],
+    "ta": ["", "தயவுசெய்து விரைவில் நடவடிக்கை எடுக்கவும்", "சந்தை அருகே", "பள்ளி முன்பு", "பல நாட்களாக"],
+    "te": ["", "దయచేసి త్వరగా చర్య తీసుకోండి", "మార్కెట్ దగ్గర", "స్కూల్ ఎదురుగా", "చాలా రోజులుగా"],
+    "hi-Latn": ["", "jaldi action lijiye", "market ke paas", "school ke saamne", "kai dino se"],
+    "en": ["", "please take action soon", "near the market", "in front of the school", "for many days"]
+}
+
+
+def generate_multilingual_rows(samples_per_language: int, seed: int = 42, english_texts=None, pools=None) -> list:
+    """
+    Sample (text, category, language) rows from the regional templates
+    
+    english_texts: optional list of (text, category) pairs to include as "en"
+    pools: optional {language: [(text, category), ...]} to sample from instead
+    """
+    rng = random.Random(seed)
+    if pools is None:
+        pools = template_pools()
+    else:
+        pools = dict(pools)
+    if english_texts:
+        pools["en"] = list(english_texts)
+    
+    rows = []
+    for language, pool in pools.items():
+        for _ in range(samples_per_language):
+            text, category = rng.choice(pool)
+            suffix = rng.choice(SUFFIXES[language])
+            rows.append({
+                "text": f"{text} {suffix}".strip(),
+                "category": category,
+                "language": language
+            })
+    rng.shuffle(rows)
+    return rows
+
+
+def template_pools(holdout=None) -> dict:
+    """
+    {language: [(text, category), ...]} over all templates
+    
+    holdout: optional {(language, category): template index} to leave out
+    """
+    holdout = holdout or {}
+    return {
+        language: [
+            (text, category)
+            for category, texts in by_category.items()
+            for index, text in enumerate(texts)
+            if holdout.get((language, category)) != index
+        ]
+        for language, by_category in MULTILINGUAL_DATA.items()
+    }
+
+
+def generate_multilingual_split(train_per_language: int, test_per_language: int, seed: int = 42,
+                                english_train=None, english_test=None) -> tuple:
+    """
+    Train and test rows with one held-out template per language and category
+    
+    Returns:
+        tuple: (train_rows, test_rows)
+    """
+    rng = random.Random(seed)
+    holdout = {
+        (language, category): rng.randrange(len(texts))
+        for language, by_category in MULTILINGUAL_DATA.items()
+        for category, texts in by_category.items()
+    }
+    train_pools = template_pools(holdout)
+    test_pools = {
+        language: [
+            (MULTILINGUAL_DATA[language][category][index], category)
+            for (pool_language, category), index in holdout.items()
+            if pool_language == language
+        ]
+        for language in MULTILINGUAL_DATA
+    }
+    train_rows = generate_multilingual_rows(train_per_language, seed, english_train, pools=train_pools)
+    test_rows = generate_multilingual_rows(test_per_language, seed + 1, english_test, pools=test_pools)
+    return train_rows, test_rows
+
+
+if __name__ == "__main__":
+    english_train = pd.read_csv("data/complaints_train.csv")
+    english_test = pd.read_csv("data/complaints_test.csv")
+    train_rows, test_rows = generate_multilingual_split(
+        200, 50,
+        english_train=list(zip(english_train["text"], english_train["category"])),
+        english_test=list(zip(english_test["text"], english_test["category"]))
+    )
+    
+    os.makedirs("data", exist_ok=True)
+    train_df = pd.DataFrame(train_rows)
+    test_df = pd.DataFrame(test_rows)
+    train_df.to_csv("data/complaints_multilingual_train.csv", index=False)
+    test_df.to_csv("data/complaints_multilingual_test.csv", index=False)
+    print(f"✅ Generated {len(train_df)} training and {len(test_df)} test multilingual samples")
+    print(f"📊 Language distribution:\n{train_df['language'].value_counts()}")
@@ -0,0 +1,35 @@
+import joblib
+import numpy as np
+
+from app.ai.artifact import CompactModel
+from app.ai.engine import AITriageEngine
+from app.ai.preprocess import preprocess_text
+
+MODEL_DIR = "app/ai/models"
+TEXTS = [
+    "Garbage not collected for 5 days near school gate smells terrible",
+    "qwzx vbnm",
+    "Road full of dangerous potholes causing accidents",
+    "qwzx plkj",  # No vocabulary hits in the last row
+]
+
+
+def test_compact_transform_with_out_of_vocabulary_last_row():
+    vectorizer = joblib.load(f"{MODEL_DIR}/tfidf_vectorizer.joblib")
+    compact = CompactModel.load(f"{MODEL_DIR}/compact")
+    texts = [preprocess_text(text) for text in TEXTS]
+
+    X = compact.transform_texts(texts)
+    terms = sorted(vectorizer.vocabulary_)
+    expected = vectorizer.transform(texts)[:, [vectorizer.vocabulary_[term] for term in terms]]
+    assert np.abs(X.toarray() - expected.toarray()).max() < 1e-6
+    assert X[3].nnz == 0
+
+
+def test_process_batch_with_out_of_vocabulary_last_text():
+    engine = AITriageEngine(MODEL_DIR, model_format="compact")
+    batch = engine.process_batch(TEXTS, ["en"] * len(TEXTS))
+    for text, result in zip(TEXTS, batch):
+        single = engine.process(text, "en")
+        assert result["category"] == single["category"]
+        assert abs(result["category_confidence"] - single["category_confidence"]) < 1e-6
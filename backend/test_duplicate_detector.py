@@ -0,0 +1,25 @@
+from app.ai.analysis import AnalyzedText
+from app.services.dedup_signatures import compute_signatures
+from app.services.duplicate_detector import DuplicateDetector
+
+
+def stored(complaint_id, text):
+    return {
+        "complaint_id": complaint_id, "title": text, "description": "", "category": "Sanitation",
+        "status": "TRIAGED", "dedup": compute_signatures(AnalyzedText(text)),
+    }
+
+
+def test_reordered_words_are_not_scored_as_identical():
+    detector = DuplicateDetector()
+    new = {"title": "garbage near school gate not collected", "description": "", "category": "Sanitation"}
+    existing = [
+        stored("same", "garbage near school gate not collected"),
+        stored("reordered", "collected not gate school near garbage"),
+    ]
+    scores = {
+        d["complaint_id"]: d["similarity_score"]
+        for d in detector.find_duplicates(new, existing, check_location=False)
+    }
+    assert scores["same"] == 1.0
+    assert scores.get("reordered", 0.0) < 1.0
@@ -0,0 +1,24 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from app.ai.engine import AITriageEngine
+
+TEXTS = [
+    "Garbage not collected for 5 days near school gate smells terrible",
+    "Road full of dangerous potholes causing accidents",
+    "Birth certificate application pending for 3 months",
+]
+
+
+def test_warmup_is_not_counted_in_cascade_stats():
+    engine = AITriageEngine()
+    engine.warmup()
+    assert engine.cascade_stats()["total"] == 0
+
+
+def test_cascade_counts_from_concurrent_threads():
+    engine = AITriageEngine()
+    texts = TEXTS * 200
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda text: engine.process(text, "en"), texts))
+    engine.process_batch(TEXTS, ["en"] * len(TEXTS))
+    assert engine.cascade_stats()["total"] == len(texts) + len(TEXTS)
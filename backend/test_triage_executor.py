@@ -0,0 +1,63 @@
+import asyncio
+import time
+
+from app.ai import lang
+from app.ai.engine import AITriageEngine, swap_ai_engine
+from app.ai.lang import StubTranslationBackend, TranslationService
+from app.services.triage_executor import TriageExecutor
+
+
+def test_thread_executor_starts_and_triages_off_loop():
+    swap_ai_engine(AITriageEngine())
+    executor = TriageExecutor(mode="thread", max_workers=2)
+
+    async def run():
+        await executor.start()
+        try:
+            assert executor._pool is not None
+            return await executor.process("Garbage not collected for 5 days near school gate", "en")
+        finally:
+            executor.shutdown()
+
+    result = asyncio.run(run())
+    assert result["category"] == "Sanitation"
+
+
+def test_translation_is_awaited_without_blocking_the_event_loop():
+    text = "பள்ளி வாசல் அருகே ஐந்து நாட்களாக குப்பை அள்ளப்படவில்லை"
+    engine = AITriageEngine()
+    engine.multilingual_model = None  # Force the translation tier
+    swap_ai_engine(engine)
+    lang.translation_service = TranslationService(
+        StubTranslationBackend({text: "Garbage not collected for 5 days near school gate"}, delay=0.3),
+        timeout=2.0
+    )
+
+    async def run(mode):
+        executor = TriageExecutor(mode=mode, max_workers=1)
+        await executor.start()
+        gaps = []
+
+        async def tick():
+            last = time.perf_counter()
+            while True:
+                await asyncio.sleep(0.01)
+                now = time.perf_counter()
+                gaps.append(now - last)
+                last = now
+
+        ticker = asyncio.create_task(tick())
+        try:
+            result = await executor.process(text, "auto")
+        finally:
+            ticker.cancel()
+            executor.shutdown()
+        return result, max(gaps)
+
+    try:
+        for mode in ("inline", "thread"):
+            result, longest_gap = asyncio.run(run(mode))
+            assert result["category"] == "Sanitation"
+            assert longest_gap < 0.2
+    finally:
+        lang.translation_service = None